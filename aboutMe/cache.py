@@ -0,0 +1,11 @@
+from django.conf import settings
+
+from core.cache import CachedPayload, SingletonCache
+
+# Yagona AboutMe qatori (pk=1) — worker xotirasida, o'qishda bazaga tushmaydi
+about_me = SingletonCache("aboutMe.AboutMe")
+
+# /api/about-me/profile/ — tayyor JSON baytlari; aboutMe.signals yangilaydi
+profile_payload = CachedPayload(
+    "about-profile", timeout=getattr(settings, "PROFILE_CACHE_TIMEOUT", 300)
+)
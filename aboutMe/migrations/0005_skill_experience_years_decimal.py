@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Model'dagi DecimalField'ga hech qachon migratsiya yozilmagan edi (ustun
+    # hali smallint) — image_variants migratsiyasidan alohida
+
+    dependencies = [
+        ("aboutMe", "0004_image_variants"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="skill",
+            name="experience_years",
+            field=models.DecimalField(decimal_places=1, default=0.0, max_digits=4),
+        ),
+    ]
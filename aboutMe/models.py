@@ -23,6 +23,7 @@ class AboutMe(models.Model):
     profile_image = models.ImageField(
         upload_to=profile_image_upload_path, blank=True, null=True
     )
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "About Me"
@@ -39,6 +40,8 @@ class Skill(models.Model):
 
     name = models.CharField(max_length=100)
     image = models.ImageField(upload_to=skill_image_upload_path, blank=True, null=True)
+    # Fon pipeline yaratgan WebP/AVIF nusxalar (qarang: core.images)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     experience_years = models.DecimalField(
         max_digits=4, decimal_places=1,
         default=0.0,
@@ -110,6 +113,8 @@ class Certificate(models.Model):
         null=True,
         help_text="Upload certificate image (optional)",
     )
+    # Fon pipeline yaratgan WebP/AVIF nusxalar (qarang: core.images)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     link = models.URLField(
         blank=True, null=True, help_text="Optional link to certificate or achievement"
     )
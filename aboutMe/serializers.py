@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from core.serializers import SrcsetField
 from .models import AboutMe, Skill, Experience, Certificate
 
 
@@ -35,10 +36,18 @@ class AboutMeSerializer(serializers.ModelSerializer):
 
 class SkillSerializer(serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField(read_only=True)
+    image_srcset = SrcsetField(source="image_variants")
 
     class Meta:
         model = Skill
-        fields = ("id", "name", "image_url", "experience_years", "proficiency")
+        fields = (
+            "id",
+            "name",
+            "image_url",
+            "image_srcset",
+            "experience_years",
+            "proficiency",
+        )
         read_only_fields = ("id",)
 
     def get_image_url(self, obj):
@@ -78,6 +87,7 @@ class ExperienceSerializer(serializers.ModelSerializer):
 
 class CertificateSerializer(serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField(read_only=True)
+    image_srcset = SrcsetField(source="image_variants")
 
     class Meta:
         model = Certificate
@@ -86,6 +96,7 @@ class CertificateSerializer(serializers.ModelSerializer):
             "title",
             "description",
             "image_url",
+            "image_srcset",
             "link",
             "obtained_year",
         )
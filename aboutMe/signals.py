@@ -0,0 +1,35 @@
+from django.apps import apps
+from django.db.models.signals import post_delete, post_save
+
+from core.cache import content_updated
+from .cache import about_me, profile_payload
+
+PROFILE_MODELS = (
+    "aboutMe.AboutMe",
+    "aboutMe.Skill",
+    "aboutMe.Experience",
+    "aboutMe.Certificate",
+)
+
+
+def connect_signals():
+    about_me.connect()
+
+    for label in PROFILE_MODELS:
+        model = apps.get_model(label)
+        post_save.connect(
+            profile_payload.invalidate,
+            sender=model,
+            dispatch_uid=f"profile-save-{label}",
+        )
+        post_delete.connect(
+            profile_payload.invalidate,
+            sender=model,
+            dispatch_uid=f"profile-delete-{label}",
+        )
+        # Rasm variantlari (core.images) update() bilan yoziladi
+        content_updated.connect(
+            profile_payload.invalidate,
+            sender=model,
+            dispatch_uid=f"profile-content-{label}",
+        )
@@ -1 +1,61 @@
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+
+from .models import AboutMe, Certificate, Experience, Skill
+
+
+class ProfileTests(TestCase):
+    url = reverse("aboutMe:profile")
+
+    def setUp(self):
+        cache.clear()
+        AboutMe.objects.create(intro_text="Hello")
+        Skill.objects.create(name="Python", proficiency=90)
+        Skill.objects.create(name="Go", proficiency=60)
+        Experience.objects.create(title="Dev", company="Acme", start_year=2020)
+        Certificate.objects.create(title="Cert", obtained_year=2021)
+
+    def fetch(self, **headers):
+        return self.client.get(self.url, **headers)
+
+    def test_bundles_all_sections_in_endpoint_order(self):
+        data = self.fetch().json()
+        self.assertEqual(data["about_me"]["intro_text"], "Hello")
+        self.assertEqual([skill["name"] for skill in data["skills"]], ["Python", "Go"])
+        for name in ("skills", "experiences", "certificates"):
+            self.assertEqual(
+                data[name], self.client.get(reverse(f"aboutMe:{name}-list")).json()
+            )
+
+    def test_warm_request_costs_no_queries(self):
+        self.fetch()
+        with self.assertNumQueries(0):
+            response = self.fetch()
+        self.assertEqual(response.status_code, 200)
+
+    def test_change_rebuilds_payload_and_etag(self):
+        etag = self.fetch()["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            Skill.objects.create(name="Rust", proficiency=70)
+        response = self.fetch()
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertIn("Rust", [skill["name"] for skill in response.json()["skills"]])
+
+    def test_matching_etag_is_304(self):
+        etag = self.fetch()["ETag"]
+        self.assertEqual(self.fetch(HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+
+class DetailConditionalTests(TestCase):
+    def test_edit_invalidates_detail_etag(self):
+        experience = Experience.objects.create(title="Dev", company="Acme", start_year=2020)
+        url = reverse("aboutMe:experience-detail", args=[experience.id])
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        experience.company = "Globex"
+        experience.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["company"], "Globex")
@@ -1,6 +1,7 @@
 from django.urls import path
 from .views import (
     AboutMeView,
+    ProfileView,
     SkillListView,
     ExperienceListView,
     ExperienceDetailView,
@@ -12,6 +13,7 @@ app_name = "aboutMe"
 
 urlpatterns = [
     path("", AboutMeView.as_view(), name="about-me"),
+    path("profile/", ProfileView.as_view(), name="profile"),
     path("skills/", SkillListView.as_view(), name="skills-list"),
     path("experiences/", ExperienceListView.as_view(), name="experiences-list"),
     path(
@@ -1,4 +1,17 @@
+import hashlib
+
+from django.http import HttpResponse
 from rest_framework import generics, permissions
+from rest_framework.renderers import JSONRenderer
+from rest_framework.views import APIView
+
+from core.conditional import (
+    conditional_get,
+    conditional_response,
+    list_validators,
+    object_validators,
+)
+from .cache import about_me, profile_payload
 from .models import AboutMe, Skill, Experience, Certificate
 from .serializers import (
     AboutMeSerializer,
@@ -9,12 +22,25 @@ from .serializers import (
 
 
 class AboutMeView(generics.RetrieveAPIView):
+    """
+    Singleton worker xotirasidan: GET bazaga umuman tushmaydi. Qator hali
+    yaratilmagan bo'lsa saqlanmagan bo'sh obyekt ko'rsatiladi — o'qish
+    yo'lida INSERT yo'q, qatorni admin yaratadi.
+    """
+
     serializer_class = AboutMeSerializer
     permission_classes = [permissions.AllowAny]
 
     def get_object(self):
-        obj, created = AboutMe.objects.get_or_create(pk=1)
-        return obj
+        return about_me.get() or AboutMe(pk=1)
+
+    def get_validators(self, request, *args, **kwargs):
+        obj = self.get_object()
+        return (obj.pk, obj.updated_at), obj.updated_at
+
+    @conditional_get
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
 
 
 class SkillListView(generics.ListAPIView):
@@ -23,12 +49,26 @@ class SkillListView(generics.ListAPIView):
     serializer_class = SkillSerializer
     permission_classes = [permissions.AllowAny]
 
+    def get_validators(self, request, *args, **kwargs):
+        return list_validators(self.get_queryset())
+
+    @conditional_get
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
 
 class ExperienceListView(generics.ListAPIView):
     queryset = Experience.objects.all().order_by("-start_year", "-end_year")
     serializer_class = ExperienceSerializer
     permission_classes = [permissions.AllowAny]
 
+    def get_validators(self, request, *args, **kwargs):
+        return list_validators(self.get_queryset())
+
+    @conditional_get
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
 
 class ExperienceDetailView(generics.RetrieveAPIView):
     queryset = Experience.objects.all()
@@ -36,15 +76,81 @@ class ExperienceDetailView(generics.RetrieveAPIView):
     permission_classes = [permissions.AllowAny]
     lookup_field = "id"
 
+    def get_validators(self, request, *args, **kwargs):
+        return object_validators(self.get_queryset(), id=kwargs["id"])
+
+    @conditional_get
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
 
 class CertificateListView(generics.ListAPIView):
     queryset = Certificate.objects.all().order_by("-obtained_year", "title")
     serializer_class = CertificateSerializer
     permission_classes = [permissions.AllowAny]
 
+    def get_validators(self, request, *args, **kwargs):
+        return list_validators(self.get_queryset())
+
+    @conditional_get
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
 
 class CertificateDetailView(generics.RetrieveAPIView):
     queryset = Certificate.objects.all()
     serializer_class = CertificateSerializer
     permission_classes = [permissions.AllowAny]
     lookup_field = "id"
+
+    def get_validators(self, request, *args, **kwargs):
+        return object_validators(self.get_queryset(), id=kwargs["id"])
+
+    @conditional_get
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+
+class ProfileView(APIView):
+    """
+    About sahifasi uchun hammasi bitta so'rovda: about-me, skills,
+    experiences, certificates. Javob tayyor JSON baytlari sifatida keshda
+    turadi — issiq so'rovda na baza, na serializer, na renderer ishlaydi.
+    Tartib alohida endpointlar bilan bir xil (ularning queryset'lari).
+    """
+
+    permission_classes = [permissions.AllowAny]
+    sections = (
+        ("skills", SkillListView),
+        ("experiences", ExperienceListView),
+        ("certificates", CertificateListView),
+    )
+
+    def get(self, request, *args, **kwargs):
+        payload = profile_payload.get_or_build(
+            lambda: self.build_payload(request), request.scheme, request.get_host()
+        )
+        return conditional_response(
+            request,
+            payload["etag"],
+            payload["last_modified"],
+            lambda: HttpResponse(payload["body"], content_type="application/json"),
+            variant="application/json",
+        )
+
+    def build_payload(self, request):
+        context = {"request": request}
+        profile = about_me.get() or AboutMe(pk=1)
+        data = {"about_me": AboutMeSerializer(profile, context=context).data}
+        timestamps = [profile.updated_at]
+        for name, view in self.sections:
+            items = list(view.queryset.all())
+            data[name] = view.serializer_class(items, many=True, context=context).data
+            timestamps.extend(item.updated_at for item in items)
+
+        body = JSONRenderer().render(data)
+        return {
+            "body": body,
+            "etag": hashlib.md5(body, usedforsecurity=False).hexdigest(),
+            "last_modified": max(filter(None, timestamps), default=None),
+        }
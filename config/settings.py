@@ -22,11 +22,14 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # Local apps
+    "core",
     "home",
     "posts",
     "aboutMe",
     "projects",
+    "tags",
     # Third-party apps
     "rest_framework",
     "rest_framework_simplejwt",
@@ -77,8 +80,18 @@ DATABASES = {
         "PASSWORD": os.getenv("POSTGRES_PASSWORD"),
         "HOST": os.getenv("POSTGRES_HOST"),
         "PORT": os.getenv("POSTGRES_PORT"),
+        # Sync worker'lar connection'ni so'rovlar orasida qayta ishlatadi
+        "CONN_MAX_AGE": int(os.getenv("CONN_MAX_AGE", 60)),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
+
+# run.sh'dagi server rejimi: wsgi (sync gunicorn) yoki asgi (uvicorn worker)
+SERVER_MODE = os.getenv("SERVER_MODE", "wsgi")
+if SERVER_MODE == "asgi":
+    # ASGI'da sync kod har so'rovda boshqa thread'da bajariladi: persistent
+    # connection'lar yig'ilib qoladi, shuning uchun o'rniga psycopg pool
+    DATABASES["default"].update(CONN_MAX_AGE=0, OPTIONS={"pool": True})
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -98,8 +111,49 @@ REST_FRAMEWORK = {
         "rest_framework.authentication.SessionAuthentication",
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ],
+    # core.throttling.TokenBucketThrottle: "N/period" — N tagacha burst,
+    # period davomida N token qayta to'ladi (IP bo'yicha)
+    "DEFAULT_THROTTLE_RATES": {
+        "likes": os.getenv("THROTTLE_LIKES", "30/min"),
+        "comments": os.getenv("THROTTLE_COMMENTS", "5/min"),
+    },
 }
 
+# Django oldidagi ishonchli proxy'lar soni (core.utils.get_client_ip): mijoz
+# IP'si `X-Forwarded-For` ning o'ngdan shu raqamli qiymati. Default 0 — faqat
+# REMOTE_ADDR: docker-compose web:8080 ni to'g'ridan-to'g'ri ochadi va sarlavhani
+# mijoz o'zi yozadi. nginx ortida ishlatilganda 1 qilib qo'yiladi.
+TRUSTED_PROXY_COUNT = int(os.getenv("TRUSTED_PROXY_COUNT", 0))
+
+# Bir nechta worker/server uchun umumiy bucket'lar: CACHES dagi alias
+# (masalan Redis). Berilmasa bucket'lar jarayon ichida saqlanadi.
+THROTTLE_CACHE_ALIAS = os.getenv("THROTTLE_CACHE_ALIAS") or None
+
+# Umumiy kesh: run.sh bir nechta gunicorn worker ishga tushiradi, kesh
+# versiyalari (core.cache) hammasiga ko'rinishi uchun REDIS_URL beriladi.
+# Berilmasa har bir jarayonning o'z LocMem keshi — yozuv faqat o'sha worker
+# keshini yangilaydi.
+REDIS_URL = os.getenv("REDIS_URL", "")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+
+# Tayyor javoblar keshi (core.cache.CachedPayload, SingletonCache). Versiya
+# kalitlari CACHE_VERSION_TIMEOUT soniyada eskiradi: LocMem bo'lsa boshqa
+# worker'lar eski payload/singleton qatorni shundan ortiq bermaydi.
+CONTENT_CACHE_ALIAS = os.getenv("CONTENT_CACHE_ALIAS", "default")
+CACHE_VERSION_TIMEOUT = int(os.getenv("CACHE_VERSION_TIMEOUT", 60))
+HOME_CACHE_TIMEOUT = int(os.getenv("HOME_CACHE_TIMEOUT", 300))
+PROFILE_CACHE_TIMEOUT = int(os.getenv("PROFILE_CACHE_TIMEOUT", 300))
+
 # Simple JWT settings
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=30),
@@ -131,7 +185,47 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
+# Media fayllarni kim uzatadi: "nginx" — X-Accel-Redirect (MEDIA_ACCEL_PREFIX
+# `internal` location'i MEDIA_ROOT ga alias), "sendfile" — X-Sendfile
+# (Apache/lighttpd), bo'sh — Django o'zi (Range bilan) oqim qiladi
+MEDIA_ACCEL = os.getenv("MEDIA_ACCEL", "")
+MEDIA_ACCEL_PREFIX = os.getenv("MEDIA_ACCEL_PREFIX", "/protected-media/")
+MEDIA_CACHE_MAX_AGE = int(os.getenv("MEDIA_CACHE_MAX_AGE", 30 * 24 * 3600))
 
 
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+
+# Fon vazifalari (core.tasks): jarayon ichidagi ThreadPoolExecutor
+BACKGROUND_TASK_WORKERS = int(os.getenv("BACKGROUND_TASK_WORKERS", 2))
+BACKGROUND_TASKS_EAGER = False
+
+# Rasm variantlari (core.images): kengliklar px'da, AVIF bo'lmasa o'tkazib yuboriladi
+IMAGE_VARIANT_WIDTHS = (320, 640, 1280)
+IMAGE_VARIANT_FORMATS = ("avif", "webp")
+
+# Like bufer (core.likes): shuncha niyat yig'ilganda yoki shuncha soniyadan
+# keyin bazaga flush qilinadi. 0 — buferlamasdan darhol yozish. Bufer har
+# bir worker jarayonining xotirasida: bir IP'ning turli worker'larga tushgan
+# bosishlari flush'gacha bir-birini ko'rmaydi, SIGKILL'da esa oxirgi interval
+# yo'qoladi. Hisoblagichlar yozilgan qatorlardan yuritiladi va to'g'ri qoladi.
+LIKE_BUFFER_SIZE = int(os.getenv("LIKE_BUFFER_SIZE", 100))
+LIKE_BUFFER_INTERVAL = float(os.getenv("LIKE_BUFFER_INTERVAL", 2.0))
+
+# O'xshash post'lar (posts.related): detail javobida nechta, vaqt yaqinligi
+# og'irligining yarim yemirilish davri (kun)
+RELATED_POSTS_LIMIT = 4
+RELATED_POSTS_HALF_LIFE_DAYS = 180
+
+# O'xshash kontent (core.similarity): TF-IDF bo'yicha nechta qo'shni va
+# ulardan eng past cosine ball
+SIMILAR_CONTENT_LIMIT = 5
+SIMILAR_CONTENT_MIN_SCORE = 0.05
+
+# Trending (core.trending): like/comment vazni shuncha soatda ikki baravar kamayadi
+TRENDING_HALF_LIFE_HOURS = 48
+TRENDING_WEIGHTS = {"like": 1.0, "comment": 2.0}
+# Shuncha soniyadan yangi hodisalar keyingi ishga tushirishda qo'shiladi —
+# kech commit bo'lgan like/comment'lar tushib qolmasin
+TRENDING_SETTLE_SECONDS = 60
@@ -1,11 +1,13 @@
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from drf_yasg import openapi
 from drf_yasg.views import get_schema_view
 from rest_framework import permissions
 
+from core.media import serve_media
+
 schema_view = get_schema_view(
     openapi.Info(
         title="JasurDev API",
@@ -24,6 +26,10 @@ urlpatterns = [
     path("api/about-me/", include("aboutMe.urls", namespace="aboutMe")),
     path("api/posts/", include("posts.urls", namespace="posts")),
     path("api/projects/", include("projects.urls", namespace="projects")),
+    path("api/tags/", include("tags.urls", namespace="tags")),
+    path("api/", include("core.urls", namespace="core")),
+    # Productionda ham: Range/304 va ixtiyoriy X-Accel-Redirect (core.media)
+    re_path(rf"^{settings.MEDIA_URL.lstrip('/')}(?P<path>.*)$", serve_media),
 
     path(
         "swagger/",
@@ -49,5 +55,4 @@ urlpatterns = [
 ]
 
 if settings.DEBUG:
-    urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file
+    urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
\ No newline at end of file
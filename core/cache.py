@@ -0,0 +1,156 @@
+import threading
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal
+
+# `update()` / `bulk_create` bilan, model signal'larisiz yozilgan o'zgarishlar
+# (hisoblagichlar, rasm variantlari, import) uchun: `sender` — model klassi
+content_updated = Signal()
+
+
+def notify_content_updated(model):
+    content_updated.send(sender=model)
+
+
+def get_cache():
+    return caches[getattr(settings, "CONTENT_CACHE_ALIAS", "default")]
+
+
+class CacheVersion:
+    """
+    Cache'dagi versiya raqami: o'zgarishda almashtiriladi, o'quvchilar uni
+    o'zidagi nusxa bilan solishtiradi. Almashtirish commit'dan keyin —
+    aks holda parallel so'rov commit'gacha eski ma'lumotni yangi versiya
+    ostida saqlab qo'yishi mumkin.
+
+    Kalit `CACHE_VERSION_TIMEOUT` soniyada eskiradi: cache worker'lar
+    o'rtasida umumiy bo'lmasa (LocMem), boshqa worker'lar o'zgarishni
+    shu vaqtdan kechiktirmay ko'radi.
+    """
+
+    def __init__(self, name):
+        self.key = f"{name}:version"
+
+    @property
+    def timeout(self):
+        return getattr(settings, "CACHE_VERSION_TIMEOUT", 60)
+
+    def get(self):
+        cache = get_cache()
+        version = cache.get(self.key)
+        if version is None:
+            # Muddati tugagan yoki evict bo'lgan bo'lsa ham eski raqamlar
+            # qayta ishlatilmaydi
+            cache.add(self.key, time.time_ns(), self.timeout)
+            version = cache.get(self.key)
+        return version
+
+    async def aget(self):
+        cache = get_cache()
+        version = await cache.aget(self.key)
+        if version is None:
+            await cache.aadd(self.key, time.time_ns(), self.timeout)
+            version = await cache.aget(self.key)
+        return version
+
+    def bump(self, *args, **kwargs):
+        """Signal handler sifatida ham ishlatiladi — argumentlar e'tiborsiz."""
+        if kwargs.get("raw"):
+            return
+        transaction.on_commit(self._bump)
+
+    def _bump(self):
+        cache = get_cache()
+        try:
+            cache.incr(self.key)
+        except ValueError:
+            cache.set(self.key, time.time_ns(), self.timeout)
+
+
+class CachedPayload:
+    """
+    Tayyor (serializatsiya qilingan) javobni Django cache'da saqlaydi.
+
+    Kalitlar versiyali: `invalidate()` faqat versiya raqamini almashtiradi,
+    eski yozuvlar TTL bilan o'zi chiqib ketadi — host va h.k. bo'yicha
+    bo'lingan kalitlarni bittalab o'chirish shart emas.
+    """
+
+    def __init__(self, name, timeout=300):
+        self.name = name
+        self.timeout = timeout
+        self.version = CacheVersion(name)
+        self.invalidate = self.version.bump
+
+    def get_or_build(self, build, *parts):
+        cache = get_cache()
+        key = ":".join([self.name, str(self.version.get()), *map(str, parts)])
+        value = cache.get(key)
+        if value is None:
+            value = build()
+            cache.set(key, value, self.timeout)
+        return value
+
+    async def aget_or_build(self, build, *parts):
+        """Async view'lar uchun: `build` — coroutine funksiya."""
+        cache = get_cache()
+        key = ":".join([self.name, str(await self.version.aget()), *map(str, parts)])
+        value = await cache.aget(key)
+        if value is None:
+            value = await build()
+            await cache.aset(key, value, self.timeout)
+        return value
+
+
+class SingletonCache:
+    """
+    Bitta qatorli modellar (AboutMe, Home) uchun worker xotirasidagi nusxa.
+
+    O'qish bazaga tushmaydi va hech qachon yozmaydi: har safar faqat
+    cache'dagi versiya solishtiriladi, qator faqat versiya almashganda
+    qayta o'qiladi. Qator yo'q bo'lsa `None`. Saqlash/o'chirish versiyani
+    almashtiradi — `connect()` `ready()` da chaqiriladi. Umumiy cache'da
+    (REDIS_URL) buni hamma worker darhol ko'radi, LocMem'da esa boshqa
+    worker'lar versiya kaliti eskirganda (`CACHE_VERSION_TIMEOUT`) qayta o'qiydi.
+    """
+
+    def __init__(self, label):
+        self.label = label
+        self.version = CacheVersion(f"singleton:{label}")
+        self._lock = threading.Lock()
+        self._loaded_version = None
+        self._instance = None
+
+    @property
+    def model(self):
+        return apps.get_model(self.label)
+
+    def get(self):
+        version = self.version.get()
+        with self._lock:
+            if self._loaded_version != version:
+                self._instance = self.model._default_manager.order_by("pk").first()
+                self._loaded_version = version
+            return self._instance
+
+    def invalidate(self, *args, **kwargs):
+        with self._lock:
+            self._loaded_version = None
+        self.version.bump(*args, **kwargs)
+
+    def connect(self):
+        model = self.model
+        uid = f"singleton-{self.label}"
+        post_save.connect(self.invalidate, sender=model, dispatch_uid=f"{uid}-save")
+        post_delete.connect(
+            self.invalidate, sender=model, dispatch_uid=f"{uid}-delete"
+        )
+        # core.images variantlarni update() bilan yozadi
+        content_updated.connect(
+            self.invalidate, sender=model, dispatch_uid=f"{uid}-content"
+        )
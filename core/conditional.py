@@ -0,0 +1,88 @@
+import functools
+import hashlib
+
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db.models import Count, Max, Sum
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+
+def list_validators(queryset, *sum_fields):
+    """
+    List endpointlari uchun arzon validatorlar: bitta aggregate so'rov
+    (max `updated_at` + count). `updated_at` ni o'zgartirmaydigan ustunlar
+    (masalan denormalized hisoblagichlar) uchun `sum_fields` beriladi.
+    """
+    aggregates = {"last_modified": Max("updated_at"), "total": Count("pk")}
+    for field in sum_fields:
+        aggregates[f"{field}_sum"] = Sum(field)
+    row = queryset.order_by().aggregate(**aggregates)
+    return row, row["last_modified"]
+
+
+def object_validators(queryset, *extra_fields, **lookup):
+    """Bitta obyekt uchun validatorlar: faqat kerakli ustunlar o'qiladi."""
+    row = queryset.filter(**lookup).values("updated_at", *extra_fields).first()
+    if row is None:
+        return None, None
+    return row, row["updated_at"]
+
+
+def tag_names(field="tags"):
+    """Tag nomlari (tartiblangan) — tag qayta nomlansa validator o'zgaradi."""
+    return ArrayAgg(
+        f"{field}__name", distinct=True, ordering=f"{field}__name", default=[]
+    )
+
+
+def conditional_response(request, etag_source, last_modified, render, variant=None):
+    """
+    `render()` ni faqat mijozdagi nusxa eskirgan bo'lsa chaqiradi, aks holda
+    304. `variant` — bir xil ma'lumotning turli ko'rinishlari (media type).
+    """
+    digest = hashlib.md5(
+        repr((etag_source, variant)).encode(), usedforsecurity=False
+    ).hexdigest()
+    etag = quote_etag(digest)
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is None:
+        response = render()
+
+    if response.status_code in (200, 304):
+        response["ETag"] = etag
+        if timestamp is not None:
+            response["Last-Modified"] = http_date(timestamp)
+        # Last-Modified bo'lsa brauzer heuristik kesh qilmasin: har safar
+        # qayta tekshirsin, javob o'zgarmagan bo'lsa 304 oladi
+        patch_cache_control(response, no_cache=True)
+    return response
+
+
+def conditional_get(view_method):
+    """
+    DRF view'ning `get` metodini ETag / Last-Modified bilan o'raydi.
+
+    View `get_validators(request, *args, **kwargs)` ni amalga oshiradi va
+    `(etag_source, last_modified)` qaytaradi. Mijozdagi nusxa hali dolzarb
+    bo'lsa, `view_method` chaqirilmaydi — serializatsiyasiz 304 qaytadi.
+    """
+
+    @functools.wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        etag_source, last_modified = self.get_validators(request, *args, **kwargs)
+        if etag_source is None and last_modified is None:
+            # Obyekt topilmadi va h.k. — odatiy yo'l (masalan 404)
+            return view_method(self, request, *args, **kwargs)
+
+        # Bir xil ma'lumot JSON va browsable API da turlicha ko'rinadi
+        return conditional_response(
+            request,
+            etag_source,
+            last_modified,
+            lambda: view_method(self, request, *args, **kwargs),
+            variant=request.accepted_media_type,
+        )
+
+    return wrapper
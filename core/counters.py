@@ -0,0 +1,47 @@
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_subquery(model, fk_name):
+    """
+    `model` dagi `fk_name` tashqi qatorga (`OuterRef("pk")`) qarab turgan
+    qatorlar soni; bo'lmasa 0. Hisoblagichlarni qayta hisoblash uchun
+    `update()` / `annotate()` ichida ishlatiladi.
+    """
+    return Coalesce(
+        Subquery(
+            model.objects.filter(**{fk_name: OuterRef("pk")})
+            .order_by()
+            .values(fk_name)
+            .annotate(total=Count("pk"))
+            .values("total")
+        ),
+        0,
+    )
+
+
+class RecountOnDeleteAdminMixin:
+    """
+    Like/comment admin'lari uchun: o'chirishning istalgan yo'li — Django'ning
+    `delete_selected` action'i, change sahifasidagi "Delete" yoki custom
+    action'lar — ota obyektning `likes_count`/`comments_count` ini qayta
+    hisoblaydi. `parent_field` — ota obyektga FK nomi.
+    """
+
+    parent_field = None
+
+    def delete_model(self, request, obj):
+        with transaction.atomic():
+            super().delete_model(request, obj)
+            self.recount_parents({getattr(obj, f"{self.parent_field}_id")})
+
+    def delete_queryset(self, request, queryset):
+        parent_ids = set(queryset.values_list(f"{self.parent_field}_id", flat=True))
+        with transaction.atomic():
+            super().delete_queryset(request, queryset)
+            self.recount_parents(parent_ids)
+
+    def recount_parents(self, parent_ids):
+        parent = self.model._meta.get_field(self.parent_field).related_model
+        parent.objects.filter(pk__in=parent_ids).recount_counters()
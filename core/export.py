@@ -0,0 +1,73 @@
+import zlib
+from io import StringIO
+from itertools import islice
+
+from django.apps import apps
+from django.contrib.postgres.search import SearchVectorField
+from django.core import serializers
+
+# Tartib muhim: import paytida FK/M2M'lar avval yaratilgan qatorlarga ishora qiladi
+EXPORT_MODELS = (
+    "tags.Tag",
+    "posts.Post",
+    "posts.PostComment",
+    "posts.PostLike",
+    "projects.Project",
+    "projects.ProjectComment",
+    "projects.ProjectLike",
+    "aboutMe.AboutMe",
+    "aboutMe.Skill",
+    "aboutMe.Experience",
+    "aboutMe.Certificate",
+    "home.Home",
+)
+
+CHUNK_SIZE = 500
+# gzip sarlavhasi bilan deflate (zlib `wbits` = 16 + 15)
+GZIP_WBITS = 31
+
+
+def export_fields(model):
+    # search_vector trigger'dan qayta hosil bo'ladi, eksportga kirmaydi
+    return [
+        field.name
+        for field in (*model._meta.concrete_fields, *model._meta.many_to_many)
+        if not field.primary_key and not isinstance(field, SearchVectorField)
+    ]
+
+
+def iter_ndjson(labels=None, chunk_size=CHUNK_SIZE):
+    """
+    Django `jsonl` formatida (`{"model", "pk", "fields"}`) satrlar bloklarini
+    qaytaradi. Har bir model `.iterator(chunk_size)` bilan o'qiladi, M2M'lar
+    shu blok uchun prefetch qilinadi — xotira jadval hajmiga bog'liq emas.
+    """
+    serializer = serializers.get_serializer("jsonl")()
+    for label in labels or EXPORT_MODELS:
+        model = apps.get_model(label)
+        fields = export_fields(model)
+        m2m = [field.name for field in model._meta.many_to_many]
+        rows = (
+            model._default_manager.order_by("pk")
+            .prefetch_related(*m2m)
+            .iterator(chunk_size=chunk_size)
+        )
+        while batch := list(islice(rows, chunk_size)):
+            stream = StringIO()
+            serializer.serialize(batch, stream=stream, fields=fields)
+            yield stream.getvalue()
+
+
+def stream_export(labels=None, compress=False, chunk_size=CHUNK_SIZE):
+    """`iter_ndjson` ni baytlarga aylantiradi, kerak bo'lsa gzip bilan, oqim bo'yicha."""
+    chunks = (text.encode() for text in iter_ndjson(labels, chunk_size))
+    if not compress:
+        yield from chunks
+        return
+
+    compressor = zlib.compressobj(6, zlib.DEFLATED, GZIP_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,118 @@
+from datetime import datetime
+
+from django.db.models import Count, Exists, F, OuterRef
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from .tags import TAGGED_FIELDS
+
+TAG_PARAM = "tag"
+MATCH_PARAM = "match"
+YEAR_PARAM = "year"
+MAX_TAGS = 10
+
+
+def tag_relation(model):
+    """`(Tag modeli, through modeli, through'dagi obyekt FK ustuni)`."""
+    field = model._meta.get_field("tags")
+    return field.related_model, field.remote_field.through, f"{field.m2m_field_name()}_id"
+
+
+def tagged_with(queryset, tag_ids, match_all=False):
+    """Through jadvaliga `EXISTS` semi-join: istalgan (yoki `match_all` — hamma) tag."""
+    _, through, fk = tag_relation(queryset.model)
+    links = through.objects.filter(**{fk: OuterRef("pk")})
+    if not match_all:
+        return queryset.filter(Exists(links.filter(tag_id__in=tag_ids)))
+    for tag_id in tag_ids:
+        queryset = queryset.filter(Exists(links.filter(tag_id=tag_id)))
+    return queryset
+
+
+def is_filtered(request):
+    return any(request.query_params.get(name) for name in (TAG_PARAM, YEAR_PARAM))
+
+
+class TagYearFilter(BaseFilterBackend):
+    """
+    `?tag=a&tag=b` (istalgani; `?match=all` bo'lsa hammasi) va `?year=2025`.
+
+    Tag nomlari avval id'larga aylanadi, so'ng har biri through jadvaliga
+    `EXISTS` semi-join — `(tag_id, <obj>_id)` index'idan index-only scan.
+    Yil `created_at` oralig'iga aylanadi, ya'ni `(created_at, id)` index'i
+    va keyset pagination o'z holicha ishlaydi.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        names = {
+            name.strip()
+            for name in request.query_params.getlist(TAG_PARAM)
+            if name.strip()
+        }
+        if len(names) > MAX_TAGS:
+            raise ValidationError({TAG_PARAM: [f"At most {MAX_TAGS} tags allowed."]})
+        if names:
+            queryset = self.filter_tags(
+                queryset, names, request.query_params.get(MATCH_PARAM) == "all"
+            )
+
+        year = request.query_params.get(YEAR_PARAM)
+        if year:
+            queryset = self.filter_year(queryset, year)
+        return queryset
+
+    def filter_tags(self, queryset, names, match_all):
+        tag_model, _, _ = tag_relation(queryset.model)
+        tag_ids = list(
+            tag_model.objects.filter(name__in=names).values_list("pk", flat=True)
+        )
+        if not tag_ids or (match_all and len(tag_ids) < len(names)):
+            return queryset.none()
+        return tagged_with(queryset, tag_ids, match_all)
+
+    def filter_year(self, queryset, value):
+        try:
+            year = int(value)
+            start = timezone.make_aware(datetime(year, 1, 1))
+            end = timezone.make_aware(datetime(year + 1, 1, 1))
+        except (ValueError, OverflowError):
+            raise ValidationError({YEAR_PARAM: ["Expected a year, e.g. 2025."]})
+        return queryset.filter(created_at__gte=start, created_at__lt=end)
+
+
+def tag_facets(queryset, filtered=True):
+    """
+    Filtrlangan to'plamda qolgan tag'lar va ularning soni. Filtr bo'lmasa
+    Tag'dagi saqlangan hisoblagich yetarli — through jadvali umuman o'qilmaydi.
+    """
+    tag_model, through, fk = tag_relation(queryset.model)
+    if not filtered:
+        _, count_field = TAGGED_FIELDS[queryset.model._meta.label]
+        facets = tag_model.objects.filter(**{f"{count_field}__gt": 0}).values(
+            "name", count=F(count_field)
+        )
+    else:
+        facets = (
+            through.objects.filter(**{f"{fk}__in": queryset.order_by().values("pk")})
+            .values(name=F("tag__name"))
+            .annotate(count=Count("tag_id"))
+        )
+    return list(facets.order_by("-count", "name"))
+
+
+class TagFacetsMixin:
+    """
+    List view'lariga tag/yil filtri va javobga `facets` qo'shadi. Facet'lar
+    faqat birinchi sahifada hisoblanadi — `next` sahifalarda to'plam o'zgarmaydi.
+    """
+
+    filter_backends = [TagYearFilter]
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        if not request.query_params.get(self.paginator.cursor_query_param):
+            response.data["facets"] = tag_facets(
+                self.filter_queryset(self.get_queryset()), is_filtered(request)
+            )
+        return response
@@ -0,0 +1,158 @@
+import hashlib
+import os
+from io import BytesIO
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models import Q
+from django.utils import timezone
+from PIL import Image, ImageOps, features
+
+from .cache import notify_content_updated
+from .tasks import run_in_background
+
+# model label -> (rasm maydoni, variantlar saqlanadigan JSONField)
+IMAGE_FIELDS = {
+    "posts.Post": ("image", "image_variants"),
+    "projects.Project": ("image", "image_variants"),
+    "home.Home": ("hero_image", "hero_image_variants"),
+    "aboutMe.Skill": ("image", "image_variants"),
+    "aboutMe.Certificate": ("image", "image_variants"),
+}
+
+# Pillow `save()` parametrlari har bir format uchun
+FORMAT_OPTIONS = {
+    "avif": {"format": "AVIF", "quality": 55},
+    "webp": {"format": "WEBP", "quality": 80, "method": 4},
+}
+
+
+def get_variant_widths():
+    return tuple(getattr(settings, "IMAGE_VARIANT_WIDTHS", (320, 640, 1280)))
+
+
+def get_variant_formats():
+    # AVIF Pillow build'ida bo'lmasa, jimgina tashlab ketiladi
+    formats = getattr(settings, "IMAGE_VARIANT_FORMATS", ("avif", "webp"))
+    return tuple(fmt for fmt in formats if features.check(fmt))
+
+
+def variant_path(name, width, fmt, content):
+    # Nomda mazmun hash'i: media uzoq muddat kesh qilinadi (MEDIA_CACHE_MAX_AGE),
+    # qayta yaratilgan variant eski URL'ni ishlatmasligi kerak
+    directory, filename = os.path.split(name)
+    stem = os.path.splitext(filename)[0]
+    digest = hashlib.md5(content, usedforsecurity=False).hexdigest()[:12]
+    return f"{directory}/variants/{stem}.{width}w.{digest}.{fmt}"
+
+
+def _variant_files(variants):
+    for paths in (variants or {}).get("formats", {}).values():
+        yield from paths.values()
+
+
+def render_variants(field_file):
+    """
+    Asl rasmdan har bir kenglik va format uchun kichraytirilgan nusxa
+    yaratadi, storage'ga yozadi va variantlar xaritasini qaytaradi.
+    """
+    storage = field_file.storage
+    with field_file.open("rb") as fh:
+        with Image.open(fh) as opened:
+            source = ImageOps.exif_transpose(opened)
+            source.load()
+
+    if source.mode not in ("RGB", "RGBA"):
+        has_alpha = source.mode in ("LA", "PA") or "transparency" in source.info
+        source = source.convert("RGBA" if has_alpha else "RGB")
+
+    widths = [w for w in get_variant_widths() if w < source.width] or [source.width]
+    formats = {}
+    for fmt in get_variant_formats():
+        paths = {}
+        for width in widths:
+            height = max(1, round(source.height * width / source.width))
+            resized = source.resize((width, height), Image.Resampling.LANCZOS)
+            buffer = BytesIO()
+            resized.save(buffer, **FORMAT_OPTIONS[fmt])
+            content = buffer.getvalue()
+            path = variant_path(field_file.name, width, fmt, content)
+            if not storage.exists(path):
+                path = storage.save(path, ContentFile(content))
+            paths[str(width)] = path
+        formats[fmt] = paths
+
+    return {
+        "source": field_file.name,
+        "width": source.width,
+        "height": source.height,
+        "formats": formats,
+    }
+
+
+def build_variants(label, pk, force=False):
+    """Bitta obyekt uchun variantlarni (qayta) yaratadi va JSONField'ga yozadi."""
+    model = apps.get_model(label)
+    image_field, variants_field = IMAGE_FIELDS[label]
+    obj = (
+        model._default_manager.filter(pk=pk)
+        .only("pk", image_field, variants_field)
+        .first()
+    )
+    if obj is None:
+        return False
+
+    field_file = getattr(obj, image_field)
+    current = getattr(obj, variants_field) or {}
+    if field_file and not force and current.get("source") == field_file.name:
+        return False
+
+    variants = render_variants(field_file) if field_file else {}
+    storage = field_file.storage
+    stale = set(_variant_files(current)) - set(_variant_files(variants))
+    for path in stale:
+        storage.delete(path)
+
+    updates = {variants_field: variants}
+    if any(f.name == "updated_at" for f in model._meta.concrete_fields):
+        # ETag/Last-Modified yangi srcset'ni ko'rishi uchun
+        updates["updated_at"] = timezone.now()
+    # Shu orada rasm yana almashtirilgan bo'lsa, eski natijani yozmaymiz
+    if field_file:
+        unchanged = Q(**{image_field: field_file.name})
+    else:
+        unchanged = Q(**{f"{image_field}__isnull": True}) | Q(**{image_field: ""})
+    if model._default_manager.filter(unchanged, pk=pk).update(**updates):
+        notify_content_updated(model)
+    return True
+
+
+def schedule_variants(sender, instance, **kwargs):
+    """`post_save` handler: rasm o'zgargan bo'lsa variantlarni fonda yaratadi."""
+    if kwargs.get("raw"):
+        return
+    label = sender._meta.label
+    image_field, variants_field = IMAGE_FIELDS[label]
+    field_file = getattr(instance, image_field)
+    current = getattr(instance, variants_field) or {}
+    if (field_file.name or None) != current.get("source"):
+        run_in_background(build_variants, label, instance.pk)
+
+
+def srcset_map(variants, request=None):
+    """`{"webp": "url 320w, url 640w", ...}` — `<source srcset>` uchun tayyor."""
+    if not variants:
+        return {}
+
+    result = {}
+    for fmt, paths in variants.get("formats", {}).items():
+        entries = []
+        for width, path in sorted(paths.items(), key=lambda item: int(item[0])):
+            url = default_storage.url(path)
+            if request is not None:
+                url = request.build_absolute_uri(url)
+            entries.append(f"{url} {width}w")
+        result[fmt] = ", ".join(entries)
+    return result
@@ -0,0 +1,294 @@
+import json
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .cache import notify_content_updated
+
+# type -> (model label, matn maydonlari, qo'shimcha oddiy maydonlar)
+IMPORT_TYPES = {
+    "post": ("posts.Post", ("title", "content"), ()),
+    "project": (
+        "projects.Project",
+        ("title", "description"),
+        ("github_link", "live_demo_link"),
+    ),
+}
+
+
+class RecordError(ValueError):
+    """Bitta NDJSON satri noto'g'ri — satr o'tkazib yuboriladi."""
+
+
+@dataclass
+class ImportStats:
+    rows: int = 0
+    created: int = 0
+    updated: int = 0
+    skipped: int = 0
+    images: int = 0
+    errors: list = field(default_factory=list)
+    kinds: set = field(default_factory=set)
+
+
+class ContentImporter:
+    """
+    NDJSON satrlarini (`{"type": "post" | "project", ...}`) batch'lab import
+    qiladi: tag'lar bitta `INSERT .. ON CONFLICT DO NOTHING` bilan, obyektlar
+    `uuid` bo'yicha upsert (`bulk_create(update_conflicts=True)`), M2M through
+    qatorlari bitta `bulk_create`, rasmlar esa thread pool'da storage'ga
+    ko'chiriladi.
+
+    `bulk_create` `save()` va signal'larni chaqirmaydi, shuning uchun Markdown
+    render shu yerda qilinadi, tag hisoblagichlari esa `finish()` da yangilanadi.
+    """
+
+    def __init__(self, media_dir=None, owner=None, workers=4, batch_size=500):
+        self.media_dir = media_dir
+        self.default_owner = owner
+        self.workers = workers
+        self.batch_size = batch_size
+        self.stats = ImportStats()
+        self._owners = {}
+
+    def run(self, lines):
+        batch = []
+        for number, line in enumerate(lines, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                batch.append(self.parse(number, line))
+            except RecordError as exc:
+                self.stats.skipped += 1
+                self.stats.errors.append(f"{number}-satr: {exc}")
+            if len(batch) >= self.batch_size:
+                self.import_batch(batch)
+                batch = []
+        if batch:
+            self.import_batch(batch)
+        self.finish()
+        return self.stats
+
+    def parse(self, number, line):
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise RecordError(f"JSON xato: {exc.msg}")
+        if not isinstance(record, dict) or record.get("type") not in IMPORT_TYPES:
+            raise RecordError("`type` 'post' yoki 'project' bo'lishi kerak")
+        label, text_fields, extra_fields = IMPORT_TYPES[record["type"]]
+        model = apps.get_model(label)
+        for name in text_fields:
+            if not isinstance(record.get(name), str) or not record[name].strip():
+                raise RecordError(f"`{name}` bo'sh")
+        for name in extra_fields:
+            if record.get(name) and not isinstance(record[name], str):
+                raise RecordError(f"`{name}` satr bo'lishi kerak")
+        # Uzun qiymat DataError bilan butun batch tranzaksiyasini yiqitmasin
+        for name in (*text_fields, *extra_fields):
+            max_length = model._meta.get_field(name).max_length
+            if max_length and len(record.get(name) or "") > max_length:
+                raise RecordError(f"`{name}` {max_length} belgidan uzun")
+        if record.get("uuid"):
+            try:
+                record["uuid"] = uuid.UUID(str(record["uuid"]))
+            except ValueError:
+                raise RecordError("`uuid` noto'g'ri")
+        if record.get("created_at"):
+            record["created_at"] = self.parse_created_at(record["created_at"])
+        tags = record.get("tags") or []
+        if not isinstance(tags, list) or not all(isinstance(t, str) for t in tags):
+            raise RecordError("`tags` satrlar ro'yxati bo'lishi kerak")
+        tag_length = (
+            model._meta.get_field("tags").related_model._meta.get_field("name").max_length
+        )
+        for name in tags:
+            if len(name.strip()) > tag_length:
+                raise RecordError(f"tag {tag_length} belgidan uzun: {name[:20]}...")
+        if record["type"] == "project":
+            record["owner_id"] = self.resolve_owner(record.get("owner"))
+        return record
+
+    @staticmethod
+    def parse_created_at(value):
+        try:
+            created_at = parse_datetime(value) if isinstance(value, str) else None
+        except ValueError:
+            created_at = None
+        if created_at is None:
+            raise RecordError("`created_at` ISO 8601 formatida bo'lishi kerak")
+        if timezone.is_naive(created_at):
+            # Server timezone'ini taxmin qilmaymiz — offset aniq berilsin
+            raise RecordError("`created_at` da timezone (masalan +00:00 yoki Z) yo'q")
+        return created_at
+
+    def import_batch(self, records):
+        by_type = {}
+        for record in records:
+            by_type.setdefault(record["type"], []).append(record)
+        for kind, items in by_type.items():
+            # Bir batch'da bitta uuid ikki marta bo'lsa upsert yiqiladi — oxirgisi qoladi
+            unique = {}
+            for record in items:
+                unique[record.get("uuid") or id(record)] = record
+            self.stats.skipped += len(items) - len(unique)
+            self.import_objects(kind, list(unique.values()))
+            self.stats.kinds.add(kind)
+        self.stats.rows += len(records)
+
+    def import_objects(self, kind, records):
+        label, text_fields, extra_fields = IMPORT_TYPES[kind]
+        model = apps.get_model(label)
+        tag_field = model._meta.get_field("tags")
+        tag_model = tag_field.related_model
+        through = tag_field.remote_field.through
+
+        objects = []
+        for record in records:
+            obj = model(
+                **{name: record[name] for name in text_fields},
+                **{name: record.get(name) or None for name in extra_fields},
+            )
+            if record.get("uuid"):
+                obj.uuid = record["uuid"]
+            if kind == "post":
+                obj.render_content()
+            else:
+                obj.owner_id = record["owner_id"]
+            objects.append(obj)
+
+        self.attach_images(model, objects, records)
+
+        update_fields = [*text_fields, *extra_fields, "updated_at"]
+        if kind == "post":
+            update_fields += ["content_html", "excerpt", "reading_time"]
+        else:
+            update_fields.append("owner")
+        if self.media_dir:
+            # --media-dir'siz qayta import mavjud rasmlarni o'chirib yubormasin
+            update_fields.append("image")
+        existing = set(
+            model.objects.filter(uuid__in=[obj.uuid for obj in objects]).values_list(
+                "uuid", flat=True
+            )
+        )
+        tag_ids = self.upsert_tags(
+            tag_model, {name.strip() for r in records for name in r.get("tags") or []}
+        )
+
+        with transaction.atomic():
+            model.objects.bulk_create(
+                objects,
+                update_conflicts=True,
+                unique_fields=["uuid"],
+                update_fields=update_fields,
+            )
+            # auto_now_add bulk_create'da ham ishlaydi — asl sanani qaytaramiz
+            dated = []
+            for obj, record in zip(objects, records):
+                if record.get("created_at"):
+                    obj.created_at = record["created_at"]
+                    dated.append(obj)
+            if dated:
+                model.objects.bulk_update(dated, ["created_at"], batch_size=500)
+
+            fk = f"{model._meta.model_name}_id"
+            through.objects.filter(**{f"{fk}__in": [obj.pk for obj in objects]}).delete()
+            through.objects.bulk_create(
+                [
+                    through(**{fk: obj.pk, "tag_id": tag_ids[name.strip()]})
+                    for obj, record in zip(objects, records)
+                    for name in set(record.get("tags") or [])
+                    if name.strip()
+                ],
+                ignore_conflicts=True,
+            )
+
+        updated = sum(1 for obj in objects if obj.uuid in existing)
+        self.stats.updated += updated
+        self.stats.created += len(objects) - updated
+
+    def upsert_tags(self, tag_model, names):
+        names = {name for name in names if name}
+        if not names:
+            return {}
+        tag_model.objects.bulk_create(
+            [tag_model(name=name) for name in names], ignore_conflicts=True
+        )
+        return dict(
+            tag_model.objects.filter(name__in=names).values_list("name", "pk")
+        )
+
+    def resolve_owner(self, username):
+        username = username or self.default_owner
+        if not username:
+            raise RecordError("project uchun `owner` (yoki --owner) kerak")
+        if username not in self._owners:
+            User = get_user_model()
+            self._owners[username] = (
+                User.objects.filter(**{User.USERNAME_FIELD: username})
+                .values_list("pk", flat=True)
+                .first()
+            )
+        if self._owners[username] is None:
+            raise RecordError(f"foydalanuvchi topilmadi: {username}")
+        return self._owners[username]
+
+    def attach_images(self, model, objects, records):
+        """Rasmlarni `media_dir` dan storage'ga parallel ko'chiradi (I/O — GIL bo'shaydi)."""
+        jobs = [
+            (obj, record["image"])
+            for obj, record in zip(objects, records)
+            if record.get("image")
+        ]
+        if not jobs:
+            return
+        if not self.media_dir:
+            self.stats.errors.append(
+                f"{len(jobs)} ta rasm o'tkazib yuborildi: --media-dir berilmagan"
+            )
+            return
+
+        image_field = model._meta.get_field("image")
+
+        def store(job):
+            obj, relative = job
+            path = os.path.join(self.media_dir, relative)
+            try:
+                with open(path, "rb") as fh:
+                    name = image_field.generate_filename(obj, os.path.basename(path))
+                    return obj, image_field.storage.save(name, File(fh))
+            except OSError as exc:
+                self.stats.errors.append(f"{relative}: {exc.strerror}")
+                return obj, None
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for obj, name in executor.map(store, jobs):
+                if name:
+                    obj.image = name
+                    self.stats.images += 1
+
+    def finish(self):
+        """Signal'lar ishlamagani uchun denormalized ma'lumotlarni yangilaydi."""
+        tag_models = {
+            apps.get_model(IMPORT_TYPES[kind][0])._meta.get_field("tags").related_model
+            for kind in self.stats.kinds
+        }
+        for tag_model in tag_models:
+            # Qayta tag'langan qatorlarning eski tag'lari ham o'zgaradi — hammasi
+            tag_model.objects.recount_usage()
+        for kind in self.stats.kinds:
+            notify_content_updated(apps.get_model(IMPORT_TYPES[kind][0]))
+        if "post" in self.stats.kinds:
+            from posts.related import refresh_all
+
+            refresh_all()
@@ -0,0 +1,225 @@
+import atexit
+import logging
+import threading
+from collections import Counter, defaultdict
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection, connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .cache import notify_content_updated
+
+logger = logging.getLogger(__name__)
+
+WRITE_BATCH_SIZE = 500
+
+
+class LikeBuffer:
+    """
+    Like/unlike niyatlarini jarayon xotirasida yig'ib, bazaga to'plab yozadi.
+
+    Har bir `(target_id, ip)` uchun faqat oxirgi holat saqlanadi, shuning
+    uchun bir IP'ning ketma-ket bosishlari bitta yozuvga qisqaradi. Flush:
+    like'lar `INSERT ... ON CONFLICT DO NOTHING`, unlike'lar batch `DELETE`
+    bilan; ikkalasi ham `RETURNING` orqali haqiqatan yozilgan qatorlarni
+    qaytaradi va hisoblagichga faqat shu farq qo'shiladi.
+
+    Flush muvaffaqiyatsiz bo'lsa niyatlar yo'qolmaydi: yangiroq niyat bilan
+    almashtirilmaganlari buferga qaytadi va keyingi flush'da qayta yoziladi.
+
+    Bufer jarayonga xos: read-your-writes faqat shu worker ichida ishlaydi.
+    Bir IP'ning flush'gacha turli worker'larga tushgan bosishlari bir-birini
+    ko'rmaydi (masalan ikkinchi bosish unlike emas, like bo'lib qoladi), lekin
+    hisoblagichlar haqiqiy qatorlar farqidan yuritilgani uchun to'g'ri qoladi.
+    Jarayon SIGKILL bilan to'xtasa oxirgi `LIKE_BUFFER_INTERVAL` dagi niyatlar
+    yo'qoladi; oddiy to'xtashda `atexit` flush qiladi.
+    """
+
+    def __init__(self, like_label, target_field):
+        self.like_label = like_label
+        self.target_field = target_field
+        self._lock = threading.Lock()
+        self._pending = {}
+        # Flush qilinayotgan, lekin hali commit bo'lmagan niyatlar
+        self._flushing = {}
+        self._timer = None
+
+    @property
+    def like_model(self):
+        return apps.get_model(self.like_label)
+
+    @property
+    def target_model(self):
+        return self.like_model._meta.get_field(self.target_field).related_model
+
+    @property
+    def max_size(self):
+        return getattr(settings, "LIKE_BUFFER_SIZE", 100)
+
+    @property
+    def interval(self):
+        return getattr(settings, "LIKE_BUFFER_INTERVAL", 2.0)
+
+    def _exists(self, target_id, ip):
+        return self.like_model.objects.filter(
+            **{f"{self.target_field}_id": target_id, "ip_address": ip}
+        ).exists()
+
+    def toggle(self, target_id, ip):
+        """Holatni almashtiradi va yangi holatni qaytaradi (`True` — liked)."""
+        key = (target_id, ip)
+        with self._lock:
+            current = self._pending.get(key, self._flushing.get(key))
+        if current is None:
+            current = self._exists(target_id, ip)
+
+        with self._lock:
+            # Shu orada boshqa thread yozgan bo'lsa, o'shaning holatidan davom etamiz
+            liked = not self._pending.get(key, current)
+            self._pending[key] = liked
+            size = len(self._pending)
+            if size < self.max_size:
+                self._schedule()
+
+        if size >= self.max_size:
+            self.flush()
+        return liked
+
+    def _schedule(self):
+        """`_lock` ostida chaqiriladi: flush taymeri bo'lmasa ishga tushiradi."""
+        if self._timer is None:
+            self._timer = threading.Timer(self.interval, self._flush_in_thread)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush_in_thread(self):
+        try:
+            self.flush()
+        finally:
+            connections.close_all()
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._flushing.update(pending)
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not pending:
+            return 0
+
+        try:
+            self._write(pending)
+        except Exception:
+            logger.exception(
+                "Flushing %d buffered %s intents failed", len(pending), self.like_label
+            )
+            with self._lock:
+                # Flush paytida kelgan yangiroq niyat eskisini bosib ketadi
+                for key, liked in pending.items():
+                    self._pending.setdefault(key, liked)
+                self._schedule()
+            return 0
+        finally:
+            with self._lock:
+                for key, liked in pending.items():
+                    if self._flushing.get(key) is liked:
+                        del self._flushing[key]
+        return len(pending)
+
+    def _write(self, pending):
+        likes = [key for key, liked in pending.items() if liked]
+        unlikes = [key for key, liked in pending.items() if not liked]
+        deltas = Counter()
+
+        with transaction.atomic():
+            for start in range(0, len(likes), WRITE_BATCH_SIZE):
+                deltas.update(self._insert(likes[start : start + WRITE_BATCH_SIZE]))
+            for start in range(0, len(unlikes), WRITE_BATCH_SIZE):
+                deltas.subtract(self._delete(unlikes[start : start + WRITE_BATCH_SIZE]))
+            self._apply_deltas(deltas)
+
+    def _insert(self, keys):
+        """
+        Haqiqatan qo'shilgan like'larning obyekt id'lari: mavjud juftliklar
+        `ON CONFLICT DO NOTHING` bilan, flush'gacha o'chirilgan obyektlar
+        esa JOIN bilan tushib qoladi — bitta so'rov.
+        """
+        like_model, target_model = self.like_model, self.target_model
+        qn = connection.ops.quote_name
+        fk_column = qn(like_model._meta.get_field(self.target_field).column)
+        rows = ", ".join(["(%s, %s::inet)"] * len(keys))
+        sql = (
+            f"INSERT INTO {qn(like_model._meta.db_table)} "
+            f"({fk_column}, {qn('ip_address')}, {qn('created_at')}) "
+            f"SELECT v.target_id, v.ip, %s FROM (VALUES {rows}) AS v(target_id, ip) "
+            f"JOIN {qn(target_model._meta.db_table)} t "
+            f"ON t.{qn(target_model._meta.pk.column)} = v.target_id "
+            f"ON CONFLICT DO NOTHING RETURNING {fk_column}"
+        )
+        params = [timezone.now(), *(value for key in keys for value in key)]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return [row[0] for row in cursor.fetchall()]
+
+    def _delete(self, keys):
+        """Haqiqatan o'chirilgan like'larning obyekt id'lari."""
+        like_model = self.like_model
+        qn = connection.ops.quote_name
+        fk_column = qn(like_model._meta.get_field(self.target_field).column)
+        rows = ", ".join(["(%s, %s::inet)"] * len(keys))
+        sql = (
+            f"DELETE FROM {qn(like_model._meta.db_table)} "
+            f"WHERE ({fk_column}, {qn('ip_address')}) IN (VALUES {rows}) "
+            f"RETURNING {fk_column}"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [value for key in keys for value in key])
+            return [row[0] for row in cursor.fetchall()]
+
+    def _apply_deltas(self, deltas):
+        """
+        `likes_count` ga faqat yozilgan qatorlar farqi qo'shiladi — to'liq
+        qayta hisoblash (`recount_counters`) faqat ta'mirlash komandasida.
+        """
+        by_delta = defaultdict(list)
+        for target_id, delta in deltas.items():
+            if delta:
+                by_delta[delta].append(target_id)
+        if not by_delta:
+            return
+        target_model = self.target_model
+        for delta, target_ids in by_delta.items():
+            target_model.objects.filter(pk__in=target_ids).update(
+                likes_count=F("likes_count") + delta
+            )
+        # update() signal chaqirmaydi — keshlangan payload'lar eskirmasin
+        notify_content_updated(target_model)
+
+
+_buffers = {}
+_buffers_lock = threading.Lock()
+
+
+def get_like_buffer(like_label, target_field):
+    with _buffers_lock:
+        buffer = _buffers.get(like_label)
+        if buffer is None:
+            buffer = _buffers[like_label] = LikeBuffer(like_label, target_field)
+    return buffer
+
+
+def toggle_like(like_label, target_field, target_id, ip):
+    """
+    Like holatini almashtiradi. `LIKE_BUFFER_SIZE = 0` bo'lsa har bir bosish
+    darhol (shu request ichida) bazaga yoziladi.
+    """
+    return get_like_buffer(like_label, target_field).toggle(target_id, ip)
+
+
+@atexit.register
+def flush_all():
+    for buffer in list(_buffers.values()):
+        buffer.flush()
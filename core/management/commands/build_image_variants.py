@@ -0,0 +1,76 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Q
+
+from core.images import IMAGE_FIELDS, build_variants
+
+
+class Command(BaseCommand):
+    help = (
+        "Mavjud media uchun WebP/AVIF variantlarini yaratadi (backfill). "
+        "Variantlari dolzarb bo'lgan rasmlar o'tkazib yuboriladi."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            choices=sorted(IMAGE_FIELDS),
+            help="Faqat shu model(lar) uchun, masalan --model posts.Post",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Dolzarb variantlarni ham qayta yaratadi.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=2,
+            help="Parallel ishlovchi thread'lar soni (Pillow GIL'ni bo'shatadi).",
+        )
+
+    def handle(self, *args, **options):
+        if options["workers"] < 1:
+            raise CommandError("--workers kamida 1 bo'lishi kerak")
+
+        jobs = []
+        for label in options["model"] or IMAGE_FIELDS:
+            image_field, _ = IMAGE_FIELDS[label]
+            model = apps.get_model(label)
+            pks = (
+                model._default_manager.exclude(
+                    Q(**{f"{image_field}__isnull": True}) | Q(**{image_field: ""})
+                )
+                .order_by("pk")
+                .values_list("pk", flat=True)
+            )
+            jobs.extend((label, pk) for pk in pks)
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+            results = list(
+                executor.map(lambda job: self.build(*job, options["force"]), jobs)
+            )
+
+        built = sum(1 for result in results if result)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{built} ta rasm uchun variantlar yaratildi, "
+                f"{len(jobs) - built} tasi dolzarb "
+                f"({time.monotonic() - started:.1f}s)"
+            )
+        )
+
+    def build(self, label, pk, force):
+        try:
+            return build_variants(label, pk, force=force)
+        except Exception as exc:
+            self.stderr.write(f"{label} #{pk}: {exc}")
+            return False
+        finally:
+            connections.close_all()
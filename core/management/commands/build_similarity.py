@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.models import SimilarContent
+from core.similarity import build_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Post va project'lar bo'yicha TF-IDF indeksini noldan quradi va har "
+        "bir element uchun eng o'xshash qo'shnilarni saqlaydi. Keyingi "
+        "o'zgarishlar inkremental yangilanadi; yangi so'zlar lug'atga faqat "
+        "shu komanda orqali qo'shiladi."
+    )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        index = build_index()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(index.keys)} ta hujjat, {len(index.vocabulary)} ta so'z, "
+                f"{SimilarContent.objects.count()} ta qo'shni "
+                f"({time.monotonic() - started:.1f}s)"
+            )
+        )
@@ -0,0 +1,63 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.export import CHUNK_SIZE, EXPORT_MODELS, stream_export
+
+
+class Command(BaseCommand):
+    help = (
+        "Kontentni NDJSON (Django `jsonl` formati) sifatida eksport qiladi. "
+        "Jadvallar iterator bilan o'qiladi, xotira sarfi hajmga bog'liq emas."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-o",
+            "--output",
+            help="Fayl yo'li; berilmasa stdout'ga yoziladi.",
+        )
+        parser.add_argument(
+            "--model",
+            action="append",
+            choices=EXPORT_MODELS,
+            help="Faqat shu model(lar), masalan --model posts.Post",
+        )
+        parser.add_argument(
+            "--gzip",
+            action="store_true",
+            help="Natijani gzip bilan siqadi.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=CHUNK_SIZE,
+            help="Bir marta o'qiladigan qatorlar soni.",
+        )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        chunks = stream_export(
+            options["model"],
+            compress=options["gzip"],
+            chunk_size=options["chunk_size"],
+        )
+
+        written = 0
+        if options["output"]:
+            with open(options["output"], "wb") as fh:
+                for chunk in chunks:
+                    fh.write(chunk)
+                    written += len(chunk)
+        else:
+            out = sys.stdout.buffer
+            for chunk in chunks:
+                out.write(chunk)
+                written += len(chunk)
+            out.flush()
+
+        # stdout'ga yozilganda hisobot ma'lumotni buzmasin
+        self.stderr.write(
+            f"{written} bayt eksport qilindi ({time.monotonic() - started:.1f}s)"
+        )
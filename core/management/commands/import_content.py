@@ -0,0 +1,68 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.importer import ContentImporter
+
+
+class Command(BaseCommand):
+    help = (
+        "Post va project'larni NDJSON fayldan batch'lab import qiladi. Har bir "
+        'satr: {"type": "post", "title", "content", "tags": [...], "image", '
+        '"created_at", "uuid"} yoki {"type": "project", "title", "description", '
+        '"github_link", "live_demo_link", "owner", "tags", "image", ...}. '
+        "`uuid` berilsa qator yangilanadi (qayta import xavfsiz)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="NDJSON fayl; '-' — stdin.")
+        parser.add_argument(
+            "--media-dir",
+            help="`image` yo'llari shu papkaga nisbatan o'qiladi.",
+        )
+        parser.add_argument(
+            "--owner",
+            help="`owner` ko'rsatilmagan project'lar uchun foydalanuvchi nomi.",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Rasmlarni parallel ko'chiruvchi thread'lar soni.",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1 or options["workers"] < 1:
+            raise CommandError("--batch-size va --workers kamida 1 bo'lishi kerak")
+
+        importer = ContentImporter(
+            media_dir=options["media_dir"],
+            owner=options["owner"],
+            workers=options["workers"],
+            batch_size=options["batch_size"],
+        )
+        started = time.monotonic()
+        if options["path"] == "-":
+            stats = importer.run(sys.stdin)
+        else:
+            try:
+                with open(options["path"], encoding="utf-8") as fh:
+                    stats = importer.run(fh)
+            except OSError as exc:
+                raise CommandError(f"{options['path']}: {exc.strerror}")
+        elapsed = time.monotonic() - started
+
+        for error in stats.errors:
+            self.stderr.write(error)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{stats.rows} qator: {stats.created} yangi, {stats.updated} "
+                f"yangilandi, {stats.skipped} o'tkazib yuborildi, {stats.images} "
+                f"rasm — {elapsed:.1f}s ({stats.rows / max(elapsed, 1e-6):.0f} qator/s)"
+            )
+        )
+        if stats.images:
+            self.stdout.write("Rasm variantlari uchun: manage.py build_image_variants")
+        self.stdout.write("O'xshash kontent indeksi uchun: manage.py build_similarity")
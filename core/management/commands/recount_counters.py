@@ -0,0 +1,60 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F, Q
+
+from core.counters import count_subquery
+from posts.models import Post, PostComment, PostLike
+from projects.models import Project, ProjectComment, ProjectLike
+
+
+class Command(BaseCommand):
+    help = (
+        "Post va Project uchun denormalized likes_count/comments_count "
+        "ustunlarini qayta hisoblaydi va drift'ni tuzatadi."
+    )
+
+    targets = (
+        (Post, PostLike, PostComment, "post"),
+        (Project, ProjectLike, ProjectComment, "project"),
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Faqat drift bo'lgan qatorlarni ko'rsatadi, hech narsa yozmaydi.",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+
+        for model, like_model, comment_model, fk_name in self.targets:
+            drifted = (
+                model.objects.annotate(
+                    actual_likes=count_subquery(like_model, fk_name),
+                    actual_comments=count_subquery(comment_model, fk_name),
+                )
+                .filter(
+                    ~Q(likes_count=F("actual_likes"))
+                    | ~Q(comments_count=F("actual_comments"))
+                )
+                .values_list("pk", flat=True)
+            )
+            drifted_ids = list(drifted)
+            label = model._meta.verbose_name_plural
+
+            if not drifted_ids:
+                self.stdout.write(f"{label}: drift yo'q")
+                continue
+
+            if dry_run:
+                self.stdout.write(
+                    self.style.WARNING(f"{label}: {len(drifted_ids)} ta qatorda drift")
+                )
+                continue
+
+            with transaction.atomic():
+                updated = model.objects.filter(pk__in=drifted_ids).recount_counters()
+            self.stdout.write(
+                self.style.SUCCESS(f"{label}: {updated} ta qator tuzatildi")
+            )
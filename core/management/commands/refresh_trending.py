@@ -0,0 +1,32 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.trending import TRENDING_SOURCES, refresh_trending, trending_cutoff
+
+
+class Command(BaseCommand):
+    help = (
+        "Post va project'larning trending_score ustunini oxirgi ishga "
+        "tushirishdan beri kelgan like/comment'lar bilan yangilaydi. "
+        "Cron orqali davriy (masalan har 5 daqiqada) ishga tushiriladi."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Ballarni noldan, butun oyna bo'yicha qayta hisoblaydi.",
+        )
+
+    def handle(self, *args, **options):
+        now = trending_cutoff()
+        for label in TRENDING_SOURCES:
+            started = time.monotonic()
+            events, rows = refresh_trending(label, now=now, full=options["full"])
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{label}: {events} ta hodisa, {rows} ta qator "
+                    f"({time.monotonic() - started:.2f}s)"
+                )
+            )
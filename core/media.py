@@ -0,0 +1,142 @@
+import mimetypes
+import os
+import re
+import stat
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, parse_http_date_safe
+from django.views.decorators.http import require_safe
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+CHUNK_SIZE = 64 * 1024
+
+# `.gz` va h.k. fayllar arxiv sifatida beriladi: `Content-Encoding` qo'yilsa
+# brauzer ularni ochib yuboradi (Django'ning FileResponse'i bilan bir xil)
+ENCODED_CONTENT_TYPES = {
+    "br": "application/x-brotli",
+    "bzip2": "application/x-bzip",
+    "compress": "application/x-compress",
+    "gzip": "application/gzip",
+    "xz": "application/x-xz",
+}
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_range(header, size):
+    """
+    `Range: bytes=a-b` (yoki `a-`, `-n`) -> `(start, end)` (end ham kiradi).
+    Bir nechta oraliq yoki noto'g'ri sarlavha `None` — RFC 9110 bo'yicha
+    butun fayl 200 bilan qaytadi.
+    """
+    match = RANGE_RE.match(header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+    first, last = match.groups()
+    if not first:
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            raise RangeNotSatisfiable
+        return max(size - suffix, 0), size - 1
+    start = int(first)
+    if last and start > int(last):
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable
+    end = min(int(last), size - 1) if last else size - 1
+    return start, end
+
+
+def _read(path, start, length):
+    with open(path, "rb") as fh:
+        fh.seek(start)
+        while length > 0:
+            chunk = fh.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def _accel_response(path, relative, content_type):
+    """Baytlarni front proxy uzatadi — worker faqat sarlavhalarni yozadi."""
+    # Django'ning default `text/html` i proxy'ga o'tib ketmasin
+    response = HttpResponse(content_type=content_type or "application/octet-stream")
+    mode = getattr(settings, "MEDIA_ACCEL", "")
+    if mode == "nginx":
+        prefix = getattr(settings, "MEDIA_ACCEL_PREFIX", "/protected-media/")
+        response["X-Accel-Redirect"] = prefix.rstrip("/") + "/" + quote(relative)
+    else:
+        response["X-Sendfile"] = path
+    return response
+
+
+@require_safe
+def serve_media(request, path):
+    """
+    `MEDIA_ROOT` dagi fayllar: ETag/Last-Modified (304), uzoq muddatli
+    `Cache-Control`, bitta oraliqli `Range` (206/416, `If-Range` bilan).
+    `MEDIA_ACCEL` berilgan bo'lsa uzatish nginx (`X-Accel-Redirect`) yoki
+    Apache/lighttpd (`X-Sendfile`) ga topshiriladi.
+    """
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+    except SuspiciousFileOperation:
+        raise Http404
+    try:
+        info = os.stat(full_path)
+    except OSError:
+        raise Http404
+    if not stat.S_ISREG(info.st_mode):
+        raise Http404
+
+    size, mtime = info.st_size, int(info.st_mtime)
+    etag = f'"{info.st_mtime_ns:x}-{size:x}"'
+    response = get_conditional_response(request, etag=etag, last_modified=mtime)
+    content_type, encoding = mimetypes.guess_type(full_path)
+    content_type = ENCODED_CONTENT_TYPES.get(encoding, content_type)
+
+    if response is None and getattr(settings, "MEDIA_ACCEL", ""):
+        # Range'ni ham proxy o'zi bajaradi
+        response = _accel_response(full_path, path, content_type)
+    elif response is None:
+        byte_range = None
+        if_range = request.headers.get("If-Range")
+        if "Range" in request.headers and (
+            not if_range or if_range == etag or parse_http_date_safe(if_range) == mtime
+        ):
+            try:
+                byte_range = parse_range(request.headers["Range"], size)
+            except RangeNotSatisfiable:
+                response = HttpResponse(status=416)
+                response["Content-Range"] = f"bytes */{size}"
+                return response
+
+        start, end = byte_range or (0, size - 1)
+        length = end - start + 1 if size else 0
+        body = _read(full_path, start, length) if request.method == "GET" else ()
+        response = StreamingHttpResponse(
+            body,
+            status=206 if byte_range else 200,
+            content_type=content_type or "application/octet-stream",
+        )
+        response["Content-Length"] = str(length)
+        if byte_range:
+            response["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    response["Accept-Ranges"] = "bytes"
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(mtime)
+    patch_cache_control(
+        response,
+        public=True,
+        max_age=getattr(settings, "MEDIA_CACHE_MAX_AGE", 30 * 24 * 3600),
+    )
+    return response
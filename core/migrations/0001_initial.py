@@ -0,0 +1,83 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="SimilarityIndex",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("data", models.BinaryField()),
+                ("documents", models.PositiveIntegerField(default=0)),
+                ("terms", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name_plural": "similarity index",
+            },
+        ),
+        migrations.CreateModel(
+            name="SimilarContent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "source_kind",
+                    models.CharField(
+                        choices=[("post", "Post"), ("project", "Project")],
+                        max_length=10,
+                    ),
+                ),
+                ("source_id", models.PositiveBigIntegerField()),
+                (
+                    "target_kind",
+                    models.CharField(
+                        choices=[("post", "Post"), ("project", "Project")],
+                        max_length=10,
+                    ),
+                ),
+                ("target_id", models.PositiveBigIntegerField()),
+                ("score", models.FloatField()),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["source_kind", "source_id", "-score"],
+                        name="similarcontent_source_idx",
+                    ),
+                    models.Index(
+                        fields=["target_kind", "target_id"],
+                        name="similarcontent_target_idx",
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("source_kind", "source_id", "target_kind", "target_id"),
+                        name="similarcontent_unique_pair",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,126 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:33
+
+from io import BytesIO
+
+import django.contrib.postgres.fields
+import numpy as np
+from django.db import migrations, models
+from scipy import sparse
+
+
+# Eski blob'da butun matritsa bor edi: qatorlar SimilarityVector'ga ko'chadi,
+# blob'da faqat lug'at va idf qoladi
+def split_index(apps, schema_editor):
+    SimilarityIndex = apps.get_model("core", "SimilarityIndex")
+    SimilarityVector = apps.get_model("core", "SimilarityVector")
+    for stored in SimilarityIndex.objects.all():
+        arrays = np.load(BytesIO(bytes(stored.data)))
+        if "indptr" not in arrays:
+            continue
+        indptr, indices, data = arrays["indptr"], arrays["indices"], arrays["data"]
+        SimilarityVector.objects.bulk_create(
+            (
+                SimilarityVector(
+                    kind=kind,
+                    object_id=pk,
+                    terms=indices[indptr[i] : indptr[i + 1]].tolist(),
+                    weights=data[indptr[i] : indptr[i + 1]].tolist(),
+                )
+                for i, (kind, pk) in enumerate(
+                    zip(arrays["kinds"].tolist(), arrays["ids"].tolist())
+                )
+            ),
+            batch_size=1000,
+        )
+        buffer = BytesIO()
+        np.savez_compressed(buffer, terms=arrays["terms"], idf=arrays["idf"])
+        stored.data = buffer.getvalue()
+        stored.save(update_fields=["data"])
+
+
+def merge_index(apps, schema_editor):
+    SimilarityIndex = apps.get_model("core", "SimilarityIndex")
+    SimilarityVector = apps.get_model("core", "SimilarityVector")
+    rows = list(
+        SimilarityVector.objects.order_by("pk").values_list(
+            "kind", "object_id", "terms", "weights"
+        )
+    )
+    for stored in SimilarityIndex.objects.all():
+        arrays = np.load(BytesIO(bytes(stored.data)))
+        indptr = np.cumsum([0] + [len(terms) for _, _, terms, _ in rows])
+        matrix = sparse.csr_matrix(
+            (
+                np.array([w for *_, weights in rows for w in weights], dtype=np.float32),
+                np.array([t for _, _, terms, _ in rows for t in terms], dtype=np.int32),
+                indptr,
+            ),
+            shape=(len(rows), len(arrays["terms"])),
+        )
+        buffer = BytesIO()
+        np.savez_compressed(
+            buffer,
+            kinds=np.array([kind for kind, *_ in rows], dtype="U16"),
+            ids=np.array([pk for _, pk, *_ in rows], dtype=np.int64),
+            terms=arrays["terms"],
+            idf=arrays["idf"],
+            data=matrix.data,
+            indices=matrix.indices,
+            indptr=matrix.indptr,
+            shape=np.array(matrix.shape),
+        )
+        stored.data = buffer.getvalue()
+        stored.save(update_fields=["data"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_trending"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SimilarityVector",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("post", "Post"), ("project", "Project")],
+                        max_length=10,
+                    ),
+                ),
+                ("object_id", models.PositiveBigIntegerField()),
+                (
+                    "terms",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.PositiveIntegerField(), size=None
+                    ),
+                ),
+                (
+                    "weights",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.FloatField(), size=None
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("kind", "object_id"),
+                        name="similarityvector_unique_item",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(split_index, merge_index),
+    ]
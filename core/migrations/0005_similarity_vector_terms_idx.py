@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:56
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_user_profile"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="similarityvector",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["terms"], name="similarityvector_terms_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,119 @@
+from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.db import models
+
+
+class SimilarContent(models.Model):
+    """
+    TF-IDF bo'yicha oldindan hisoblangan "o'xshash kontent" (post va
+    project'lar aralash). `core.similarity` to'ldiradi, API faqat o'qiydi.
+    """
+
+    KIND_CHOICES = (
+        ("post", "Post"),
+        ("project", "Project"),
+    )
+
+    source_kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    source_id = models.PositiveBigIntegerField()
+    target_kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    target_id = models.PositiveBigIntegerField()
+    score = models.FloatField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source_kind", "source_id", "target_kind", "target_id"],
+                name="similarcontent_unique_pair",
+            ),
+        ]
+        indexes = [
+            # API: WHERE source_kind = ? AND source_id = ? ORDER BY score DESC
+            models.Index(
+                fields=["source_kind", "source_id", "-score"],
+                name="similarcontent_source_idx",
+            ),
+            # Inkremental yangilash: element kimlarning ro'yxatida turibdi
+            models.Index(
+                fields=["target_kind", "target_id"], name="similarcontent_target_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return (
+            f"{self.source_kind}#{self.source_id} -> "
+            f"{self.target_kind}#{self.target_id} ({self.score:.3f})"
+        )
+
+
+class SimilarityIndex(models.Model):
+    """
+    Oxirgi TF-IDF lug'ati va idf `.npz` ko'rinishida — faqat to'liq build
+    yozadi. Yagona qator: inkremental yangilashlar uni `select_for_update`
+    bilan faqat qulf sifatida ushlaydi, blob qayta yozilmaydi.
+    """
+
+    data = models.BinaryField()
+    documents = models.PositiveIntegerField(default=0)
+    terms = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "similarity index"
+
+    def __str__(self):
+        return f"TF-IDF index ({self.documents} docs, {self.terms} terms)"
+
+
+class SimilarityVector(models.Model):
+    """
+    Bitta hujjatning normalizatsiya qilingan TF-IDF qatori (sparse: lug'at
+    indekslari va og'irliklari). Element o'zgarganda faqat uning qatori
+    qayta yoziladi — yozish narxi korpus hajmiga bog'liq emas.
+    """
+
+    kind = models.CharField(max_length=10, choices=SimilarContent.KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    terms = ArrayField(models.PositiveIntegerField())
+    weights = ArrayField(models.FloatField())
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "object_id"], name="similarityvector_unique_item"
+            ),
+        ]
+        indexes = [
+            # Inkremental yangilash: WHERE terms && ARRAY[...] — umumiy so'zli hujjatlar
+            GinIndex(fields=["terms"], name="similarityvector_terms_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}#{self.object_id} ({len(self.terms)} terms)"
+
+
+class TrendingState(models.Model):
+    """`refresh_trending` oxirgi marta qaysi vaqtgacha hodisalarni qo'shgani."""
+
+    label = models.CharField(max_length=100, unique=True)
+    refreshed_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.label}: {self.refreshed_at:%Y-%m-%d %H:%M}"
+
+
+class UserProfile(models.Model):
+    """
+    Ixtiyoriy ommaviy profil. Project javoblaridagi owner avatari faqat shu
+    yerga yuklangan rasmdan olinadi — account email'i (hash ko'rinishida
+    ham) javobga chiqmaydi.
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="profile"
+    )
+    avatar = models.ImageField(upload_to="avatars/", blank=True, null=True)
+
+    def __str__(self):
+        return f"Profile of {self.user}"
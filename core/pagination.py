@@ -0,0 +1,144 @@
+import base64
+from collections import OrderedDict
+
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    `(created_at, id)` juftligi bo'yicha keyset (cursor) pagination.
+
+    Offset ishlatilmaydi: har bir sahifa oldingi sahifaning oxirgi qatoridan
+    boshlab composite index bo'yicha range scan qiladi, shuning uchun chuqur
+    sahifalar ham birinchi sahifa kabi tez. Cursor — shaffof bo'lmagan
+    base64 satr, mijoz faqat `next` havolasiga o'tadi.
+    """
+
+    page_size = 12
+    max_page_size = 50
+    page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+    # Faqat ("-created_at", "-id") yoki ("created_at", "id") qo'llab-quvvatlanadi
+    ordering = ("-created_at", "-id")
+
+    def __init__(self, page_size=None):
+        if page_size is not None:
+            self.page_size = page_size
+        self.base_url = None
+        self.next_position = None
+
+    @property
+    def descending(self):
+        return self.ordering[0].startswith("-")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        return self.get_page(queryset, self.decode_cursor(request))
+
+    def get_page(self, queryset, position=None):
+        queryset = queryset.order_by(*self.ordering)
+        if position is not None:
+            queryset = self.filter_after(queryset, *position)
+
+        items = list(queryset[: self.page_size + 1])
+        has_next = len(items) > self.page_size
+        items = items[: self.page_size]
+        self.next_position = (
+            (items[-1].created_at, items[-1].pk) if has_next and items else None
+        )
+        return items
+
+    def filter_after(self, queryset, created_at, pk):
+        # `created_at` bo'yicha index range scan, tenglik holatida `id` hal qiladi
+        if self.descending:
+            return queryset.filter(created_at__lte=created_at).exclude(
+                created_at=created_at, pk__gte=pk
+            )
+        return queryset.filter(created_at__gte=created_at).exclude(
+            created_at=created_at, pk__lte=pk
+        )
+
+    def get_page_size(self, request):
+        if request is not None and self.page_size_query_param:
+            try:
+                value = int(request.query_params[self.page_size_query_param])
+            except (KeyError, ValueError):
+                return self.page_size
+            if value > 0:
+                return min(value, self.max_page_size)
+        return self.page_size
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(encoded.encode("ascii")).decode("ascii")
+            created_at, pk = raw.rsplit("|", 1)
+            created_at = parse_datetime(created_at)
+            pk = int(pk)
+        except (TypeError, ValueError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if created_at is None:
+            raise NotFound(self.invalid_cursor_message)
+        return created_at, pk
+
+    @staticmethod
+    def encode_cursor(position):
+        created_at, pk = position
+        raw = f"{created_at.isoformat()}|{pk}"
+        return base64.urlsafe_b64encode(raw.encode("ascii")).decode("ascii")
+
+    def get_next_link(self, base_url=None):
+        if self.next_position is None:
+            return None
+        return replace_query_param(
+            base_url or self.base_url,
+            self.cursor_query_param,
+            self.encode_cursor(self.next_position),
+        )
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+class ThreadPagination(KeysetPagination):
+    """Comment thread'lari uchun: eng eskisidan boshlab `(created_at, id)` bo'yicha."""
+
+    page_size = 20
+    max_page_size = 100
+    ordering = ("created_at", "id")
+
+
+class SearchPagination(PageNumberPagination):
+    """
+    Qidiruv natijalari rank bo'yicha tartiblanadi, `(created_at, id)` bo'yicha
+    emas — shuning uchun bu yerda oddiy sahifa raqami ishlatiladi.
+    """
+
+    page_size = 10
+    max_page_size = 50
+    page_size_query_param = "page_size"
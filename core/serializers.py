@@ -0,0 +1,62 @@
+from django.core.files.storage import default_storage
+from django.utils.text import Truncator
+from rest_framework import serializers
+
+from .images import srcset_map
+from .users import owner_summary
+
+SEARCH_EXCERPT_LENGTH = 200
+
+
+class SrcsetField(serializers.Field):
+    """
+    `*_variants` JSON'idan format -> srcset xaritasini qaytaradi, masalan
+    `{"avif": "https://.../a.320w.avif 320w, ...", "webp": "..."}`.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return srcset_map(value, self.context.get("request"))
+
+
+class OwnerSummaryField(serializers.Field):
+    """`{"id", "name", "avatar"}` — `select_related("owner").only(...)` bilan."""
+
+    def __init__(self, **kwargs):
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return owner_summary(value, self.context.get("request"))
+
+
+class SearchResultSerializer(serializers.Serializer):
+    """Post va project natijalari uchun umumiy, yengil ko'rinish."""
+
+    type = serializers.CharField()
+    uuid = serializers.UUIDField()
+    title = serializers.CharField()
+    excerpt = serializers.SerializerMethodField()
+    image = serializers.SerializerMethodField()
+    rank = serializers.FloatField()
+    created_at = serializers.DateTimeField()
+
+    def get_excerpt(self, obj):
+        return Truncator(obj["excerpt"] or "").chars(SEARCH_EXCERPT_LENGTH)
+
+    def get_image(self, obj):
+        if not obj["image"]:
+            return None
+        url = default_storage.url(obj["image"])
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request is not None else url
+
+
+class SimilarContentSerializer(serializers.Serializer):
+    type = serializers.CharField()
+    uuid = serializers.UUIDField()
+    title = serializers.CharField()
+    score = serializers.FloatField()
@@ -0,0 +1,40 @@
+from django.apps import apps
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+
+from .images import IMAGE_FIELDS, schedule_variants
+from .similarity import SOURCES, schedule_update
+from .tags import TAGGED_FIELDS, recount_deleted_tags, remember_tags, tags_changed
+
+
+def connect_signals():
+    for label in IMAGE_FIELDS:
+        post_save.connect(
+            schedule_variants,
+            sender=apps.get_model(label),
+            dispatch_uid=f"image-variants-{label}",
+        )
+
+    for label, (field, _) in TAGGED_FIELDS.items():
+        model = apps.get_model(label)
+        m2m_changed.connect(
+            tags_changed,
+            sender=getattr(model, field).through,
+            dispatch_uid=f"tag-usage-{label}",
+        )
+        pre_delete.connect(
+            remember_tags, sender=model, dispatch_uid=f"tag-usage-remember-{label}"
+        )
+        post_delete.connect(
+            recount_deleted_tags,
+            sender=model,
+            dispatch_uid=f"tag-usage-recount-{label}",
+        )
+
+    for label, _ in SOURCES.values():
+        model = apps.get_model(label)
+        post_save.connect(
+            schedule_update, sender=model, dispatch_uid=f"similarity-save-{label}"
+        )
+        post_delete.connect(
+            schedule_update, sender=model, dispatch_uid=f"similarity-delete-{label}"
+        )
@@ -0,0 +1,423 @@
+import re
+from collections import Counter
+from io import BytesIO
+
+import numpy as np
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from scipy import sparse
+
+from .models import SimilarContent, SimilarityIndex, SimilarityVector
+from .tasks import run_in_background
+
+# kind -> (model label, matn olinadigan maydonlar)
+SOURCES = {
+    "post": ("posts.Post", ("title", "content")),
+    "project": ("projects.Project", ("title", "description")),
+}
+
+# Faqat harflar (lotin/kirill, ʻ bilan), kamida 2 ta; raqamlar va belgilar tashlanadi
+TOKEN_RE = re.compile(r"[^\W\d_]{2,}")
+
+ROW_CHUNK = 512
+INDEX_PK = 1
+
+
+def get_limit():
+    return getattr(settings, "SIMILAR_CONTENT_LIMIT", 5)
+
+
+def get_min_score():
+    return getattr(settings, "SIMILAR_CONTENT_MIN_SCORE", 0.05)
+
+
+def tokenize(text):
+    return TOKEN_RE.findall((text or "").lower())
+
+
+def get_document(kind, pk):
+    label, fields = SOURCES[kind]
+    row = apps.get_model(label).objects.filter(pk=pk).values_list(*fields).first()
+    return None if row is None else " ".join(part or "" for part in row)
+
+
+def iter_documents():
+    for kind, (label, fields) in SOURCES.items():
+        queryset = (
+            apps.get_model(label)
+            .objects.order_by("pk")
+            .values_list("pk", *fields)
+            .iterator(chunk_size=500)
+        )
+        for pk, *parts in queryset:
+            yield (kind, pk), " ".join(part or "" for part in parts)
+
+
+def _l2_normalize(matrix):
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return sparse.diags(1 / norms) @ matrix
+
+
+class TfidfIndex:
+    """
+    Sublinear TF (`1 + log tf`) × smooth IDF, qatorlar L2 bo'yicha
+    normalizatsiya qilingan — shuning uchun cosine o'xshashlik shunchaki
+    `X @ X.T`. Matritsa `float32` CSR.
+    """
+
+    def __init__(self, keys, vocabulary, idf, matrix):
+        self.keys = list(keys)
+        self.positions = {key: i for i, key in enumerate(self.keys)}
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.matrix = matrix.tocsr()
+
+    @classmethod
+    def build(cls, documents):
+        keys, rows, cols, counts = [], [], [], []
+        vocabulary = {}
+        for i, (key, text) in enumerate(documents):
+            keys.append(key)
+            for term, count in Counter(tokenize(text)).items():
+                rows.append(i)
+                cols.append(vocabulary.setdefault(term, len(vocabulary)))
+                counts.append(count)
+
+        shape = (len(keys), len(vocabulary))
+        tf = sparse.csr_matrix(
+            (np.asarray(counts, dtype=np.float32), (rows, cols)), shape=shape
+        )
+        tf.data = 1 + np.log(tf.data)
+        df = np.bincount(tf.indices, minlength=shape[1])
+        idf = (np.log((1 + shape[0]) / (1 + df)) + 1).astype(np.float32)
+        matrix = _l2_normalize(tf @ sparse.diags(idf)).astype(np.float32)
+        return cls(keys, vocabulary, idf, matrix)
+
+    def vectorize(self, text):
+        """Mavjud lug'at bo'yicha bitta qator; yangi so'zlar keyingi to'liq build'gacha e'tiborsiz."""
+        counts = Counter(
+            self.vocabulary[term] for term in tokenize(text) if term in self.vocabulary
+        )
+        cols = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        tf = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+        data = (1 + np.log(tf)) * self.idf[cols]
+        row = sparse.csr_matrix(
+            (data, (np.zeros_like(cols), cols)), shape=(1, len(self.vocabulary))
+        )
+        return _l2_normalize(row).astype(np.float32).tocsr()
+
+    def upsert(self, key, vector):
+        position = self.positions.get(key)
+        if position is None:
+            self.matrix = sparse.vstack([self.matrix, vector], format="csr")
+            self.keys.append(key)
+            self.positions[key] = len(self.keys) - 1
+        else:
+            self.matrix = sparse.vstack(
+                [self.matrix[:position], vector, self.matrix[position + 1 :]],
+                format="csr",
+            )
+
+    def neighbours(self, positions, limit, min_score):
+        """
+        `positions` qatorlari uchun `{position: [(score, position), ...]}`.
+        O'xshashlik bloklab, zich `ROW_CHUNK × N` massivlarda hisoblanadi.
+        """
+        result = {}
+        positions = list(positions)
+        for start in range(0, len(positions), ROW_CHUNK):
+            chunk = positions[start : start + ROW_CHUNK]
+            scores = (self.matrix[chunk] @ self.matrix.T).toarray()
+            scores[np.arange(len(chunk)), chunk] = -1  # o'zi bilan o'xshashlik
+            k = min(limit, scores.shape[1] - 1)
+            if k <= 0:
+                result.update((position, []) for position in chunk)
+                continue
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            for row, position in enumerate(chunk):
+                picked = sorted(
+                    ((float(scores[row, j]), int(j)) for j in top[row]),
+                    reverse=True,
+                )
+                result[position] = [item for item in picked if item[0] >= min_score]
+        return result
+
+    def dumps(self):
+        """Lug'at va idf — qatorlar alohida `SimilarityVector` larda saqlanadi."""
+        buffer = BytesIO()
+        terms = sorted(self.vocabulary, key=self.vocabulary.get)
+        np.savez_compressed(buffer, terms=np.array(terms, dtype=str), idf=self.idf)
+        return buffer.getvalue()
+
+    @staticmethod
+    def load_vocabulary(raw):
+        """`dumps()` natijasidan `(vocabulary, idf)`."""
+        arrays = np.load(BytesIO(bytes(raw)))
+        vocabulary = {term: i for i, term in enumerate(arrays["terms"].tolist())}
+        return vocabulary, arrays["idf"]
+
+    @classmethod
+    def from_vectors(cls, vocabulary, idf, vectors):
+        """`vectors` — `(kind, id, terms, weights)` qatorlari (korpusning bir qismi ham bo'lishi mumkin)."""
+        keys, indptr, indices, data = [], [0], [], []
+        for kind, pk, terms, weights in vectors:
+            keys.append((kind, pk))
+            indices.extend(terms)
+            data.extend(weights)
+            indptr.append(len(indices))
+        matrix = sparse.csr_matrix(
+            (
+                np.asarray(data, dtype=np.float32),
+                np.asarray(indices, dtype=np.int32),
+                np.asarray(indptr, dtype=np.int64),
+            ),
+            shape=(len(keys), len(vocabulary)),
+        )
+        return cls(keys, vocabulary, idf, matrix)
+
+    def vector_row(self, key):
+        position = self.positions[key]
+        start, end = self.matrix.indptr[position], self.matrix.indptr[position + 1]
+        return SimilarityVector(
+            kind=key[0],
+            object_id=key[1],
+            terms=self.matrix.indices[start:end].tolist(),
+            weights=self.matrix.data[start:end].tolist(),
+        )
+
+
+def _rows_for(index, neighbours):
+    rows = []
+    for position, items in neighbours.items():
+        source_kind, source_id = index.keys[position]
+        for score, target in items:
+            target_kind, target_id = index.keys[target]
+            rows.append(
+                SimilarContent(
+                    source_kind=source_kind,
+                    source_id=source_id,
+                    target_kind=target_kind,
+                    target_id=target_id,
+                    score=score,
+                )
+            )
+    return rows
+
+
+def _source_q(keys):
+    condition = Q(pk__in=[])
+    for kind, pk in keys:
+        condition |= Q(source_kind=kind, source_id=pk)
+    return condition
+
+
+def _save_index(index):
+    """To'liq build: lug'at/idf blob'i va barcha qatorlar qaytadan yoziladi."""
+    SimilarityIndex.objects.update_or_create(
+        pk=INDEX_PK,
+        defaults={
+            "data": index.dumps(),
+            "documents": len(index.keys),
+            "terms": len(index.vocabulary),
+        },
+    )
+    SimilarityVector.objects.all().delete()
+    SimilarityVector.objects.bulk_create(
+        (index.vector_row(key) for key in index.keys), batch_size=1000
+    )
+
+
+# Jarayon ichidagi lug'at/idf nusxasi — faqat to'liq build (`updated_at`) almashtiradi
+_vocabulary_cache = {}
+
+
+def _load_vocabulary(stored):
+    cached = _vocabulary_cache.get(stored.pk)
+    if cached is None or cached[0] != stored.updated_at:
+        raw = SimilarityIndex.objects.values_list("data", flat=True).get(pk=stored.pk)
+        cached = (stored.updated_at, *TfidfIndex.load_vocabulary(raw))
+        _vocabulary_cache[stored.pk] = cached
+    return cached[1], cached[2]
+
+
+def _vector_q(keys):
+    condition = Q(pk__in=[])
+    for kind, pk in keys:
+        condition |= Q(kind=kind, object_id=pk)
+    return condition
+
+
+def _same_vector(vector, stored):
+    """Yangi qator saqlangan `(terms, weights)` bilan bir xilmi (float32 aniqligida)."""
+    terms, weights = stored
+    if sorted(terms) != sorted(vector.indices.tolist()):
+        return False
+    old = dict(zip(terms, weights))
+    return np.allclose(
+        vector.data, [old[term] for term in vector.indices.tolist()], atol=1e-6
+    )
+
+
+def build_index():
+    """Barcha post va project'lar bo'yicha indeksni noldan quradi va top-k ni yozadi."""
+    index = TfidfIndex.build(iter_documents())
+    neighbours = index.neighbours(range(len(index.keys)), get_limit(), get_min_score())
+    rows = _rows_for(index, neighbours)
+    with transaction.atomic():
+        SimilarContent.objects.all().delete()
+        SimilarContent.objects.bulk_create(rows, batch_size=1000)
+        _save_index(index)
+    return index
+
+
+def update_item(kind, pk):
+    """
+    Bitta element o'zgarganda (yoki o'chirilganda) butun korpus o'qilmaydi:
+    cosine faqat umumiy so'zi bor hujjatlar uchun noldan katta, shuning uchun
+    `terms && [...]` (GIN index) bilan faqat ular yuklanadi. Matn (vektor)
+    o'zgarmagan bo'lsa hech narsa yozilmaydi.
+
+    Ro'yxatlari to'liq qayta hisoblanadiganlar — element o'zi va uni
+    ro'yxatida tutganlar; ularning so'zlari ham so'rovga qo'shiladi. Element
+    yangi kira oladigan boshqa ro'yxatlar esa saqlangan ro'yxatga yangi ballni
+    qo'shib tuziladi — ularning qolgan juftliklari o'zgarmagan.
+    """
+    key = (kind, pk)
+    limit, min_score = get_limit(), get_min_score()
+    with transaction.atomic():
+        stored = (
+            SimilarityIndex.objects.select_for_update()
+            .only("pk", "updated_at")
+            .filter(pk=INDEX_PK)
+            .first()
+        )
+        if stored is None:
+            # Indeks hali qurilmagan — `build_similarity` komandasi kerak
+            return False
+        vocabulary, idf = _load_vocabulary(stored)
+        old = (
+            SimilarityVector.objects.filter(kind=kind, object_id=pk)
+            .values_list("terms", "weights")
+            .first()
+        )
+        text = get_document(kind, pk)
+        vector = None
+        if text is not None:
+            vector = TfidfIndex.from_vectors(vocabulary, idf, ()).vectorize(text)
+            if old is not None and _same_vector(vector, old):
+                return False
+
+        linked = set(
+            SimilarContent.objects.filter(target_kind=kind, target_id=pk).values_list(
+                "source_kind", "source_id"
+            )
+        )
+        terms = set() if vector is None else set(vector.indices.tolist())
+        for linked_terms in SimilarityVector.objects.filter(
+            _vector_q(linked)
+        ).values_list("terms", flat=True):
+            terms.update(linked_terms)
+        index = TfidfIndex.from_vectors(
+            vocabulary,
+            idf,
+            SimilarityVector.objects.filter(terms__overlap=sorted(terms))
+            .exclude(kind=kind, object_id=pk)
+            .values_list("kind", "object_id", "terms", "weights")
+            .iterator(chunk_size=2000),
+        )
+
+        exact, rows, entering = set(linked), [], set()
+        if vector is None:
+            SimilarityVector.objects.filter(kind=kind, object_id=pk).delete()
+            SimilarContent.objects.filter(
+                _source_q([key]) | Q(target_kind=kind, target_id=pk)
+            ).delete()
+            delta = -1 if old is not None else 0
+        else:
+            index.upsert(key, vector)
+            row = index.vector_row(key)
+            SimilarityVector.objects.update_or_create(
+                kind=kind,
+                object_id=pk,
+                defaults={"terms": row.terms, "weights": row.weights},
+            )
+            delta = 0 if old is not None else 1
+            exact.add(key)
+            scores = (index.matrix @ vector.T).toarray().ravel()
+            scores[index.positions[key]] = -1
+            candidates = {
+                index.keys[j] for j in np.flatnonzero(scores >= min_score).tolist()
+            }
+            entering, rows = _entering(candidates - exact, scores, index, key, limit)
+
+        neighbours = index.neighbours(
+            [index.positions[item] for item in exact if item in index.positions],
+            limit,
+            min_score,
+        )
+        rows.extend(_rows_for(index, neighbours))
+        SimilarContent.objects.filter(_source_q(exact | entering)).delete()
+        SimilarContent.objects.bulk_create(rows)
+        if delta:
+            SimilarityIndex.objects.filter(pk=INDEX_PK).update(
+                documents=F("documents") + delta
+            )
+    return True
+
+
+def _entering(candidates, scores, index, key, limit):
+    """
+    Element yangi ball bilan kimlarning top-k ro'yxatiga kiradi: ularning
+    saqlangan ro'yxati + yangi juftlik. `(o'zgargan source'lar, yangi qatorlar)`.
+    """
+    entering, rows = set(), []
+    if not candidates:
+        return entering, rows
+    current = {}
+    for source_kind, source_id, target_kind, target_id, score in (
+        SimilarContent.objects.filter(_source_q(candidates)).values_list(
+            "source_kind", "source_id", "target_kind", "target_id", "score"
+        )
+    ):
+        current.setdefault((source_kind, source_id), []).append(
+            (score, (target_kind, target_id))
+        )
+
+    for item in candidates:
+        items = current.get(item, [])
+        score = float(scores[index.positions[item]])
+        if len(items) >= limit and score <= min(items)[0]:
+            continue
+        entering.add(item)
+        for value, target in sorted(items + [(score, key)], reverse=True)[:limit]:
+            rows.append(
+                SimilarContent(
+                    source_kind=item[0],
+                    source_id=item[1],
+                    target_kind=target[0],
+                    target_id=target[1],
+                    score=value,
+                )
+            )
+    return entering, rows
+
+
+def schedule_update(sender, instance, **kwargs):
+    """
+    `post_save` / `post_delete` handler: qayta hisoblash fonda. Matn
+    maydonlari yozilmagan saqlashlar (`update_fields`) e'tiborsiz.
+    """
+    if kwargs.get("raw"):
+        return
+    kind, fields = next(
+        (kind, fields)
+        for kind, (label, fields) in SOURCES.items()
+        if label == sender._meta.label
+    )
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and not set(update_fields) & set(fields):
+        return
+    run_in_background(update_item, kind, instance.pk)
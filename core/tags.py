@@ -0,0 +1,53 @@
+from django.apps import apps
+
+# model label -> (tags.Tag ga M2M maydoni, Tag'dagi shu tur uchun hisoblagich)
+TAGGED_FIELDS = {
+    "posts.Post": ("tags", "post_count"),
+    "projects.Project": ("tags", "project_count"),
+}
+
+
+def get_tag_model(label):
+    field, _ = TAGGED_FIELDS[label]
+    return apps.get_model(label)._meta.get_field(field).related_model
+
+
+def recount_tags(tag_model, tag_ids):
+    if tag_ids:
+        tag_model.objects.filter(pk__in=tag_ids).recount_usage()
+
+
+def tags_changed(sender, instance, action, reverse, model, pk_set, **kwargs):
+    """
+    `m2m_changed` handler: `tags.set/add/remove/clear` dan keyin faqat
+    ta'sirlangan tag'larning hisoblagichi qayta hisoblanadi.
+    """
+    if reverse:
+        # tag.posts.add(...) — instance Tag'ning o'zi
+        if action in ("post_add", "post_remove", "post_clear"):
+            recount_tags(type(instance), {instance.pk})
+        return
+
+    if action == "pre_clear":
+        instance._cleared_tag_ids = _tag_ids(instance)
+    elif action in ("post_add", "post_remove"):
+        recount_tags(model, pk_set)
+    elif action == "post_clear":
+        recount_tags(model, getattr(instance, "_cleared_tag_ids", None))
+
+
+def remember_tags(sender, instance, **kwargs):
+    """`pre_delete`: cascade through qatorlarini o'chirishidan oldin tag'larni eslab qoladi."""
+    instance._deleted_tag_ids = _tag_ids(instance)
+
+
+def recount_deleted_tags(sender, instance, **kwargs):
+    recount_tags(
+        get_tag_model(sender._meta.label),
+        getattr(instance, "_deleted_tag_ids", None),
+    )
+
+
+def _tag_ids(instance):
+    field, _ = TAGGED_FIELDS[instance._meta.label]
+    return set(getattr(instance, field).values_list("pk", flat=True))
@@ -0,0 +1,66 @@
+import atexit
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections, transaction
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, "BACKGROUND_TASK_WORKERS", 2),
+            thread_name_prefix="background-task",
+        )
+        atexit.register(_executor.shutdown, wait=True)
+    return _executor
+
+
+def _run(func, args, kwargs):
+    try:
+        func(*args, **kwargs)
+    except Exception:
+        logger.exception("Background task %s failed", func.__qualname__)
+    finally:
+        # Worker thread o'z DB connection'ini ochib qo'ymasin
+        connections.close_all()
+
+
+def run_in_background(func, *args, **kwargs):
+    """
+    `func` ni request yo'lidan tashqarida, joriy tranzaksiya commit
+    bo'lgandan keyin worker thread'da bajaradi. Broker kerak emas: ish
+    jarayon ichida, kichik ThreadPoolExecutor orqali bajariladi.
+
+    `BACKGROUND_TASKS_EAGER = True` bo'lsa (management komandalar, testlar)
+    darhol, shu thread'da bajariladi.
+    """
+    if getattr(settings, "BACKGROUND_TASKS_EAGER", False):
+        transaction.on_commit(lambda: func(*args, **kwargs))
+        return
+    transaction.on_commit(lambda: _get_executor().submit(_run, func, args, kwargs))
+
+
+async def run_in_thread(func, *args, **kwargs):
+    """
+    Sync `func` ni alohida thread'da, o'z DB connection'i bilan bajaradi.
+
+    Django async ORM (va oddiy `sync_to_async`) so'rovlarni bitta umumiy
+    thread'da navbat bilan bajaradi; mustaqil so'rovlarni `asyncio.gather`
+    bilan haqiqatan parallel yuborish uchun `thread_sensitive=False` kerak.
+    Connection oxirida yopiladi — ASGI rejimida u psycopg pool'iga qaytadi.
+    """
+
+    def call():
+        try:
+            return func(*args, **kwargs)
+        finally:
+            connections.close_all()
+
+    return await sync_to_async(call, thread_sensitive=False)()
@@ -0,0 +1,653 @@
+import json
+import shutil
+import tempfile
+import time
+import uuid
+import zlib
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.conf import settings
+from django.core import serializers
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
+
+from posts.models import Post, PostComment, PostLike
+from projects.models import Project
+from projects.tests import create_project
+from home.cache import home_content
+from home.models import Home
+from tags.models import Tag
+from .export import iter_ndjson
+from .images import build_variants
+from .importer import ContentImporter
+from .likes import LikeBuffer
+from .throttling import LocalBuckets
+from .trending import refresh_trending
+from .utils import get_client_ip
+from .models import SimilarContent, SimilarityIndex, SimilarityVector
+from .similarity import (
+    TfidfIndex,
+    build_index,
+    get_limit,
+    get_min_score,
+    update_item,
+)
+
+
+@override_settings(LIKE_BUFFER_SIZE=100, LIKE_BUFFER_INTERVAL=3600)
+class LikeBufferTests(TestCase):
+    ip = "10.0.2.1"
+
+    def setUp(self):
+        self.post = Post.objects.create(title="Likes", content="Body")
+        self.buffer = LikeBuffer("posts.PostLike", "post")
+        self.addCleanup(self.buffer.flush)
+
+    def liked(self):
+        return PostLike.objects.filter(post=self.post, ip_address=self.ip).exists()
+
+    def likes_count(self):
+        self.post.refresh_from_db()
+        return self.post.likes_count
+
+    def test_toggle_reads_its_own_buffered_state(self):
+        self.assertTrue(self.buffer.toggle(self.post.pk, self.ip))
+        self.assertFalse(self.liked())
+        self.assertFalse(self.buffer.toggle(self.post.pk, self.ip))
+
+    def test_toggle_toggle_flush_writes_nothing(self):
+        self.buffer.toggle(self.post.pk, self.ip)
+        self.buffer.toggle(self.post.pk, self.ip)
+        self.assertEqual(self.buffer.flush(), 1)
+        self.assertFalse(self.liked())
+        self.assertEqual(self.likes_count(), 0)
+
+    def test_flush_writes_likes_and_unlikes(self):
+        PostLike.objects.create(post=self.post, ip_address="10.0.2.2")
+        Post.objects.filter(pk=self.post.pk).update(likes_count=1)
+        self.buffer.toggle(self.post.pk, self.ip)
+        self.buffer.toggle(self.post.pk, "10.0.2.2")
+        self.assertEqual(self.buffer.flush(), 2)
+        self.assertEqual(
+            list(PostLike.objects.values_list("ip_address", flat=True)), [self.ip]
+        )
+        self.assertEqual(self.likes_count(), 1)
+
+    def test_counter_follows_rows_actually_written(self):
+        # Boshqa worker allaqachon yozgan like va mavjud bo'lmagan unlike
+        # hisoblagichni o'zgartirmaydi
+        PostLike.objects.create(post=self.post, ip_address=self.ip)
+        Post.objects.filter(pk=self.post.pk).update(likes_count=1)
+        self.buffer._pending = {
+            (self.post.pk, self.ip): True,
+            (self.post.pk, "10.0.2.3"): False,
+        }
+        self.buffer.flush()
+        self.assertEqual(self.likes_count(), 1)
+
+    def test_likes_on_deleted_targets_are_dropped(self):
+        gone = Post.objects.create(title="Gone", content="Body")
+        self.buffer.toggle(gone.pk, self.ip)
+        gone.delete()
+        self.buffer.flush()
+        self.assertFalse(PostLike.objects.exists())
+
+    @override_settings(LIKE_BUFFER_SIZE=0)
+    def test_unbuffered_click_does_not_recount(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.buffer.toggle(self.post.pk, self.ip)
+        statements = [
+            query["sql"].split()[0]
+            for query in queries.captured_queries
+            if "SAVEPOINT" not in query["sql"]
+        ]
+        self.assertEqual(statements, ["SELECT", "INSERT", "UPDATE"])
+        self.assertEqual(self.likes_count(), 1)
+
+    def test_failed_flush_keeps_intents(self):
+        self.buffer.toggle(self.post.pk, self.ip)
+        with mock.patch.object(LikeBuffer, "_write", side_effect=RuntimeError):
+            with self.assertLogs("core.likes", "ERROR"):
+                self.assertEqual(self.buffer.flush(), 0)
+        # Niyat buferga qaytgan: keyingi flush uni yozadi
+        self.assertEqual(self.buffer.flush(), 1)
+        self.assertTrue(self.liked())
+        self.assertEqual(self.likes_count(), 1)
+
+    def test_failed_flush_does_not_override_newer_intent(self):
+        self.buffer.toggle(self.post.pk, self.ip)
+
+        def write_then_fail(pending):
+            # Flush davomida shu IP yana bosdi
+            self.buffer.toggle(self.post.pk, self.ip)
+            raise RuntimeError
+
+        with mock.patch.object(self.buffer, "_write", side_effect=write_then_fail):
+            with self.assertLogs("core.likes", "ERROR"):
+                self.buffer.flush()
+        self.buffer.flush()
+        self.assertFalse(self.liked())
+
+
+class SimilarityUpdateTests(TestCase):
+    def setUp(self):
+        texts = {
+            "api": ("Alpha", "django rest framework api serializers"),
+            "orm": ("Beta", "django orm queries api"),
+            "pasta": ("Gamma", "cooking pasta recipes tomato"),
+            "sauce": ("Delta", "pasta tomato sauce cooking"),
+        }
+        self.posts = {
+            name: Post.objects.create(title=title, content=content)
+            for name, (title, content) in texts.items()
+        }
+        build_index()
+
+    def neighbours(self, name):
+        return set(
+            SimilarContent.objects.filter(
+                source_kind="post", source_id=self.posts[name].pk
+            ).values_list("target_id", flat=True)
+        )
+
+    def vectors(self):
+        return {
+            object_id: (terms, weights)
+            for object_id, terms, weights in SimilarityVector.objects.values_list(
+                "object_id", "terms", "weights"
+            )
+        }
+
+    def test_update_rewrites_only_the_item_vector(self):
+        blob = bytes(SimilarityIndex.objects.get().data)
+        before = self.vectors()
+        pasta = self.posts["pasta"]
+        pasta.content = "django api serializers framework"
+        pasta.save()
+
+        self.assertTrue(update_item("post", pasta.pk))
+        after = self.vectors()
+        self.assertEqual(bytes(SimilarityIndex.objects.get().data), blob)
+        self.assertNotEqual(after.pop(pasta.pk), before.pop(pasta.pk))
+        self.assertEqual(after, before)
+        self.assertIn(pasta.pk, self.neighbours("api"))
+        self.assertNotIn(pasta.pk, self.neighbours("sauce"))
+
+    def test_delete_removes_vector_and_links(self):
+        sauce = self.posts["sauce"]
+        self.assertIn(sauce.pk, self.neighbours("pasta"))
+        sauce_pk = sauce.pk
+        sauce.delete()
+
+        update_item("post", sauce_pk)
+        self.assertFalse(SimilarityVector.objects.filter(object_id=sauce_pk).exists())
+        self.assertNotIn(sauce_pk, self.neighbours("pasta"))
+        self.assertEqual(SimilarityIndex.objects.get().documents, 3)
+
+    def test_unchanged_text_is_skipped(self):
+        post = self.posts["api"]
+        with mock.patch("core.similarity.run_in_background") as schedule:
+            post.trending_score = 5
+            post.save(update_fields=["trending_score"])
+            schedule.assert_not_called()
+            post.save(update_fields=["content"])
+            schedule.assert_called_once_with(update_item, "post", post.pk)
+        before = set(SimilarContent.objects.values_list("pk", flat=True))
+        post.save()
+        self.assertFalse(update_item("post", post.pk))
+        self.assertEqual(set(SimilarContent.objects.values_list("pk", flat=True)), before)
+
+    def test_update_reads_only_overlapping_vectors(self):
+        other = Post.objects.create(title="Zeta", content="gardening flowers soil")
+        build_index()
+        pasta = self.posts["pasta"]
+        pasta.content = "django api serializers framework"
+        pasta.save()
+
+        with mock.patch.object(
+            TfidfIndex, "neighbours", autospec=True, side_effect=TfidfIndex.neighbours
+        ) as neighbours:
+            update_item("post", pasta.pk)
+        index = neighbours.call_args.args[0]
+        self.assertIn(("post", self.posts["api"].pk), index.positions)
+        self.assertNotIn(("post", other.pk), index.positions)
+
+        # Natija to'liq qayta hisoblash bilan bir xil (saqlangan lug'at bo'yicha)
+        stored = SimilarityIndex.objects.get()
+        vocabulary, idf = TfidfIndex.load_vocabulary(stored.data)
+        full = TfidfIndex.from_vectors(
+            vocabulary,
+            idf,
+            SimilarityVector.objects.values_list("kind", "object_id", "terms", "weights"),
+        )
+        expected = {
+            (full.keys[source][1], full.keys[target][1])
+            for source, items in full.neighbours(
+                range(len(full.keys)), get_limit(), get_min_score()
+            ).items()
+            for _, target in items
+        }
+        self.assertEqual(
+            set(SimilarContent.objects.values_list("source_id", "target_id")), expected
+        )
+
+
+class SearchTests(TestCase):
+    url = reverse("core:search")
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.post = Post.objects.create(
+            title="Django caching", content="Caching django views with redis"
+        )
+        Post.objects.create(title="Flask notes", content="Routing in flask")
+        cls.project = create_project(
+            title="Shop", description="Online shop built with django"
+        )
+
+    def search(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return [(item["type"], item["uuid"]) for item in response.json()["results"]]
+
+    def test_matches_posts_and_projects_by_rank(self):
+        self.assertEqual(
+            self.search(q="django"),
+            [("post", str(self.post.uuid)), ("project", str(self.project.uuid))],
+        )
+
+    def test_type_and_websearch_syntax(self):
+        self.assertEqual(
+            self.search(q="django", type="project"),
+            [("project", str(self.project.uuid))],
+        )
+        self.assertEqual(
+            self.search(q="django -redis"), [("project", str(self.project.uuid))]
+        )
+        self.assertEqual(len(self.search(q="flask or shop")), 2)
+
+    def test_invalid_params_are_400(self):
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+        response = self.client.get(self.url, {"q": "django", "type": "tag"})
+        self.assertEqual(response.status_code, 400)
+
+
+class ExportTests(TestCase):
+    url = reverse("core:export")
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = get_user_model().objects.create_superuser(
+            username="admin", password="x"
+        )
+        tag = Tag.objects.create(name="django")
+        for i in range(5):
+            post = Post.objects.create(title=f"Post {i}", content="Body")
+            post.tags.add(tag)
+
+    def test_admin_only(self):
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+    def test_streams_loadable_ndjson(self):
+        self.client.force_login(self.admin)
+        response = self.client.get(self.url, {"model": ["tags.Tag", "posts.Post"]})
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        body = b"".join(response.streaming_content).decode()
+        records = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([r["model"] for r in records], ["tags.tag"] + ["posts.post"] * 5)
+        self.assertNotIn("search_vector", records[1]["fields"])
+        self.assertEqual(records[1]["fields"]["tags"], [records[0]["pk"]])
+        objects = list(serializers.deserialize("jsonl", body))
+        self.assertEqual(len(objects), 6)
+
+    def test_gzip_matches_plain_stream(self):
+        self.client.force_login(self.admin)
+        plain = b"".join(self.client.get(self.url).streaming_content)
+        response = self.client.get(self.url, {"gzip": "1"})
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        self.assertTrue(response["Content-Disposition"].endswith('.ndjson.gz"'))
+        compressed = b"".join(response.streaming_content)
+        self.assertEqual(zlib.decompress(compressed, zlib.MAX_WBITS | 16), plain)
+
+    def test_chunks_cover_every_row(self):
+        chunks = list(iter_ndjson(["posts.Post"], chunk_size=2))
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual("".join(chunks).count("\n"), 5)
+
+    def test_unknown_model_is_400(self):
+        self.client.force_login(self.admin)
+        response = self.client.get(self.url, {"model": "auth.User"})
+        self.assertEqual(response.status_code, 400)
+
+
+class ImportTests(TestCase):
+    def setUp(self):
+        get_user_model().objects.create_user(username="owner", password="x")
+        self.post_uuid, self.project_uuid = uuid.uuid4(), uuid.uuid4()
+
+    def lines(self, title="First", tags=("django", "api")):
+        records = [
+            {
+                "type": "post",
+                "uuid": str(self.post_uuid),
+                "title": title,
+                "content": "**Body**",
+                "tags": list(tags),
+                "created_at": "2024-05-01T10:00:00+00:00",
+            },
+            {
+                "type": "project",
+                "uuid": str(self.project_uuid),
+                "title": title,
+                "description": "Description",
+                "owner": "owner",
+                "tags": ["django"],
+            },
+            "not json",
+        ]
+        return [r if isinstance(r, str) else json.dumps(r) for r in records]
+
+    def test_reimport_updates_by_uuid(self):
+        first = ContentImporter().run(self.lines())
+        self.assertEqual((first.created, first.updated, first.skipped), (2, 0, 1))
+
+        second = ContentImporter().run(self.lines(title="Renamed", tags=["api"]))
+        self.assertEqual((second.created, second.updated), (0, 2))
+        self.assertEqual(Post.objects.count(), 1)
+        self.assertEqual(Project.objects.count(), 1)
+
+        post = Post.objects.get(uuid=self.post_uuid)
+        self.assertEqual(post.title, "Renamed")
+        self.assertEqual(post.content_html, "<p><strong>Body</strong></p>")
+        self.assertEqual(post.created_at.year, 2024)
+        self.assertEqual(list(post.tags.values_list("name", flat=True)), ["api"])
+        counts = dict(Tag.objects.values_list("name", "post_count"))
+        self.assertEqual(counts, {"django": 0, "api": 1})
+        self.assertEqual(Tag.objects.get(name="django").project_count, 1)
+
+    def test_duplicate_uuid_in_one_batch_keeps_last(self):
+        lines = self.lines()[:1] + self.lines(title="Second")[:1]
+        stats = ContentImporter().run(lines)
+        self.assertEqual((stats.created, stats.skipped), (1, 1))
+        self.assertEqual(Post.objects.get().title, "Second")
+
+    def test_invalid_fields_are_reported_per_record(self):
+        post = json.loads(self.lines()[0])
+        bad = [
+            {**post, "uuid": str(uuid.uuid4()), "title": "x" * 256},
+            {**post, "uuid": str(uuid.uuid4()), "tags": ["t" * 51]},
+            {**post, "uuid": str(uuid.uuid4()), "created_at": 1714557600},
+            {**post, "uuid": str(uuid.uuid4()), "created_at": "2024-05-01T10:00:00"},
+            {**post, "uuid": str(uuid.uuid4()), "created_at": "2024-13-01T10:00:00Z"},
+        ]
+        stats = ContentImporter().run(
+            [json.dumps(record) for record in bad] + self.lines()[:1]
+        )
+        self.assertEqual((stats.created, stats.skipped), (1, len(bad)))
+        self.assertEqual(
+            [error.split(":")[0] for error in stats.errors],
+            [f"{number}-satr" for number in range(1, len(bad) + 1)],
+        )
+        self.assertEqual(Post.objects.get().uuid, self.post_uuid)
+
+
+class ClientIpTests(SimpleTestCase):
+    def ip(self, forwarded=None):
+        headers = {"HTTP_X_FORWARDED_FOR": forwarded} if forwarded else {}
+        return get_client_ip(
+            RequestFactory().get("/", REMOTE_ADDR="10.9.9.9", **headers)
+        )
+
+    def test_header_ignored_by_default(self):
+        # Proxy'siz: sarlavhani mijoz o'zi yozadi
+        self.assertEqual(self.ip("1.1.1.1"), "10.9.9.9")
+
+    @override_settings(TRUSTED_PROXY_COUNT=1)
+    def test_uses_hop_added_by_trusted_proxy(self):
+        # Mijoz "1.1.1.1" ni o'zi yozgan, nginx haqiqiy manzilni oxiriga qo'shgan
+        self.assertEqual(self.ip("1.1.1.1, 203.0.113.7"), "203.0.113.7")
+        self.assertEqual(self.ip("203.0.113.7"), "203.0.113.7")
+        self.assertEqual(self.ip(), "10.9.9.9")
+
+    @override_settings(TRUSTED_PROXY_COUNT=2)
+    def test_counts_hops_from_the_right(self):
+        self.assertEqual(self.ip("1.1.1.1, 203.0.113.7, 10.0.0.2"), "203.0.113.7")
+
+
+class ThrottleTests(TestCase):
+    def setUp(self):
+        self.post = Post.objects.create(title="Throttle", content="Body")
+        self.url = reverse("posts:post-comment-list-create", args=[self.post.uuid])
+        rates = {
+            **settings.REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"],
+            "comments": "2/min",
+        }
+        override = override_settings(
+            REST_FRAMEWORK={**settings.REST_FRAMEWORK, "DEFAULT_THROTTLE_RATES": rates}
+        )
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def post_comment(self, ip, forwarded=None):
+        headers = {"HTTP_X_FORWARDED_FOR": forwarded} if forwarded else {}
+        return self.client.post(self.url, {"content": "Hi"}, REMOTE_ADDR=ip, **headers)
+
+    def test_burst_then_429_with_retry_after(self):
+        ip = "198.51.100.1"
+        self.assertEqual(self.post_comment(ip).status_code, 201)
+        self.assertEqual(self.post_comment(ip).status_code, 201)
+        response = self.post_comment(ip)
+        self.assertEqual(response.status_code, 429)
+        # 2/min: bitta token 30 soniyada to'ladi
+        self.assertTrue(0 < int(response["Retry-After"]) <= 30)
+        # Boshqa IP o'z bucket'ini oladi, o'qish esa cheklanmaydi
+        self.assertEqual(self.post_comment("198.51.100.2").status_code, 201)
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+    def test_forwarded_for_is_ignored_without_proxy(self):
+        # To'g'ridan-to'g'ri ulanish: har so'rovda yangi sarlavha bucket bermaydi
+        for spoofed in ("1.1.1.1", "2.2.2.2", "3.3.3.3"):
+            response = self.post_comment("198.51.100.3", spoofed)
+        self.assertEqual(response.status_code, 429)
+
+    @override_settings(TRUSTED_PROXY_COUNT=1)
+    def test_behind_proxy_spoofed_hops_share_the_bucket(self):
+        # nginx (10.0.0.1) haqiqiy manzilni mijoz yozgan qiymatlar oxiriga qo'shadi
+        for spoofed in ("1.1.1.1", "2.2.2.2", "3.3.3.3"):
+            response = self.post_comment("10.0.0.1", f"{spoofed}, 198.51.100.4")
+        self.assertEqual(response.status_code, 429)
+
+    def test_local_buckets_evict_least_recently_used(self):
+        buckets = LocalBuckets()
+        with mock.patch("core.throttling.MAX_LOCAL_BUCKETS", 2):
+            buckets.take("a", 1, 1, now=0)
+            buckets.take("b", 1, 1, now=0)
+            buckets.take("a", 1, 1, now=0)
+            buckets.take("c", 1, 1, now=0)
+        self.assertEqual(list(buckets._buckets), ["a", "c"])
+
+
+@override_settings(TRENDING_HALF_LIFE_HOURS=1)
+class TrendingTests(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        self.quiet, self.busy = (
+            Post.objects.create(title=title, content="Body") for title in ("Q", "B")
+        )
+
+    def event(self, model, post, hours_ago, **fields):
+        obj = model.objects.create(post=post, **fields)
+        model.objects.filter(pk=obj.pk).update(
+            created_at=self.now - timedelta(hours=hours_ago)
+        )
+
+    def scores(self):
+        return dict(Post.objects.values_list("pk", "trending_score"))
+
+    def test_incremental_refresh_matches_full(self):
+        self.event(PostLike, self.quiet, 3, ip_address="10.0.3.1")
+        self.event(PostComment, self.busy, 2, content="c")
+        refresh_trending("posts.Post", now=self.now - timedelta(hours=1))
+        self.event(PostLike, self.busy, 0.5, ip_address="10.0.3.2")
+        self.event(PostLike, self.busy, 0, ip_address="10.0.3.3")
+
+        refresh_trending("posts.Post", now=self.now)
+        incremental = self.scores()
+        refresh_trending("posts.Post", now=self.now, full=True)
+        for pk, score in self.scores().items():
+            self.assertAlmostEqual(incremental[pk], score, places=6)
+        # like 3 soat oldin: 1 * 0.5**3; comment 2 soat oldin: 2 * 0.5**2 + ...
+        self.assertAlmostEqual(incremental[self.quiet.pk], 0.125, places=6)
+        self.assertAlmostEqual(incremental[self.busy.pk], 0.5 + 2**-0.5 + 1, places=6)
+
+    @override_settings(TRENDING_SETTLE_SECONDS=60)
+    def test_late_commit_is_counted_next_run(self):
+        with mock.patch("core.trending.timezone.now", return_value=self.now):
+            refresh_trending("posts.Post")
+        # Ishga tushirishdan 30 soniya oldin yaratilgan, undan keyin commit bo'lgan
+        self.event(PostLike, self.busy, 30 / 3600, ip_address="10.0.3.6")
+        later = self.now + timedelta(minutes=5)
+        refresh_trending("posts.Post", now=later)
+        incremental = self.scores()
+        refresh_trending("posts.Post", now=later, full=True)
+        self.assertAlmostEqual(incremental[self.busy.pk], self.scores()[self.busy.pk])
+        self.assertGreater(incremental[self.busy.pk], 0)
+
+    def test_event_scan_uses_created_at_index(self):
+        # Kichik jadvalda planner seq scan'ni tanlaydi — index mavjudligi tekshiriladi
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        plan = (
+            PostLike.objects.filter(created_at__gt=self.now)
+            .values_list("post_id", "created_at")
+            .explain()
+        )
+        self.assertIn("postlike_created_idx", plan)
+
+    def test_endpoint_orders_by_score(self):
+        self.event(PostLike, self.quiet, 1, ip_address="10.0.3.4")
+        self.event(PostLike, self.busy, 0, ip_address="10.0.3.5")
+        refresh_trending("posts.Post", now=self.now)
+        data = self.client.get(reverse("posts:post-trending"), {"limit": 1}).json()
+        self.assertEqual([item["uuid"] for item in data], [str(self.busy.uuid)])
+
+
+@override_settings(CACHE_VERSION_TIMEOUT=60)
+class SingletonCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.home = Home.objects.create(hero_text="First")
+
+    def hero_text(self):
+        return home_content.get().hero_text
+
+    def test_reads_after_first_load_cost_no_queries(self):
+        self.assertEqual(self.hero_text(), "First")
+        with self.assertNumQueries(0):
+            self.assertEqual(self.hero_text(), "First")
+
+    def test_save_reloads_on_commit(self):
+        self.hero_text()
+        self.home.hero_text = "Second"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.home.save()
+        self.assertEqual(self.hero_text(), "Second")
+
+    def test_unshared_cache_reloads_after_version_timeout(self):
+        # Boshqa worker'dagi yozuv: bu jarayonning LocMem versiyasi almashmaydi
+        self.hero_text()
+        Home.objects.filter(pk=self.home.pk).update(hero_text="Elsewhere")
+        self.assertEqual(self.hero_text(), "First")
+        later = time.time() + 61
+        with mock.patch(
+            "django.core.cache.backends.locmem.time.time", return_value=later
+        ):
+            self.assertEqual(self.hero_text(), "Elsewhere")
+
+
+class MediaTests(TestCase):
+    def setUp(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        override = override_settings(MEDIA_ROOT=root, MEDIA_ACCEL="")
+        override.enable()
+        self.addCleanup(override.disable)
+        with open(f"{root}/file.txt", "wb") as fh:
+            fh.write(b"0123456789")
+        with open(f"{root}/notes.txt.gz", "wb") as fh:
+            fh.write(b"\x1f\x8b")
+        self.url = f"{settings.MEDIA_URL}file.txt"
+
+    def body(self, response):
+        return b"".join(response.streaming_content)
+
+    def test_full_file_with_validators(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.body(response), b"0123456789")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        again = self.client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(again.status_code, 304)
+
+    def test_single_ranges_are_206(self):
+        for header, body, content_range in [
+            ("bytes=2-4", b"234", "bytes 2-4/10"),
+            ("bytes=7-", b"789", "bytes 7-9/10"),
+            ("bytes=-3", b"789", "bytes 7-9/10"),
+            ("bytes=8-100", b"89", "bytes 8-9/10"),
+        ]:
+            with self.subTest(header=header):
+                response = self.client.get(self.url, HTTP_RANGE=header)
+                self.assertEqual(response.status_code, 206)
+                self.assertEqual(self.body(response), body)
+                self.assertEqual(response["Content-Range"], content_range)
+
+    def test_unsatisfiable_range_is_416(self):
+        response = self.client.get(self.url, HTTP_RANGE="bytes=10-")
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], "bytes */10")
+
+    def test_stale_if_range_sends_full_file(self):
+        response = self.client.get(
+            self.url, HTTP_RANGE="bytes=0-1", HTTP_IF_RANGE='"stale"'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.body(response), b"0123456789")
+
+    def test_compressed_upload_is_not_content_encoded(self):
+        response = self.client.get(f"{settings.MEDIA_URL}notes.txt.gz")
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_missing_and_traversal_are_404(self):
+        for path in ("missing.txt", "../settings.py"):
+            with self.subTest(path=path):
+                response = self.client.get(f"{settings.MEDIA_URL}{path}")
+                self.assertEqual(response.status_code, 404)
+
+    @override_settings(IMAGE_VARIANT_WIDTHS=(8,), IMAGE_VARIANT_FORMATS=("webp",))
+    def test_rebuilt_variants_get_new_names(self):
+        post = Post.objects.create(title="Image", content="Body")
+        post.image.save("cover.png", ContentFile(b""), save=False)
+        Post.objects.filter(pk=post.pk).update(image=post.image.name)
+
+        def rebuild(color):
+            # Manba fayl joyida almashtiriladi — nomi o'zgarmaydi
+            Image.new("RGB", (16, 16), color).save(post.image.path, format="PNG")
+            build_variants("posts.Post", post.pk, force=True)
+            post.refresh_from_db()
+            return post.image_variants["formats"]["webp"]["8"]
+
+        red = rebuild("red")
+        self.assertEqual(rebuild("red"), red)
+        blue = rebuild("blue")
+        self.assertNotEqual(blue, red)
+        self.assertFalse(post.image.storage.exists(red))
@@ -0,0 +1,115 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+from .utils import get_client_ip
+
+DURATIONS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+# Jarayon ichidagi bucket'lar shu sondan oshsa, eng uzoq ishlatilmagani (LRU)
+# tashlanadi — u odatda allaqachon to'la, ya'ni yangisidan farqi yo'q
+MAX_LOCAL_BUCKETS = 10_000
+
+
+def parse_rate(rate):
+    """`"30/min"` -> `(30, 60)`: bucket sig'imi va to'liq to'lish davri (soniya)."""
+    capacity, period = rate.split("/")
+    return int(capacity), DURATIONS[period[0]]
+
+
+class LocalBuckets:
+    """
+    Jarayon ichidagi bucket'lar: bitta lock va bir necha arifmetik amal.
+    `OrderedDict` oxirgi ishlatilish tartibida — chiqarish O(1).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = OrderedDict()
+
+    def take(self, key, capacity, refill_rate, now):
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * refill_rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > MAX_LOCAL_BUCKETS:
+                self._buckets.popitem(last=False)
+            return allowed, tokens
+
+
+class CacheBuckets:
+    """
+    Django cache orqali umumiy bucket'lar (bir nechta worker/server uchun).
+    `get`/`set` atomik emas: parallel so'rovlarda bir-ikki token ortiqcha
+    o'tishi mumkin — throttling uchun bu yetarli.
+    """
+
+    def __init__(self, alias):
+        self.cache = caches[alias]
+
+    def take(self, key, capacity, refill_rate, now):
+        tokens, updated = self.cache.get(key) or (capacity, now)
+        tokens = min(capacity, tokens + (now - updated) * refill_rate)
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        timeout = int((capacity - tokens) / refill_rate) + 1
+        self.cache.set(key, (tokens, now), timeout)
+        return allowed, tokens
+
+
+_local_buckets = LocalBuckets()
+
+
+def get_buckets():
+    alias = getattr(settings, "THROTTLE_CACHE_ALIAS", None)
+    return CacheBuckets(alias) if alias else _local_buckets
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    IP bo'yicha token bucket. Sig'im va to'lish tezligi view'ning
+    `throttle_scope` i uchun `DEFAULT_THROTTLE_RATES` dan olinadi
+    (`"30/min"` — 30 tagacha burst, daqiqasiga 30 token). Faqat yozuvchi
+    metodlar cheklanadi: comment thread'ini o'qish erkin.
+    """
+
+    methods = ("POST", "PUT", "PATCH", "DELETE")
+    # Cache backend'da bir nechta jarayon bo'lgani uchun monotonic emas, wall clock
+    timer = time.time
+
+    def __init__(self):
+        self.wait_seconds = None
+
+    def get_rate(self, view):
+        scope = getattr(view, "throttle_scope", None)
+        try:
+            return scope, api_settings.DEFAULT_THROTTLE_RATES[scope]
+        except KeyError:
+            raise ImproperlyConfigured(f"No throttle rate set for scope {scope!r}")
+
+    def allow_request(self, request, view):
+        if request.method not in self.methods:
+            return True
+        scope, rate = self.get_rate(view)
+        if rate is None:
+            return True
+
+        capacity, period = parse_rate(rate)
+        refill_rate = capacity / period
+        key = f"throttle:{scope}:{get_client_ip(request)}"
+        allowed, tokens = get_buckets().take(key, capacity, refill_rate, self.timer())
+        if not allowed:
+            self.wait_seconds = (1 - tokens) / refill_rate
+        return allowed
+
+    def wait(self):
+        return self.wait_seconds
@@ -0,0 +1,120 @@
+from collections import defaultdict
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, F, FloatField, Value, When
+from django.utils import timezone
+
+from .models import TrendingState
+
+# model label -> [(hodisa modeli, FK nomi, vazn sozlamasi kaliti)]
+TRENDING_SOURCES = {
+    "posts.Post": [
+        ("posts.PostLike", "post", "like"),
+        ("posts.PostComment", "post", "comment"),
+    ],
+    "projects.Project": [
+        ("projects.ProjectLike", "project", "like"),
+        ("projects.ProjectComment", "project", "comment"),
+    ],
+}
+
+# Shundan kichik ballar 0 ga tushiriladi — decay UPDATE'i faqat "tirik" qatorlarga tegadi
+EPSILON = 1e-3
+# Birinchi (yoki --full) hisobda nechta yarim yemirilish davri orqaga qaraladi
+FULL_WINDOW_HALF_LIVES = 10
+UPDATE_BATCH_SIZE = 500
+
+
+def get_half_life():
+    hours = getattr(settings, "TRENDING_HALF_LIFE_HOURS", 48)
+    return hours * 3600
+
+
+def get_weights():
+    return {"like": 1.0, "comment": 2.0, **getattr(settings, "TRENDING_WEIGHTS", {})}
+
+
+def trending_cutoff():
+    """
+    Hodisalar shu vaqtgacha qo'shiladi: `created_at` INSERT'dan oldin
+    qo'yiladi, tranzaksiya esa keyinroq commit bo'lishi mumkin. Oxirgi
+    `TRENDING_SETTLE_SECONDS` keyingi ishga tushirishga qoldiriladi, aks
+    holda kech commit bo'lgan hodisa oynadan tushib qolardi.
+    """
+    settle = getattr(settings, "TRENDING_SETTLE_SECONDS", 60)
+    return timezone.now() - timedelta(seconds=settle)
+
+
+def decay_factor(seconds):
+    return 0.5 ** (seconds / get_half_life())
+
+
+def refresh_trending(label, now=None, full=False):
+    """
+    `score(now) = score(last) * decay(now - last) + Σ w * decay(now - t)` —
+    oxirgi ishga tushirishdan beri kelgan hodisalargina o'qiladi. Hamma
+    ballar bir xil `now` ga keltirilgani uchun ular o'zaro solishtiriladi.
+    Default `now` — `trending_cutoff()`.
+    """
+    model = apps.get_model(label)
+    now = now or trending_cutoff()
+    weights = get_weights()
+
+    with transaction.atomic():
+        state = TrendingState.objects.select_for_update().filter(label=label).first()
+        if state is None or full:
+            since = now - timedelta(seconds=get_half_life() * FULL_WINDOW_HALF_LIVES)
+            model.objects.exclude(trending_score=0).update(trending_score=0)
+        else:
+            since = state.refreshed_at
+            factor = decay_factor((now - since).total_seconds())
+            live = model.objects.exclude(trending_score=0)
+            if factor > 0:
+                live.filter(trending_score__lt=EPSILON / factor).update(trending_score=0)
+                live.update(trending_score=F("trending_score") * factor)
+            else:
+                live.update(trending_score=0)
+
+        deltas = defaultdict(float)
+        events = 0
+        for event_label, fk_name, kind in TRENDING_SOURCES[label]:
+            rows = (
+                apps.get_model(event_label)
+                .objects.filter(created_at__gt=since, created_at__lte=now)
+                .values_list(f"{fk_name}_id", "created_at")
+                .iterator(chunk_size=2000)
+            )
+            for target_id, created_at in rows:
+                deltas[target_id] += weights[kind] * decay_factor(
+                    (now - created_at).total_seconds()
+                )
+                events += 1
+
+        items = list(deltas.items())
+        for start in range(0, len(items), UPDATE_BATCH_SIZE):
+            batch = items[start : start + UPDATE_BATCH_SIZE]
+            model.objects.filter(pk__in=[pk for pk, _ in batch]).update(
+                trending_score=F("trending_score")
+                + Case(
+                    *(When(pk=pk, then=Value(delta)) for pk, delta in batch),
+                    default=Value(0.0),
+                    output_field=FloatField(),
+                )
+            )
+
+        TrendingState.objects.update_or_create(
+            label=label, defaults={"refreshed_at": now}
+        )
+    return events, len(deltas)
+
+
+def trending_limit(request, default=10, maximum=50):
+    try:
+        value = int(request.query_params.get("limit", default))
+    except ValueError:
+        return default
+    return max(1, min(value, maximum))
+
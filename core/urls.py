@@ -0,0 +1,12 @@
+from django.urls import path
+
+from .views import ExportView, SearchView
+
+app_name = "core"
+
+urlpatterns = [
+    # /api/search/
+    path("search/", SearchView.as_view(), name="search"),
+    # /api/export/ (faqat admin)
+    path("export/", ExportView.as_view(), name="export"),
+]
@@ -0,0 +1,30 @@
+from django.core.exceptions import ObjectDoesNotExist
+
+# Owner summary uchun `auth_user` dan o'qiladigan yagona ustunlar
+OWNER_SUMMARY_FIELDS = ("username", "first_name", "last_name")
+# Detail ETag'lari uchun: summary'ga kiradigan hamma narsa (User/UserProfile'da
+# `updated_at` yo'q, shuning uchun qiymatlarning o'zi)
+OWNER_VALIDATOR_FIELDS = (
+    *(f"owner__{field}" for field in OWNER_SUMMARY_FIELDS),
+    "owner__profile__avatar",
+)
+
+
+def owner_summary(user, request=None):
+    """
+    `{"id", "name", "avatar"}`. Ism — to'liq ism yoki username; avatar faqat
+    foydalanuvchi profilida rasm yuklagan bo'lsa, aks holda `None`.
+    """
+    if user is None:
+        return None
+    name = f"{user.first_name} {user.last_name}".strip() or user.username
+    try:
+        avatar = user.profile.avatar
+    except ObjectDoesNotExist:
+        avatar = None
+    url = None
+    if avatar:
+        url = avatar.url
+        if request is not None:
+            url = request.build_absolute_uri(url)
+    return {"id": user.pk, "name": name, "avatar": url}
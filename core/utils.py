@@ -0,0 +1,18 @@
+from django.conf import settings
+
+
+def get_client_ip(request):
+    """
+    Like, comment va throttling uchun mijoz IP'si. `X-Forwarded-For` ning
+    chap qiymatlarini mijoz o'zi yozishi mumkin, shuning uchun o'ngdan
+    `TRUSTED_PROXY_COUNT`-qiymat olinadi — bizning oxirgi ishonchli proxy
+    (nginx: `$proxy_add_x_forwarded_for`) qo'shgan manzil. 0 (default) bo'lsa
+    sarlavha e'tiborsiz, faqat `REMOTE_ADDR`.
+    """
+    proxies = getattr(settings, "TRUSTED_PROXY_COUNT", 0)
+    x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
+    if proxies > 0 and x_forwarded_for:
+        hops = [hop.strip() for hop in x_forwarded_for.split(",") if hop.strip()]
+        if hops:
+            return hops[-min(proxies, len(hops))]
+    return request.META.get("REMOTE_ADDR")
@@ -0,0 +1,158 @@
+from django.apps import apps
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, Value
+from django.db.models.functions import Left
+from django.shortcuts import get_object_or_404
+from rest_framework import generics, permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from posts.models import Post
+from projects.models import Project
+from .export import EXPORT_MODELS, stream_export
+from .models import SimilarContent
+from .pagination import SearchPagination
+from .serializers import (
+    SEARCH_EXCERPT_LENGTH,
+    SearchResultSerializer,
+    SimilarContentSerializer,
+)
+from .similarity import SOURCES, get_limit
+
+MAX_QUERY_LENGTH = 200
+
+
+class SearchView(generics.ListAPIView):
+    """
+    GET /api/search/?q=...&type=post|project
+
+    Post va project'lar bo'yicha full-text qidiruv. `search_vector` ustuni
+    trigger orqali saqlanadi va GIN index bilan qidiriladi, shuning uchun
+    so'rov vaqtida hech qanday matn qayta tahlil qilinmaydi. `q` websearch
+    sintaksisida: `"aniq ibora"`, `django -flask`, `react or vue`.
+    """
+
+    serializer_class = SearchResultSerializer
+    permission_classes = [permissions.AllowAny]
+    pagination_class = SearchPagination
+
+    def get_search_query(self):
+        q = self.request.query_params.get("q", "").strip()
+        if not q:
+            raise ValidationError({"q": ["This field is required."]})
+        return SearchQuery(
+            q[:MAX_QUERY_LENGTH], config="simple", search_type="websearch"
+        )
+
+    def get_queryset(self):
+        query = self.get_search_query()
+        rank = SearchRank(F("search_vector"), query)
+        # UNION ustunlari `values()` tartibida bo'lishi uchun Django >= 5.2 kerak:
+        # oldingi versiyalar annotatsiyalarni model ustunlaridan keyin qo'yadi,
+        # post va project tomonlarida esa annotatsiyalar soni har xil
+        fields = ("type", "uuid", "title", "excerpt", "image", "rank", "created_at")
+
+        posts = (
+            Post.objects.filter(search_vector=query)
+            .annotate(type=Value("post"), rank=rank)
+            .values(*fields)
+        )
+        projects = (
+            Project.objects.filter(search_vector=query)
+            .annotate(
+                type=Value("project"),
+                excerpt=Left("description", SEARCH_EXCERPT_LENGTH + 1),
+                rank=rank,
+            )
+            .values(*fields)
+        )
+
+        kind = self.request.query_params.get("type")
+        if kind == "post":
+            queryset = posts
+        elif kind == "project":
+            queryset = projects
+        elif kind:
+            raise ValidationError({"type": ["Expected 'post' or 'project'."]})
+        else:
+            queryset = posts.union(projects, all=True)
+        return queryset.order_by("-rank", "-created_at")
+
+
+class SimilarContentView(APIView):
+    """
+    GET /api/posts/<uuid>/similar/, /api/projects/<uuid>/similar/
+
+    Oldindan hisoblangan TF-IDF qo'shnilari: request vaqtida hech narsa
+    hisoblanmaydi — indexli bitta o'qish va har bir tur uchun sarlavhalar.
+    """
+
+    permission_classes = [permissions.AllowAny]
+    source_kind = None
+
+    def get(self, request, pk):
+        label, _ = SOURCES[self.source_kind]
+        source = get_object_or_404(
+            apps.get_model(label).objects.only("pk"), uuid=pk
+        )
+        links = list(
+            SimilarContent.objects.filter(
+                source_kind=self.source_kind, source_id=source.pk
+            )
+            .order_by("-score")
+            .values_list("target_kind", "target_id", "score")[: get_limit()]
+        )
+
+        titles = {}
+        for kind in {target_kind for target_kind, _, _ in links}:
+            target_label, _ = SOURCES[kind]
+            ids = [target_id for target_kind, target_id, _ in links if target_kind == kind]
+            for target_id, uuid, title in (
+                apps.get_model(target_label)
+                .objects.filter(pk__in=ids)
+                .values_list("pk", "uuid", "title")
+            ):
+                titles[kind, target_id] = (uuid, title)
+
+        results = [
+            {
+                "type": kind,
+                "uuid": titles[kind, target_id][0],
+                "title": titles[kind, target_id][1],
+                "score": score,
+            }
+            for kind, target_id, score in links
+            if (kind, target_id) in titles
+        ]
+        return Response(SimilarContentSerializer(results, many=True).data)
+
+
+class ExportView(APIView):
+    """
+    GET /api/export/?model=posts.Post&model=...&gzip=1
+
+    Kontentni NDJSON (Django `jsonl` formati) sifatida oqim bilan beradi —
+    backup va statik sayt build'lari uchun. Faqat admin.
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        labels = request.query_params.getlist("model") or EXPORT_MODELS
+        unknown = sorted(set(labels) - set(EXPORT_MODELS))
+        if unknown:
+            raise ValidationError({"model": [f"Unknown model: {', '.join(unknown)}"]})
+        compress = request.query_params.get("gzip") in ("1", "true")
+
+        filename = f"jasurdev-{timezone.now():%Y%m%d-%H%M%S}.ndjson"
+        if compress:
+            filename += ".gz"
+        response = StreamingHttpResponse(
+            stream_export(labels, compress=compress),
+            content_type="application/gzip" if compress else "application/x-ndjson",
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
@@ -1,13 +1,13 @@
 import React, { useState } from 'react';
 import { Calendar, Heart, MessageSquare, Tag, ExternalLink } from 'lucide-react';
 import { useLanguage } from '@/contexts/LanguageContext';
-import { Post, apiService } from '@/services/api';
+import { Post, PostComment, PostSummary, apiService } from '@/services/api';
 import { Card } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
 import { Badge } from '@/components/ui/badge';
 
 interface PostCardProps {
-  post: Post;
+  post: PostSummary;
   onLike: (postId: number) => void;
   onCommentAdded: (postId: number) => void;
 }
@@ -19,6 +19,10 @@ export const PostCard: React.FC<PostCardProps> = ({ post, onLike, onCommentAdded
   const [comment, setComment] = useState('');
   const [isLiking, setIsLiking] = useState(false);
   const [isSubmittingComment, setIsSubmittingComment] = useState(false);
+  // To'liq matn va comment'lar faqat kartochka ochilganda yuklanadi
+  const [detail, setDetail] = useState<Post | null>(null);
+  const [comments, setComments] = useState<PostComment[]>([]);
+  const [commentsNext, setCommentsNext] = useState<string | null>(null);
 
   const formatDate = (dateString: string) => {
     return new Date(dateString).toLocaleDateString('en-US', {
@@ -33,7 +37,7 @@ export const PostCard: React.FC<PostCardProps> = ({ post, onLike, onCommentAdded
     
     setIsLiking(true);
     try {
-      await apiService.likePost(post.id);
+      await apiService.likePost(post.uuid);
       onLike(post.id);
     } catch (error) {
       console.error('Failed to like post:', error);
@@ -47,7 +51,11 @@ export const PostCard: React.FC<PostCardProps> = ({ post, onLike, onCommentAdded
     
     setIsSubmittingComment(true);
     try {
-      await apiService.addPostComment(post.id, comment.trim());
+      const created = await apiService.addPostComment(post.uuid, comment.trim());
+      // Thread oxirigacha yuklangan bo'lsa, yangi comment'ni darhol ko'rsatamiz
+      if (detail && !commentsNext) {
+        setComments(prev => [...prev, created]);
+      }
       setComment('');
       setIsCommenting(false);
       onCommentAdded(post.id);
@@ -58,20 +66,56 @@ export const PostCard: React.FC<PostCardProps> = ({ post, onLike, onCommentAdded
     }
   };
 
-  const truncatedContent = post.content.length > 200 
-    ? post.content.substring(0, 200) + '...' 
-    : post.content;
+  const isTruncated = post.excerpt.endsWith('…');
+
+  const toggleExpanded = async () => {
+    const expanding = !isExpanded;
+    setIsExpanded(expanding);
+    if (expanding && !detail) {
+      try {
+        const [full, page] = await Promise.all([
+          apiService.getPost(post.uuid),
+          apiService.getPostComments(post.uuid),
+        ]);
+        setDetail(full);
+        setComments(page.results);
+        setCommentsNext(page.next);
+      } catch (error) {
+        console.error('Failed to load post:', error);
+      }
+    }
+  };
+
+  const loadMoreComments = async () => {
+    if (!commentsNext) return;
+    try {
+      const page = await apiService.getPostComments(post.uuid, commentsNext);
+      setComments(prev => [...prev, ...page.results]);
+      setCommentsNext(page.next);
+    } catch (error) {
+      console.error('Failed to load comments:', error);
+    }
+  };
 
   return (
     <Card className="group animate-fade-in hover:shadow-strong transition-all duration-300">
       {/* Post Image */}
       {post.image && (
         <div className="relative overflow-hidden rounded-t-xl">
-          <img
-            src={post.image}
-            alt={post.title}
-            className="w-full h-48 object-cover group-hover:scale-105 transition-transform duration-300"
-          />
+          <picture>
+            {post.image_srcset?.avif && (
+              <source type="image/avif" srcSet={post.image_srcset.avif} sizes="(min-width: 768px) 33vw, 100vw" />
+            )}
+            {post.image_srcset?.webp && (
+              <source type="image/webp" srcSet={post.image_srcset.webp} sizes="(min-width: 768px) 33vw, 100vw" />
+            )}
+            <img
+              src={post.image}
+              alt={post.title}
+              loading="lazy"
+              className="w-full h-48 object-cover group-hover:scale-105 transition-transform duration-300"
+            />
+          </picture>
           <div className="absolute inset-0 bg-gradient-to-t from-black/20 to-transparent opacity-0 group-hover:opacity-100 transition-opacity duration-300" />
         </div>
       )}
@@ -82,6 +126,7 @@ export const PostCard: React.FC<PostCardProps> = ({ post, onLike, onCommentAdded
           <div className="flex items-center text-sm text-muted-foreground space-x-2">
             <Calendar className="h-4 w-4" />
             <span>{formatDate(post.created_at)}</span>
+            <span>· {post.reading_time} min</span>
           </div>
           
           {/* Tags */}
@@ -102,21 +147,37 @@ export const PostCard: React.FC<PostCardProps> = ({ post, onLike, onCommentAdded
 
         {/* Title */}
         <h2 className="text-xl font-semibold mb-3 group-hover:text-primary transition-colors cursor-pointer"
-            onClick={() => setIsExpanded(!isExpanded)}>
+            onClick={toggleExpanded}>
           {post.title}
         </h2>
 
         {/* Content */}
         <div className="text-muted-foreground leading-relaxed mb-4">
-          <p>{isExpanded ? post.content : truncatedContent}</p>
-          {post.content.length > 200 && (
+          {isExpanded && detail ? (
+            <div className="prose dark:prose-invert max-w-none" dangerouslySetInnerHTML={{ __html: detail.content_html }} />
+          ) : (
+            <p>{post.excerpt}</p>
+          )}
+          {isTruncated && (
             <button
-              onClick={() => setIsExpanded(!isExpanded)}
+              onClick={toggleExpanded}
               className="text-primary hover:text-accent transition-colors text-sm font-medium mt-2 link-underline"
             >
               {isExpanded ? 'Show less' : t('posts.readMore')}
             </button>
           )}
+          {isExpanded && detail && detail.related.length > 0 && (
+            <div className="mt-6">
+              <h3 className="text-sm font-semibold text-foreground mb-2">{t('posts.related')}</h3>
+              <ul className="space-y-1">
+                {detail.related.map((item) => (
+                  <li key={item.uuid} className="text-sm">
+                    <span className="text-primary">{item.title}</span>
+                  </li>
+                ))}
+              </ul>
+            </div>
+          )}
         </div>
 
         {/* Actions */}
@@ -150,10 +211,10 @@ export const PostCard: React.FC<PostCardProps> = ({ post, onLike, onCommentAdded
         </div>
 
         {/* Comments Section */}
-        {isExpanded && post.comments.length > 0 && (
+        {isExpanded && comments.length > 0 && (
           <div className="mt-6 space-y-4">
             <h4 className="font-semibold text-lg">Comments</h4>
-            {post.comments.map((comment) => (
+            {comments.map((comment) => (
               <div key={comment.id} className="p-4 bg-muted/50 rounded-lg">
                 <p className="text-sm text-muted-foreground mb-2">
                   {formatDate(comment.created_at)}
@@ -161,6 +222,11 @@ export const PostCard: React.FC<PostCardProps> = ({ post, onLike, onCommentAdded
                 <p className="text-foreground">{comment.content}</p>
               </div>
             ))}
+            {commentsNext && (
+              <Button variant="ghost" onClick={loadMoreComments}>
+                {t('common.loadMore')}
+              </Button>
+            )}
           </div>
         )}
 
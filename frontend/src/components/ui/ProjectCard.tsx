@@ -1,13 +1,13 @@
 import React, { useState } from 'react';
 import { Calendar, Heart, MessageSquare, Tag, Github, ExternalLink, Code } from 'lucide-react';
 import { useLanguage } from '@/contexts/LanguageContext';
-import { Project, apiService } from '@/services/api';
+import { Project, ProjectComment, ProjectSummary, apiService } from '@/services/api';
 import { Card } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
 import { Badge } from '@/components/ui/badge';
 
 interface ProjectCardProps {
-  project: Project;
+  project: ProjectSummary;
   onLike: (projectId: number) => void;
   onCommentAdded: (projectId: number) => void;
 }
@@ -19,6 +19,10 @@ export const ProjectCard: React.FC<ProjectCardProps> = ({ project, onLike, onCom
   const [comment, setComment] = useState('');
   const [isLiking, setIsLiking] = useState(false);
   const [isSubmittingComment, setIsSubmittingComment] = useState(false);
+  // To'liq matn va comment'lar faqat kartochka ochilganda yuklanadi
+  const [detail, setDetail] = useState<Project | null>(null);
+  const [comments, setComments] = useState<ProjectComment[]>([]);
+  const [commentsNext, setCommentsNext] = useState<string | null>(null);
 
   const formatDate = (dateString: string) => {
     return new Date(dateString).toLocaleDateString('en-US', {
@@ -33,7 +37,7 @@ export const ProjectCard: React.FC<ProjectCardProps> = ({ project, onLike, onCom
     
     setIsLiking(true);
     try {
-      await apiService.likeProject(project.id);
+      await apiService.likeProject(project.uuid);
       onLike(project.id);
     } catch (error) {
       console.error('Failed to like project:', error);
@@ -47,7 +51,11 @@ export const ProjectCard: React.FC<ProjectCardProps> = ({ project, onLike, onCom
     
     setIsSubmittingComment(true);
     try {
-      await apiService.addProjectComment(project.id, comment.trim());
+      const created = await apiService.addProjectComment(project.uuid, comment.trim());
+      // Thread oxirigacha yuklangan bo'lsa, yangi comment'ni darhol ko'rsatamiz
+      if (detail && !commentsNext) {
+        setComments(prev => [...prev, created]);
+      }
       setComment('');
       setIsCommenting(false);
       onCommentAdded(project.id);
@@ -58,20 +66,56 @@ export const ProjectCard: React.FC<ProjectCardProps> = ({ project, onLike, onCom
     }
   };
 
-  const truncatedDescription = project.description.length > 150 
-    ? project.description.substring(0, 150) + '...' 
-    : project.description;
+  const isTruncated = project.excerpt.endsWith('…');
+
+  const toggleExpanded = async () => {
+    const expanding = !isExpanded;
+    setIsExpanded(expanding);
+    if (expanding && !detail) {
+      try {
+        const [full, page] = await Promise.all([
+          apiService.getProject(project.uuid),
+          apiService.getProjectComments(project.uuid),
+        ]);
+        setDetail(full);
+        setComments(page.results);
+        setCommentsNext(page.next);
+      } catch (error) {
+        console.error('Failed to load project:', error);
+      }
+    }
+  };
+
+  const loadMoreComments = async () => {
+    if (!commentsNext) return;
+    try {
+      const page = await apiService.getProjectComments(project.uuid, commentsNext);
+      setComments(prev => [...prev, ...page.results]);
+      setCommentsNext(page.next);
+    } catch (error) {
+      console.error('Failed to load comments:', error);
+    }
+  };
 
   return (
     <Card className="group animate-scale-in hover:shadow-strong transition-all duration-300">
       {/* Project Image */}
       {project.image && (
         <div className="relative overflow-hidden rounded-t-xl">
-          <img
-            src={project.image}
-            alt={project.title}
-            className="w-full h-48 object-cover group-hover:scale-105 transition-transform duration-300"
-          />
+          <picture>
+            {project.image_srcset?.avif && (
+              <source type="image/avif" srcSet={project.image_srcset.avif} sizes="(min-width: 768px) 33vw, 100vw" />
+            )}
+            {project.image_srcset?.webp && (
+              <source type="image/webp" srcSet={project.image_srcset.webp} sizes="(min-width: 768px) 33vw, 100vw" />
+            )}
+            <img
+              src={project.image}
+              alt={project.title}
+              loading="lazy"
+              className="w-full h-48 object-cover group-hover:scale-105 transition-transform duration-300"
+            />
+          </picture>
           <div className="absolute inset-0 bg-gradient-to-t from-black/50 to-transparent opacity-0 group-hover:opacity-100 transition-opacity duration-300" />
           
           {/* Overlay Links */}
@@ -106,6 +150,15 @@ export const ProjectCard: React.FC<ProjectCardProps> = ({ project, onLike, onCom
           <div className="flex items-center text-sm text-muted-foreground space-x-2">
             <Calendar className="h-4 w-4" />
             <span>{formatDate(project.created_at)}</span>
+            {project.owner && (
+              <span className="flex items-center space-x-1">
+                <span>·</span>
+                {project.owner.avatar && (
+                  <img src={project.owner.avatar} alt="" className="h-4 w-4 rounded-full" loading="lazy" />
+                )}
+                <span>{project.owner.name}</span>
+              </span>
+            )}
           </div>
           
           {/* Tags */}
@@ -126,16 +179,16 @@ export const ProjectCard: React.FC<ProjectCardProps> = ({ project, onLike, onCom
 
         {/* Title */}
         <h2 className="text-xl font-semibold mb-3 group-hover:text-primary transition-colors cursor-pointer"
-            onClick={() => setIsExpanded(!isExpanded)}>
+            onClick={toggleExpanded}>
           {project.title}
         </h2>
 
         {/* Description */}
         <div className="text-muted-foreground leading-relaxed mb-4">
-          <p>{isExpanded ? project.description : truncatedDescription}</p>
-          {project.description.length > 150 && (
+          <p>{isExpanded && detail ? detail.description : project.excerpt}</p>
+          {isTruncated && (
             <button
-              onClick={() => setIsExpanded(!isExpanded)}
+              onClick={toggleExpanded}
               className="text-primary hover:text-accent transition-colors text-sm font-medium mt-2 link-underline"
             >
               {isExpanded ? 'Show less' : 'Read more'}
@@ -200,10 +253,10 @@ export const ProjectCard: React.FC<ProjectCardProps> = ({ project, onLike, onCom
         </div>
 
         {/* Comments Section */}
-        {isExpanded && project.comments.length > 0 && (
+        {isExpanded && comments.length > 0 && (
           <div className="mt-6 space-y-4">
             <h4 className="font-semibold text-lg">Comments</h4>
-            {project.comments.map((comment) => (
+            {comments.map((comment) => (
               <div key={comment.id} className="p-4 bg-muted/50 rounded-lg">
                 <p className="text-sm text-muted-foreground mb-2">
                   {formatDate(comment.created_at)}
@@ -211,6 +264,11 @@ export const ProjectCard: React.FC<ProjectCardProps> = ({ project, onLike, onCom
                 <p className="text-foreground">{comment.content}</p>
               </div>
             ))}
+            {commentsNext && (
+              <Button variant="ghost" onClick={loadMoreComments}>
+                {t('common.loadMore')}
+              </Button>
+            )}
           </div>
         )}
 
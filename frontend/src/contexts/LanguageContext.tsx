@@ -30,6 +30,7 @@ const translations: Translations = {
   // Posts
   'posts.title': { en: 'Blog Posts', ru: 'Блог посты', uz: 'Blog postlari' },
   'posts.readMore': { en: 'Read More', ru: 'Читать далее', uz: 'Davomini oʻqish' },
+  'posts.related': { en: 'Related posts', ru: 'Похожие посты', uz: 'Oʻxshash postlar' },
   'posts.likes': { en: 'likes', ru: 'лайков', uz: 'yoqtirish' },
   'posts.comments': { en: 'comments', ru: 'комментариев', uz: 'izohlar' },
   'posts.addComment': { en: 'Add Comment', ru: 'Добавить комментарий', uz: 'Izoh qoʻshish' },
@@ -46,6 +47,7 @@ const translations: Translations = {
   'common.like': { en: 'Like', ru: 'Лайк', uz: 'Yoqtirish' },
   'common.submit': { en: 'Submit', ru: 'Отправить', uz: 'Yuborish' },
   'common.cancel': { en: 'Cancel', ru: 'Отмена', uz: 'Bekor qilish' },
+  'common.loadMore': { en: 'Load more', ru: 'Загрузить ещё', uz: 'Yana yuklash' },
   
   // Footer
   'footer.contact': { en: 'Contact', ru: 'Контакты', uz: 'Aloqa' },
@@ -18,17 +18,12 @@ export const About: React.FC = () => {
     const loadAboutData = async () => {
       try {
         setLoading(true);
-        const [aboutMe, skillsData, experiencesData, certificatesData] = await Promise.all([
-          apiService.getAboutMe(),
-          apiService.getSkills(),
-          apiService.getExperiences(),
-          apiService.getCertificates(),
-        ]);
+        const profile = await apiService.getProfile();
 
-        setAboutData(aboutMe);
-        setSkills(skillsData);
-        setExperiences(experiencesData);
-        setCertificates(certificatesData);
+        setAboutData(profile.about_me);
+        setSkills(profile.skills);
+        setExperiences(profile.experiences);
+        setCertificates(profile.certificates);
       } catch (err) {
         setError(t('common.error'));
       } finally {
@@ -1,27 +1,35 @@
 import React, { useState, useEffect } from 'react';
 import { Search, Filter, Loader } from 'lucide-react';
 import { useLanguage } from '@/contexts/LanguageContext';
-import { apiService, Post } from '@/services/api';
+import { apiService, PostSummary } from '@/services/api';
 import { PostCard } from '@/components/ui/PostCard';
 import { Button } from '@/components/ui/button';
 import { Input } from '@/components/ui/input';
 
 export const Posts: React.FC = () => {
   const { t } = useLanguage();
-  const [posts, setPosts] = useState<Post[]>([]);
-  const [filteredPosts, setFilteredPosts] = useState<Post[]>([]);
+  const [posts, setPosts] = useState<PostSummary[]>([]);
+  const [filteredPosts, setFilteredPosts] = useState<PostSummary[]>([]);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [nextPage, setNextPage] = useState<string | null>(null);
   const [error, setError] = useState<string | null>(null);
   const [searchQuery, setSearchQuery] = useState('');
   const [selectedTag, setSelectedTag] = useState<string>('');
+  const [allTags, setAllTags] = useState<string[]>([]);
 
   useEffect(() => {
     const loadPosts = async () => {
       try {
         setLoading(true);
-        const postsData = await apiService.getPosts();
-        setPosts(postsData);
-        setFilteredPosts(postsData);
+        // Tag bo'yicha filtr serverda — faqat mos posts yuklanadi
+        const page = await apiService.getPosts(null, selectedTag ? { tags: [selectedTag] } : undefined);
+        setPosts(page.results);
+        setFilteredPosts(page.results);
+        setNextPage(page.next);
+        if (!selectedTag && page.facets) {
+          setAllTags(page.facets.map(facet => facet.name));
+        }
       } catch (err) {
         setError(t('common.error'));
       } finally {
@@ -30,32 +38,35 @@ export const Posts: React.FC = () => {
     };
 
     loadPosts();
-  }, [t]);
+  }, [t, selectedTag]);
 
-  // Filter posts based on search and tags
+  // Filter loaded posts by search text
   useEffect(() => {
     let filtered = posts;
 
     if (searchQuery) {
       filtered = filtered.filter(post =>
         post.title.toLowerCase().includes(searchQuery.toLowerCase()) ||
-        post.content.toLowerCase().includes(searchQuery.toLowerCase())
-      );
-    }
-
-    if (selectedTag) {
-      filtered = filtered.filter(post =>
-        post.tags.some(tag => tag.name === selectedTag)
+        post.excerpt.toLowerCase().includes(searchQuery.toLowerCase())
       );
     }
 
     setFilteredPosts(filtered);
-  }, [posts, searchQuery, selectedTag]);
-
-  // Get all unique tags from posts
-  const allTags = Array.from(
-    new Set(posts.flatMap(post => post.tags.map(tag => tag.name)))
-  );
+  }, [posts, searchQuery]);
+
+  const loadMore = async () => {
+    if (!nextPage) return;
+    try {
+      setLoadingMore(true);
+      const page = await apiService.getPosts(nextPage);
+      setPosts(prev => [...prev, ...page.results]);
+      setNextPage(page.next);
+    } catch (err) {
+      setError(t('common.error'));
+    } finally {
+      setLoadingMore(false);
+    }
+  };
 
   const handleLike = (postId: number) => {
     setPosts(prevPosts => 
@@ -197,6 +208,14 @@ export const Posts: React.FC = () => {
           </div>
         )}
 
+        {nextPage && (
+          <div className="mt-8 text-center">
+            <Button onClick={loadMore} disabled={loadingMore} variant="outline">
+              {loadingMore ? t('common.loading') : t('common.loadMore')}
+            </Button>
+          </div>
+        )}
+
         {/* Stats */}
         <div className="mt-12 text-center">
           <div className="inline-flex items-center space-x-8 p-6 bg-gradient-hero rounded-2xl">
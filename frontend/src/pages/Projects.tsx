@@ -1,27 +1,35 @@
 import React, { useState, useEffect } from 'react';
 import { Search, Filter, Loader, Github, ExternalLink } from 'lucide-react';
 import { useLanguage } from '@/contexts/LanguageContext';
-import { apiService, Project } from '@/services/api';
+import { apiService, ProjectSummary } from '@/services/api';
 import { ProjectCard } from '@/components/ui/ProjectCard';
 import { Button } from '@/components/ui/button';
 import { Input } from '@/components/ui/input';
 
 export const Projects: React.FC = () => {
   const { t } = useLanguage();
-  const [projects, setProjects] = useState<Project[]>([]);
-  const [filteredProjects, setFilteredProjects] = useState<Project[]>([]);
+  const [projects, setProjects] = useState<ProjectSummary[]>([]);
+  const [filteredProjects, setFilteredProjects] = useState<ProjectSummary[]>([]);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [nextPage, setNextPage] = useState<string | null>(null);
   const [error, setError] = useState<string | null>(null);
   const [searchQuery, setSearchQuery] = useState('');
   const [selectedTag, setSelectedTag] = useState<string>('');
+  const [allTags, setAllTags] = useState<string[]>([]);
 
   useEffect(() => {
     const loadProjects = async () => {
       try {
         setLoading(true);
-        const projectsData = await apiService.getProjects();
-        setProjects(projectsData);
-        setFilteredProjects(projectsData);
+        // Tag bo'yicha filtr serverda — faqat mos projects yuklanadi
+        const page = await apiService.getProjects(null, selectedTag ? { tags: [selectedTag] } : undefined);
+        setProjects(page.results);
+        setFilteredProjects(page.results);
+        setNextPage(page.next);
+        if (!selectedTag && page.facets) {
+          setAllTags(page.facets.map(facet => facet.name));
+        }
       } catch (err) {
         setError(t('common.error'));
       } finally {
@@ -30,32 +38,35 @@ export const Projects: React.FC = () => {
     };
 
     loadProjects();
-  }, [t]);
+  }, [t, selectedTag]);
 
-  // Filter projects based on search and tags
+  // Filter loaded projects by search text
   useEffect(() => {
     let filtered = projects;
 
     if (searchQuery) {
       filtered = filtered.filter(project =>
         project.title.toLowerCase().includes(searchQuery.toLowerCase()) ||
-        project.description.toLowerCase().includes(searchQuery.toLowerCase())
-      );
-    }
-
-    if (selectedTag) {
-      filtered = filtered.filter(project =>
-        project.tags.some(tag => tag.name === selectedTag)
+        project.excerpt.toLowerCase().includes(searchQuery.toLowerCase())
       );
     }
 
     setFilteredProjects(filtered);
-  }, [projects, searchQuery, selectedTag]);
+  }, [projects, searchQuery]);
 
-  // Get all unique tags from projects
-  const allTags = Array.from(
-    new Set(projects.flatMap(project => project.tags.map(tag => tag.name)))
-  );
+  const loadMore = async () => {
+    if (!nextPage) return;
+    try {
+      setLoadingMore(true);
+      const page = await apiService.getProjects(nextPage);
+      setProjects(prev => [...prev, ...page.results]);
+      setNextPage(page.next);
+    } catch (err) {
+      setError(t('common.error'));
+    } finally {
+      setLoadingMore(false);
+    }
+  };
 
   const handleLike = (projectId: number) => {
     setProjects(prevProjects => 
@@ -224,6 +235,14 @@ export const Projects: React.FC = () => {
           </div>
         )}
 
+        {nextPage && (
+          <div className="mt-8 text-center">
+            <Button onClick={loadMore} disabled={loadingMore} variant="outline">
+              {loadingMore ? t('common.loading') : t('common.loadMore')}
+            </Button>
+          </div>
+        )}
+
         {/* Stats */}
         <div className="mt-12 text-center">
           <div className="inline-flex items-center space-x-8 p-6 bg-gradient-card rounded-2xl border border-border">
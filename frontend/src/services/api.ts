@@ -36,6 +36,13 @@ export interface Certificate {
   obtained_year?: number;
 }
 
+export interface Profile {
+  about_me: AboutMe;
+  skills: Skill[];
+  experiences: Experience[];
+  certificates: Certificate[];
+}
+
 export interface PostTag {
   id: number;
   name: string;
@@ -48,20 +55,37 @@ export interface PostComment {
   created_at: string;
 }
 
-export interface Post {
+// List/home uchun yengil ko'rinish (comment thread'siz)
+export interface PostSummary {
   id: number;
   uuid: string; // UUID qo‘shildi
   title: string;
-  content: string;
+  excerpt: string;
+  reading_time: number; // daqiqalarda
   image?: string;
+  image_srcset?: ImageSrcset;
   tags: PostTag[];
   likes_count: number;
   comments_count: number;
-  comments: PostComment[];
   created_at: string;
   updated_at: string;
 }
 
+export interface RelatedPost {
+  id: number;
+  uuid: string;
+  title: string;
+  excerpt: string;
+  image?: string;
+  created_at: string;
+}
+
+export interface Post extends PostSummary {
+  content: string; // Markdown manba
+  content_html: string; // serverda render qilingan
+  related: RelatedPost[]; // oldindan hisoblangan o'xshash post'lar
+}
+
 export interface ProjectTag {
   id: number;
   name: string;
@@ -74,27 +98,78 @@ export interface ProjectComment {
   created_at: string;
 }
 
-export interface Project {
+export interface ProjectOwner {
+  id: number;
+  name: string; // to'liq ism yoki username
+  avatar: string | null; // profilga yuklangan rasm (ixtiyoriy)
+}
+
+export interface ProjectSummary {
   id: number;
   uuid: string; // UUID qo‘shildi
   title: string;
-  description: string;
+  excerpt: string;
   image?: string;
+  image_srcset?: ImageSrcset;
   github_link?: string;
   live_demo_link?: string;
-  owner: number;
+  owner: ProjectOwner | null;
   tags: ProjectTag[];
   likes_count: number;
   comments_count: number;
-  comments: ProjectComment[];
   created_at: string;
   updated_at: string;
 }
 
+export interface Project extends Omit<ProjectSummary, 'excerpt'> {
+  description: string;
+}
+
+// Rasm variantlari: format -> `srcset` satri (masalan { webp: "url 320w, ..." })
+export type ImageSrcset = Partial<Record<'avif' | 'webp', string>>;
+
+export interface TagContent {
+  id: number;
+  name: string;
+  post_count: number;
+  project_count: number;
+  posts: PostSummary[];
+  projects: ProjectSummary[];
+}
+
+export interface TagFacet {
+  name: string;
+  count: number;
+}
+
+// Keyset (cursor) pagination javobi: `next` — keyingi (eskiroq) sahifa URL'i
+export interface Paginated<T> {
+  next: string | null;
+  results: T[];
+  // Faqat birinchi sahifada: filtrlangan to'plamdagi tag'lar soni
+  facets?: TagFacet[];
+}
+
+export interface ListFilters {
+  tags?: string[];
+  match?: 'any' | 'all';
+  year?: number;
+}
+
+const listQuery = (path: string, filters?: ListFilters): string => {
+  const params = new URLSearchParams();
+  filters?.tags?.forEach(tag => params.append('tag', tag));
+  if (filters?.match) params.set('match', filters.match);
+  if (filters?.year) params.set('year', String(filters.year));
+  const query = params.toString();
+  return query ? `${path}?${query}` : path;
+};
+
 // API Service
 class ApiService {
   private async request<T>(endpoint: string, options?: RequestInit): Promise<T> {
-    const response = await fetch(`${API_BASE_URL}${endpoint}`, {
+    const url = endpoint.startsWith('http') ? endpoint : `${API_BASE_URL}${endpoint}`;
+    const response = await fetch(url, {
       headers: {
         'Content-Type': 'application/json',
         ...options?.headers,
@@ -113,6 +188,11 @@ class ApiService {
     await this.request(`/posts/${uuid}/like/`, { method: 'POST' });
   }
 
+  // Comment thread: eng eskisidan boshlab, `next` orqali davom etadi
+  async getPostComments(uuid: string, next?: string | null): Promise<Paginated<PostComment>> {
+    return this.request<Paginated<PostComment>>(next ?? `/posts/${uuid}/comments/`);
+  }
+
   async addPostComment(uuid: string, content: string): Promise<PostComment> {
     return this.request<PostComment>(`/posts/${uuid}/comments/`, {
       method: 'POST',
@@ -138,9 +218,15 @@ class ApiService {
     return this.request<Certificate[]>('/about-me/certificates/');
   }
 
+  // About sahifasi uchun hammasi bitta so'rovda
+  async getProfile(): Promise<Profile> {
+    return this.request<Profile>('/about-me/profile/');
+  }
+
   // Posts API
-  async getPosts(): Promise<Post[]> {
-    return this.request<Post[]>('/posts/');
+  // `next` berilsa, o'sha cursor bo'yicha keyingi sahifani yuklaydi
+  async getPosts(next?: string | null, filters?: ListFilters): Promise<Paginated<PostSummary>> {
+    return this.request<Paginated<PostSummary>>(next ?? listQuery('/posts/', filters));
   }
 
   async getPost(uuid: string): Promise<Post> {
@@ -150,8 +236,8 @@ class ApiService {
 
 
   // Projects API
-  async getProjects(): Promise<Project[]> {
-    return this.request<Project[]>('/projects/');
+  async getProjects(next?: string | null, filters?: ListFilters): Promise<Paginated<ProjectSummary>> {
+    return this.request<Paginated<ProjectSummary>>(next ?? listQuery('/projects/', filters));
   }
 
   async getProject(uuid: string): Promise<Project> {
@@ -163,12 +249,21 @@ class ApiService {
     await this.request(`/projects/${uuid}/like/`, { method: 'POST' });
   }
 
+  async getProjectComments(uuid: string, next?: string | null): Promise<Paginated<ProjectComment>> {
+    return this.request<Paginated<ProjectComment>>(next ?? `/projects/${uuid}/comments/`);
+  }
+
   async addProjectComment(uuid: string, content: string): Promise<ProjectComment> {
     return this.request<ProjectComment>(`/projects/${uuid}/comments/`, {
       method: 'POST',
       body: JSON.stringify({ content }),
     });
   }
+
+  // Tags
+  async getTag(name: string): Promise<TagContent> {
+    return this.request<TagContent>(`/tags/${encodeURIComponent(name)}/`);
+  }
 }
 
 export const apiService = new ApiService();
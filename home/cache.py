@@ -0,0 +1,11 @@
+from django.conf import settings
+
+from core.cache import CachedPayload, SingletonCache
+
+# Bosh sahifaning to'liq javobi; home.signals o'zgarishlarda versiyani almashtiradi
+home_payload = CachedPayload(
+    "home-payload", timeout=getattr(settings, "HOME_CACHE_TIMEOUT", 300)
+)
+
+# Yagona Home qatori (hero) — worker xotirasida
+home_content = SingletonCache("home.Home")
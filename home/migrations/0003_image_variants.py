@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("home", "0002_home_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="home",
+            name="hero_image_variants",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -13,7 +13,10 @@ class Home(models.Model):
     hero_image = models.ImageField(
         upload_to=hero_image_upload_path, blank=True, null=True
     )
+    # Fon pipeline yaratgan WebP/AVIF nusxalar (qarang: core.images)
+    hero_image_variants = models.JSONField(default=dict, blank=True, editable=False)
     hero_text = models.TextField(blank=True, null=True, max_length=500)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "Home Content"
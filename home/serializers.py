@@ -1,9 +1,13 @@
 from rest_framework import serializers
+
+from core.serializers import SrcsetField
 from .models import Home
 
 
 class HomeSerializer(serializers.ModelSerializer):
+    hero_image_srcset = SrcsetField(source="hero_image_variants")
+
     class Meta:
         model = Home
-        fields = ("id", "hero_image", "hero_text")
+        fields = ("id", "hero_image", "hero_image_srcset", "hero_text")
         read_only_fields = ("id",)
@@ -0,0 +1,45 @@
+from django.apps import apps
+from django.conf import settings
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from core.cache import content_updated
+from .cache import home_content, home_payload
+
+# Bosh sahifa payload'iga kiradigan ma'lumotlar: content, tag'lar, hisoblagichlar
+# manbalari va project owner'i (summary'da ismi va profil avatari ko'rinadi)
+PAYLOAD_MODELS = (
+    "home.Home",
+    "posts.Post",
+    "posts.PostLike",
+    "posts.PostComment",
+    "projects.Project",
+    "projects.ProjectLike",
+    "projects.ProjectComment",
+    "tags.Tag",
+    settings.AUTH_USER_MODEL,
+    "core.UserProfile",
+)
+TAGGED_MODELS = ("posts.Post", "projects.Project")
+
+
+def connect_signals():
+    home_content.connect()
+
+    for label in PAYLOAD_MODELS:
+        model = apps.get_model(label)
+        post_save.connect(
+            home_payload.invalidate, sender=model, dispatch_uid=f"home-save-{label}"
+        )
+        post_delete.connect(
+            home_payload.invalidate, sender=model, dispatch_uid=f"home-delete-{label}"
+        )
+
+    for label in TAGGED_MODELS:
+        m2m_changed.connect(
+            home_payload.invalidate,
+            sender=apps.get_model(label).tags.through,
+            dispatch_uid=f"home-tags-{label}",
+        )
+
+    # Hisoblagichlar, rasm variantlari, import — update()/bulk_create yo'llari
+    content_updated.connect(home_payload.invalidate, dispatch_uid="home-content")
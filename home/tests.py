@@ -1,3 +1,63 @@
-from django.test import TestCase
+import json
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import AsyncRequestFactory, TestCase, TransactionTestCase
+from django.urls import reverse
+
+from posts.models import Post
+from .views import AsyncHomeView
+
+
+class HomeCacheTests(TestCase):
+    url = reverse("home:home")
+
+    def setUp(self):
+        cache.clear()
+
+    def fetch(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return response.json(), response["ETag"]
+
+    def test_cached_payload_is_reused(self):
+        first = self.fetch()
+        # Signal'siz yozuv keshni chetlab o'tadi — javob o'zgarmaydi
+        Post.objects.bulk_create([Post(title="Silent", content="Body")])
+        self.assertEqual(self.fetch(), first)
+
+    def test_write_changes_payload_and_etag(self):
+        data, etag = self.fetch()
+        with self.captureOnCommitCallbacks(execute=True):
+            post = Post.objects.create(title="Fresh", content="Body")
+        new_data, new_etag = self.fetch()
+        self.assertNotEqual(new_etag, etag)
+        self.assertEqual(new_data["last_posts"][0]["uuid"], str(post.uuid))
+
+        post.title = "Renamed"
+        with self.captureOnCommitCallbacks(execute=True):
+            post.save()
+        self.assertEqual(self.fetch()[0]["last_posts"][0]["title"], "Renamed")
+
+    def test_matching_etag_is_304(self):
+        _, etag = self.fetch()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+
+class AsyncHomeTests(TransactionTestCase):
+    # Parallel o'qishlar alohida connection'larda — test tranzaksiyasini
+    # ko'rmaydi, shuning uchun ma'lumot haqiqatan commit qilinadi
+
+    def setUp(self):
+        cache.clear()
+        for i in range(4):
+            Post.objects.create(title=f"Post {i}", content="Body")
+
+    async def test_matches_sync_payload(self):
+        request = AsyncRequestFactory().get(reverse("home:home"))
+        response = await AsyncHomeView.as_view()(request)
+        self.assertEqual(response.status_code, 200)
+        await cache.aclear()
+        sync = await self.async_client.get(reverse("home:home"))
+        self.assertEqual(response["ETag"], sync["ETag"])
+        self.assertEqual(json.loads(response.content), sync.json())
@@ -1,8 +1,12 @@
+from django.conf import settings
 from django.urls import path
-from .views import HomeView
+from .views import AsyncHomeView, HomeView
 
 app_name = "home"
 
+# ASGI rejimida async view (parallel o'qishlar), aks holda DRF view
+home_view = AsyncHomeView if settings.SERVER_MODE == "asgi" else HomeView
+
 urlpatterns = [
-    path("", HomeView.as_view(), name="home"),
+    path("", home_view.as_view(), name="home"),
 ]
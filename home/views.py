@@ -1,34 +1,131 @@
+import asyncio
+import hashlib
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Max
+from django.http import JsonResponse
+from django.urls import reverse
+from django.views import View
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .models import Home
+from .cache import home_content, home_payload
 from .serializers import HomeSerializer
+from core.conditional import conditional_get, conditional_response
+from core.pagination import KeysetPagination
+from core.tasks import run_in_thread
 from posts.models import Post
-from posts.serializers import PostSerializer
+from posts.serializers import PostSummarySerializer
 from projects.models import Project
-from projects.serializers import ProjectSerializer
+from projects.serializers import ProjectSummarySerializer
+
+LATEST_SECTIONS = (
+    (Post, PostSummarySerializer, "posts:post-list-create"),
+    (Project, ProjectSummarySerializer, "projects:project-list-create"),
+)
+
+
+class HomePayloadMixin:
+    """
+    Bosh sahifa payload'ining qismlari — sync va async view'lar uchun umumiy.
+    Kesh host bo'yicha bo'lingan: rasm va `next` havolalari absolyut URL.
+    """
+
+    latest_limit = 3
+
+    def make_payload(self, home, latest, modified):
+        (last_posts, posts_next), (last_projects, projects_next) = latest
+        data = {
+            "home": home,
+            "last_posts": last_posts,
+            "last_projects": last_projects,
+            "posts_next": posts_next,
+            "projects_next": projects_next,
+        }
+        # ETag payload'ning o'zidan: tag/owner o'zgarishlari ham hisobga kiradi
+        digest = hashlib.md5(
+            json.dumps(data, sort_keys=True, cls=DjangoJSONEncoder).encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+        return {"etag": digest, "last_modified": modified, "data": data}
+
+    def serialize_home(self):
+        home = home_content.get()  # Default bitta content bo‘ladi
+        return HomeSerializer(home).data if home else None
+
+    def serialize_latest(self, request, model, serializer_class, list_url):
+        # Oxirgi 3 ta element + keyingi sahifa cursor'i: frontend eskiroq
+        # post/projectlarni list endpointlaridan shu joydan davom ettiradi
+        paginator = KeysetPagination(page_size=self.latest_limit)
+        items = paginator.get_page(model.objects.summaries())
+        data = serializer_class(items, many=True, context={"request": request}).data
+        return data, paginator.get_next_link(
+            request.build_absolute_uri(reverse(list_url))
+        )
+
+    def last_modified(self):
+        home = home_content.get()
+        timestamps = [
+            home and home.updated_at,
+            Post.objects.aggregate(ts=Max("updated_at"))["ts"],
+            Project.objects.aggregate(ts=Max("updated_at"))["ts"],
+        ]
+        return max((ts for ts in timestamps if ts), default=None)
 
 
-class HomeView(APIView):
+class HomeView(HomePayloadMixin, APIView):
+    """
+    Bosh sahifa (WSGI): tayyor payload va uning validatorlari keshdan olinadi,
+    shuning uchun kontent o'zgarmaguncha so'rov bazaga tushmaydi. Kesh bo'sh
+    bo'lsa qismlar ketma-ket, bitta persistent connection'da o'qiladi.
+    """
 
+    def get_validators(self, request, *args, **kwargs):
+        self.payload = home_payload.get_or_build(
+            lambda: self.build_payload(request), request.scheme, request.get_host()
+        )
+        return self.payload["etag"], self.payload["last_modified"]
+
+    @conditional_get
     def get(self, request, *args, **kwargs):
-        home_content = Home.objects.first()  # Default bitta content bo‘ladi
-        home_data = HomeSerializer(home_content).data if home_content else None
-
-        last_posts = Post.objects.order_by("-created_at")[:3]
-        last_projects = Project.objects.order_by("-created_at")[:3]
-
-        posts_data = PostSerializer(
-            last_posts, many=True, context={"request": request}
-        ).data
-        projects_data = ProjectSerializer(
-            last_projects, many=True, context={"request": request}
-        ).data
-
-        return Response(
-            {
-                "home": home_data,
-                "last_posts": posts_data,
-                "last_projects": projects_data,
-            }
+        return Response(self.payload["data"])
+
+    def build_payload(self, request):
+        latest = [self.serialize_latest(request, *section) for section in LATEST_SECTIONS]
+        return self.make_payload(self.serialize_home(), latest, self.last_modified())
+
+
+class AsyncHomeView(HomePayloadMixin, View):
+    """
+    Bosh sahifa (ASGI, `SERVER_MODE=asgi`). Kesh bo'sh bo'lsa home, oxirgi
+    posts, oxirgi projects va Last-Modified alohida thread'larda parallel
+    o'qiladi — kechikish eng sekin so'rovga teng. Har bir thread
+    connection'ni psycopg pool'idan oladi; Django async ORM esa so'rovlarni
+    bitta thread'da navbat bilan bajarardi.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        payload = await home_payload.aget_or_build(
+            lambda: self.build_payload(request), request.scheme, request.get_host()
+        )
+        return conditional_response(
+            request,
+            payload["etag"],
+            payload["last_modified"],
+            lambda: JsonResponse(
+                payload["data"], json_dumps_params={"ensure_ascii": False}
+            ),
+            variant="application/json",
+        )
+
+    async def build_payload(self, request):
+        home, modified, *latest = await asyncio.gather(
+            run_in_thread(self.serialize_home),
+            run_in_thread(self.last_modified),
+            *(
+                run_in_thread(self.serialize_latest, request, *section)
+                for section in LATEST_SECTIONS
+            ),
         )
+        return self.make_payload(home, latest, modified)
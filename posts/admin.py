@@ -1,12 +1,8 @@
 from django.contrib import admin
-from .models import Tag, Post, PostLike, PostComment
 
+from core.counters import RecountOnDeleteAdminMixin
 
-@admin.register(Tag)
-class TagAdmin(admin.ModelAdmin):
-    list_display = ("name",)
-    search_fields = ("name",)
-    ordering = ("name",)
+from .models import Post, PostLike, PostComment
 
 
 @admin.register(Post)
@@ -20,7 +16,13 @@ class PostAdmin(admin.ModelAdmin):
     )
     list_filter = ("created_at", "updated_at", "tags")
     search_fields = ("title", "content")
-    readonly_fields = ("created_at", "updated_at", "likes_count", "comments_count")
+    readonly_fields = (
+        "created_at",
+        "updated_at",
+        "likes_count",
+        "comments_count",
+        "reading_time",
+    )
     ordering = ("-created_at",)
 
     fieldsets = (
@@ -35,23 +37,17 @@ class PostAdmin(admin.ModelAdmin):
                 )
             },
         ),
-        ("Statistics", {"fields": ("likes_count", "comments_count")}),
+        (
+            "Statistics",
+            {"fields": ("likes_count", "comments_count", "reading_time")},
+        ),
         ("Timestamps", {"fields": ("created_at", "updated_at")}),
     )
 
-    def likes_count(self, obj):
-        return obj.likes.count()
-
-    likes_count.short_description = "Likes"
-
-    def comments_count(self, obj):
-        return obj.comments.count()
-
-    comments_count.short_description = "Comments"
-
 
 @admin.register(PostLike)
-class PostLikeAdmin(admin.ModelAdmin):
+class PostLikeAdmin(RecountOnDeleteAdminMixin, admin.ModelAdmin):
+    parent_field = "post"
     list_display = ("post", "ip_address", "created_at")
     list_filter = ("created_at", "post")
     search_fields = ("ip_address", "post__title")
@@ -60,7 +56,8 @@ class PostLikeAdmin(admin.ModelAdmin):
 
 
 @admin.register(PostComment)
-class PostCommentAdmin(admin.ModelAdmin):
+class PostCommentAdmin(RecountOnDeleteAdminMixin, admin.ModelAdmin):
+    parent_field = "post"
     list_display = ("post", "short_content", "created_at")
     list_filter = ("created_at", "post")
     search_fields = ("content", "post__title")
@@ -74,7 +71,7 @@ class PostCommentAdmin(admin.ModelAdmin):
 
     def delete_selected_comments(self, request, queryset):
         count = queryset.count()
-        queryset.delete()
+        self.delete_queryset(request, queryset)
         self.message_user(request, f"{count} ta comment muvaffaqiyatli o‘chirildi.")
 
     delete_selected_comments.short_description = "Tanlangan kommentlarni o‘chirish"
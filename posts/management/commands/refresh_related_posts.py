@@ -0,0 +1,22 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from posts.related import refresh_all
+
+
+class Command(BaseCommand):
+    help = (
+        "Barcha post'lar uchun RelatedPost jadvalini qayta hisoblaydi. "
+        "Odatda kerak emas: tag'lar o'zgarganda jadval o'zi yangilanadi."
+    )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        total = refresh_all()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{total} ta post uchun o'xshash post'lar hisoblandi "
+                f"({time.monotonic() - started:.1f}s)"
+            )
+        )
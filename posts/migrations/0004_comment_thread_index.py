@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0003_created_id_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="postcomment",
+            index=models.Index(
+                fields=["post", "created_at", "id"], name="postcomment_thread_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+import uuid
+
+from django.db import migrations, models
+
+
+def backfill_uuids(apps, schema_editor):
+    Post = apps.get_model("posts", "Post")
+    batch = []
+    for obj in Post.objects.filter(uuid__isnull=True).only("pk").iterator():
+        obj.uuid = uuid.uuid4()
+        batch.append(obj)
+        if len(batch) >= 500:
+            Post.objects.bulk_update(batch, ["uuid"])
+            batch = []
+    if batch:
+        Post.objects.bulk_update(batch, ["uuid"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0004_comment_thread_index"),
+    ]
+
+    operations = [
+        # 1) null bilan qo'shamiz, 2) mavjud qatorlarni to'ldiramiz,
+        # 3) unique + NOT NULL qilamiz (unique index shu yerda yaratiladi)
+        migrations.AddField(
+            model_name="post",
+            name="uuid",
+            field=models.UUIDField(editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_uuids, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="post",
+            name="uuid",
+            field=models.UUIDField(default=uuid.uuid4, editable=False, unique=True),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:53
+
+from django.db import migrations, models
+
+from posts.rendering import render_content
+
+
+def render_existing_posts(apps, schema_editor):
+    Post = apps.get_model("posts", "Post")
+    batch = []
+    for post in Post.objects.only("pk", "content").iterator(chunk_size=200):
+        post.content_html, post.excerpt, post.reading_time = render_content(
+            post.content
+        )
+        batch.append(post)
+        if len(batch) >= 200:
+            Post.objects.bulk_update(batch, ["content_html", "excerpt", "reading_time"])
+            batch = []
+    if batch:
+        Post.objects.bulk_update(batch, ["content_html", "excerpt", "reading_time"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0006_image_variants"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="content_html",
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="excerpt",
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="reading_time",
+            field=models.PositiveSmallIntegerField(default=1, editable=False),
+        ),
+        migrations.RunPython(render_existing_posts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+from django.db import migrations
+
+
+# Auto-created through jadvalida faqat `(post_id, tag_id)` bor; tag bo'yicha
+# filtr (`EXISTS ... WHERE tag_id = ? AND post_id = ?`) va tag -> post'lar
+# teskari yo'nalishi uchun index-only scan'ga `(tag_id, post_id)` kerak.
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0011_trending"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "CREATE INDEX posts_post_tags_tag_post_idx ON posts_post_tags (tag_id, post_id);",
+            "DROP INDEX IF EXISTS posts_post_tags_tag_post_idx;",
+        ),
+    ]
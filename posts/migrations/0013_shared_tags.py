@@ -0,0 +1,107 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+# posts.Tag -> umumiy tags.Tag. Bir xil nomli (bo'shliqlari olib tashlangan)
+# tag'lar bitta qatorga birlashadi; through qatorlari nom bo'yicha yangi
+# tag'larga ko'chiriladi, so'ng vaqtinchalik `shared_tags` -> `tags`.
+def merge_tags(apps, schema_editor):
+    OldTag = apps.get_model("posts", "Tag")
+    Tag = apps.get_model("tags", "Tag")
+    Post = apps.get_model("posts", "Post")
+    old_through = Post.tags.through
+    new_through = Post.shared_tags.through
+
+    names = {
+        pk: name.strip() or name
+        for pk, name in OldTag.objects.values_list("pk", "name")
+    }
+    Tag.objects.bulk_create(
+        [Tag(name=name) for name in set(names.values())], ignore_conflicts=True
+    )
+    tag_ids = dict(
+        Tag.objects.filter(name__in=set(names.values())).values_list("name", "pk")
+    )
+    # Unique index migratsiya oxirida (deferred) yaratiladi — juftliklar shu yerda birlashadi
+    pairs = {
+        (post_id, tag_ids[names[tag_id]])
+        for post_id, tag_id in old_through.objects.values_list("post_id", "tag_id")
+    }
+    new_through.objects.bulk_create(
+        [new_through(post_id=post_id, tag_id=tag_id) for post_id, tag_id in pairs],
+        batch_size=1000,
+    )
+    usage = (
+        new_through.objects.filter(tag=OuterRef("pk"))
+        .order_by()
+        .values("tag")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    Tag.objects.update(post_count=Coalesce(Subquery(usage), 0))
+
+
+def split_tags(apps, schema_editor):
+    OldTag = apps.get_model("posts", "Tag")
+    Tag = apps.get_model("tags", "Tag")
+    Post = apps.get_model("posts", "Post")
+    old_through = Post.tags.through
+    new_through = Post.shared_tags.through
+
+    names = dict(
+        Tag.objects.filter(posts__isnull=False).distinct().values_list("pk", "name")
+    )
+    OldTag.objects.bulk_create([OldTag(name=name) for name in names.values()])
+    old_ids = dict(OldTag.objects.values_list("name", "pk"))
+    old_through.objects.bulk_create(
+        [
+            old_through(post_id=post_id, tag_id=old_ids[names[tag_id]])
+            for post_id, tag_id in new_through.objects.values_list("post_id", "tag_id")
+        ],
+        batch_size=1000,
+    )
+    usage = (
+        old_through.objects.filter(tag=OuterRef("pk"))
+        .order_by()
+        .values("tag")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    OldTag.objects.update(usage_count=Coalesce(Subquery(usage), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0012_tag_post_index"),
+        ("tags", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="shared_tags",
+            field=models.ManyToManyField(
+                blank=True, related_name="posts", to="tags.tag"
+            ),
+        ),
+        migrations.RunPython(merge_tags, split_tags),
+        migrations.RemoveField(
+            model_name="post",
+            name="tags",
+        ),
+        migrations.DeleteModel(
+            name="Tag",
+        ),
+        migrations.RenameField(
+            model_name="post",
+            old_name="shared_tags",
+            new_name="tags",
+        ),
+        # Eski through jadvali bilan birga o'chgan `(tag_id, post_id)` index'i
+        migrations.RunSQL(
+            "CREATE INDEX posts_post_tags_tag_post_idx ON posts_post_tags (tag_id, post_id);",
+            "DROP INDEX IF EXISTS posts_post_tags_tag_post_idx;",
+        ),
+    ]
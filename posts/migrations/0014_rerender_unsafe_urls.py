@@ -0,0 +1,31 @@
+from django.db import migrations
+
+from posts.rendering import render_content
+
+
+# URL allowlist'idan oldin saqlangan `content_html` da entity bilan yashirilgan
+# `javascript:` havolalari qolgan bo'lishi mumkin — hammasi qayta render qilinadi
+def rerender_posts(apps, schema_editor):
+    Post = apps.get_model("posts", "Post")
+    batch = []
+    for post in Post.objects.only("pk", "content").iterator(chunk_size=200):
+        post.content_html, post.excerpt, post.reading_time = render_content(
+            post.content
+        )
+        batch.append(post)
+        if len(batch) >= 200:
+            Post.objects.bulk_update(batch, ["content_html", "excerpt", "reading_time"])
+            batch = []
+    if batch:
+        Post.objects.bulk_update(batch, ["content_html", "excerpt", "reading_time"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0013_shared_tags"),
+    ]
+
+    operations = [
+        migrations.RunPython(rerender_posts, migrations.RunPython.noop),
+    ]
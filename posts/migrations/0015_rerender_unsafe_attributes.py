@@ -0,0 +1,18 @@
+from importlib import import_module
+
+from django.db import migrations
+
+# `attr_list` bilan saqlangan `onclick` va h.k. atributlar — 0014 dagi
+# qayta render yangi atribut allowlist'i bilan takrorlanadi
+rerender_posts = import_module("posts.migrations.0014_rerender_unsafe_urls").rerender_posts
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0014_rerender_unsafe_urls"),
+    ]
+
+    operations = [
+        migrations.RunPython(rerender_posts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0015_rerender_unsafe_attributes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="postcomment",
+            index=models.Index(
+                fields=["created_at", "post"], name="postcomment_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="postlike",
+            index=models.Index(
+                fields=["created_at", "post"], name="postlike_created_idx"
+            ),
+        ),
+    ]
@@ -1,31 +1,117 @@
+import uuid
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
+from core.cache import notify_content_updated
+from core.counters import count_subquery
+from .rendering import render_content
 
-class Tag(models.Model):
-    name = models.CharField(max_length=50, unique=True)
 
-    def __str__(self):
-        return self.name
+class PostQuerySet(models.QuerySet):
+    def summaries(self):
+        """
+        List/home uchun yengil queryset: to'liq matn o'rniga saqlangan
+        `excerpt` yetarli, comment/like prefetch yo'q.
+        """
+        return self.defer("content", "content_html").prefetch_related("tags")
+
+    def recount_counters(self):
+        """Stored like/comment hisoblagichlarini PostLike/PostComment dan qayta hisoblaydi."""
+        updated = self.update(
+            likes_count=count_subquery(PostLike, "post"),
+            comments_count=count_subquery(PostComment, "post"),
+        )
+        # update() signal chaqirmaydi — keshlangan payload'lar eskirmasin
+        notify_content_updated(self.model)
+        return updated
 
 
 class Post(models.Model):
+    # Tashqi (URL) identifikator: ichki `id` ni oshkor qilmaydi, unique index bilan
+    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
     title = models.CharField(max_length=255)
     content = models.TextField()
+    # `content` (Markdown) dan save() paytida bir marta hosil qilinadi
+    content_html = models.TextField(blank=True, editable=False)
+    excerpt = models.CharField(max_length=255, blank=True, editable=False)
+    reading_time = models.PositiveSmallIntegerField(default=1, editable=False)
     image = models.ImageField(upload_to="posts/", blank=True, null=True)
-    tags = models.ManyToManyField(Tag, related_name="posts", blank=True)
+    # Fon pipeline yaratgan WebP/AVIF nusxalar (qarang: core.images)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
+    tags = models.ManyToManyField("tags.Tag", related_name="posts", blank=True)
+    # title (A) + content (B) — Postgres trigger yangilaydi (qarang: migratsiya)
+    search_vector = SearchVectorField(null=True, editable=False)
+    # Denormalized hisoblagichlar: like/comment view'lari atomik yangilaydi,
+    # `recount_counters` komandasi esa drift'ni tuzatadi.
+    likes_count = models.PositiveIntegerField(default=0, editable=False)
+    comments_count = models.PositiveIntegerField(default=0, editable=False)
+    # Vaqt bo'yicha so'nuvchi like/comment bali (qarang: core.trending)
+    trending_score = models.FloatField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = PostQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # KeysetPagination: ORDER BY created_at DESC, id DESC
+            models.Index(fields=["-created_at", "-id"], name="post_created_id_idx"),
+            GinIndex(fields=["search_vector"], name="post_search_idx"),
+            # Trending: ORDER BY trending_score DESC, id DESC LIMIT n
+            models.Index(fields=["-trending_score", "-id"], name="post_trending_idx"),
+        ]
+
     def __str__(self):
         return self.title
 
-    @property
-    def likes_count(self):
-        return self.likes.count()
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "content" in update_fields:
+            self.render_content()
+            if update_fields is not None:
+                kwargs["update_fields"] = {
+                    *update_fields,
+                    "content_html",
+                    "excerpt",
+                    "reading_time",
+                }
+        super().save(*args, **kwargs)
+
+    def render_content(self):
+        self.content_html, self.excerpt, self.reading_time = render_content(
+            self.content
+        )
+
+
+class RelatedPost(models.Model):
+    """
+    Oldindan hisoblangan "o'xshash post'lar": umumiy tag'lar og'irligi va
+    vaqt yaqinligi bo'yicha. `posts.related` tag'lar o'zgarganda faqat
+    ta'sirlangan post'lar uchun qayta hisoblaydi.
+    """
+
+    post = models.ForeignKey(
+        Post, on_delete=models.CASCADE, related_name="related_links"
+    )
+    related = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="+")
+    score = models.FloatField()
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["post", "related"], name="relatedpost_unique_pair"
+            ),
+        ]
+        indexes = [
+            # Detail: WHERE post_id = ? ORDER BY score DESC
+            models.Index(fields=["post", "-score"], name="relatedpost_score_idx"),
+        ]
 
-    @property
-    def comments_count(self):
-        return self.comments.count()
+    def __str__(self):
+        return f"{self.post} -> {self.related} ({self.score:.3f})"
 
 
 class PostLike(models.Model):
@@ -36,6 +122,10 @@ class PostLike(models.Model):
     class Meta:
         unique_together = ("post", "ip_address")  # Bir IP faqat 1 marta like bosadi
         ordering = ["-created_at"]
+        indexes = [
+            # core.trending: WHERE created_at > ? — post_id index'dan o'qiladi
+            models.Index(fields=["created_at", "post"], name="postlike_created_idx"),
+        ]
 
     def __str__(self):
         return f"Like from {self.ip_address} on {self.post}"
@@ -48,6 +138,12 @@ class PostComment(models.Model):
 
     class Meta:
         ordering = ["created_at"]
+        indexes = [
+            # ThreadPagination: WHERE post_id = ? ORDER BY created_at, id
+            models.Index(fields=["post", "created_at", "id"], name="postcomment_thread_idx"),
+            # core.trending: WHERE created_at > ?
+            models.Index(fields=["created_at", "post"], name="postcomment_created_idx"),
+        ]
 
     def __str__(self):
         return f"Comment on {self.post}"
@@ -0,0 +1,231 @@
+import math
+from collections import defaultdict
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from scipy import sparse
+
+from core.tasks import run_in_background
+from tags.models import Tag
+from .models import Post, RelatedPost
+
+
+def get_related_limit():
+    return getattr(settings, "RELATED_POSTS_LIMIT", 4)
+
+
+def get_half_life_days():
+    return getattr(settings, "RELATED_POSTS_HALF_LIFE_DAYS", 180)
+
+
+def tag_weight(post_count):
+    # Kam ishlatilgan tag umumiy bo'lsa, bog'liqlik kuchliroq (IDF'ga o'xshash)
+    return 1 / math.log2(1 + max(post_count, 1))
+
+
+def recency(days):
+    # Bir-biriga yaqin chiqqan post'lar biroz yuqoriroq: 1 dan 0.5 gacha so'nadi
+    return 0.5 + 0.5 * 0.5 ** (days / get_half_life_days())
+
+
+def score_related(post_ids, limit=None):
+    """
+    Berilgan post'lar uchun `{post_id: [(score, related_id), ...]}` — eng
+    yuqori `limit` ta (default `RELATED_POSTS_LIMIT`). Uchta so'rov (through
+    jadvali, tag og'irliklari, nomzodlarning sanalari); hisob sparse matritsalarda:
+    `shared = S @ diag(w) @ C.T`, so'ng nol bo'lmagan juftliklarga vaqt
+    yaqinligi koeffitsienti — bir-biriga yaqin chiqqan post'lar biroz yuqoriroq.
+    """
+    post_ids = sorted(set(post_ids))
+    through = Post.tags.through
+    source_pairs = list(
+        through.objects.filter(post_id__in=post_ids).values_list("post_id", "tag_id")
+    )
+    tag_ids = sorted({tag_id for _, tag_id in source_pairs})
+    candidate_pairs = list(
+        through.objects.filter(tag_id__in=tag_ids).values_list("post_id", "tag_id")
+    )
+    weights = dict(
+        Tag.objects.filter(pk__in=tag_ids).values_list("pk", "post_count")
+    )
+    created = dict(
+        Post.objects.filter(
+            pk__in={post_id for post_id, _ in candidate_pairs} | set(post_ids)
+        ).values_list("pk", "created_at")
+    )
+
+    result = {post_id: [] for post_id in post_ids if post_id in created}
+    if not candidate_pairs:
+        return result
+
+    tag_pos = {tag_id: i for i, tag_id in enumerate(tag_ids)}
+    candidates = sorted(created)
+    cand_pos = {post_id: i for i, post_id in enumerate(candidates)}
+    sources = [post_id for post_id in post_ids if post_id in created]
+    source_pos = {post_id: i for i, post_id in enumerate(sources)}
+
+    def incidence(pairs, positions, size, values):
+        pairs = [(post_id, tag_id) for post_id, tag_id in pairs if post_id in positions]
+        rows = [positions[post_id] for post_id, _ in pairs]
+        cols = [tag_pos[tag_id] for _, tag_id in pairs]
+        return sparse.csr_matrix(
+            (values(pairs), (rows, cols)), shape=(size, len(tag_ids))
+        )
+
+    source_matrix = incidence(
+        source_pairs, source_pos, len(sources), lambda pairs: np.ones(len(pairs))
+    )
+    candidate_matrix = incidence(
+        candidate_pairs,
+        cand_pos,
+        len(candidates),
+        lambda pairs: [tag_weight(weights.get(tag_id, 1)) for _, tag_id in pairs],
+    )
+    shared = (source_matrix @ candidate_matrix.T).tocoo()
+
+    candidate_ids = np.array(candidates)
+    source_ids = np.array(sources)
+    keep = candidate_ids[shared.col] != source_ids[shared.row]
+    rows, cols, weight = shared.row[keep], shared.col[keep], shared.data[keep]
+
+    timestamps = np.array([created[post_id].timestamp() for post_id in candidates])
+    source_times = timestamps[[cand_pos[post_id] for post_id in sources]]
+    days = np.abs(source_times[rows] - timestamps[cols]) / 86400
+    scores = weight * recency(days)
+
+    # Har bir manba uchun: ball kamayish, teng bo'lsa yangiroq (katta id) oldin
+    order = np.lexsort((-candidate_ids[cols], -scores, rows))
+    sorted_rows = rows[order]
+    rank = np.arange(len(order)) - np.searchsorted(sorted_rows, sorted_rows)
+    top = order[rank < (get_related_limit() if limit is None else limit)]
+    for row, col, score in zip(rows[top].tolist(), cols[top].tolist(), scores[top].tolist()):
+        result[sources[row]].append((score, candidates[col]))
+    return result
+
+
+def refresh_related(post_ids):
+    """Berilgan post'larning RelatedPost qatorlarini qayta yozadi."""
+    post_ids = set(post_ids)
+    if not post_ids:
+        return
+    scores = score_related(post_ids)
+    rows = [
+        RelatedPost(post_id=post_id, related_id=related_id, score=score)
+        for post_id, scored in scores.items()
+        for score, related_id in scored
+    ]
+    with transaction.atomic():
+        RelatedPost.objects.filter(post_id__in=post_ids).delete()
+        RelatedPost.objects.bulk_create(rows)
+
+
+def refresh_all(batch_size=200):
+    post_ids = list(Post.objects.order_by("pk").values_list("pk", flat=True))
+    for start in range(0, len(post_ids), batch_size):
+        refresh_related(post_ids[start : start + batch_size])
+    return len(post_ids)
+
+
+def pair_scores(pairs):
+    """
+    `{(post_id, other_id): score}` — faqat berilgan juftliklar uchun, hozirgi
+    tag og'irliklari bilan (`score_related` dagi formula).
+    """
+    post_ids = {post_id for pair in pairs for post_id in pair}
+    tags = defaultdict(set)
+    for post_id, tag_id in Post.tags.through.objects.filter(
+        post_id__in=post_ids
+    ).values_list("post_id", "tag_id"):
+        tags[post_id].add(tag_id)
+    weights = dict(
+        Tag.objects.filter(pk__in=set().union(*tags.values())).values_list(
+            "pk", "post_count"
+        )
+    )
+    created = dict(Post.objects.filter(pk__in=post_ids).values_list("pk", "created_at"))
+    scores = {}
+    for a, b in pairs:
+        if a in created and b in created:
+            shared = sum(tag_weight(weights[tag_id]) for tag_id in tags[a] & tags[b])
+            days = abs((created[a] - created[b]).total_seconds()) / 86400
+            scores[a, b] = shared * recency(days)
+    return scores
+
+
+def affected_posts(post_id):
+    """
+    Post'ning tag'lari o'zgarganda ro'yxati o'zgarishi mumkin bo'lganlar:
+    o'zi, uni hozir ro'yxatida tutganlar va endi ro'yxatiga kira oladiganlar —
+    ro'yxati to'lmaganlar yoki u bilan bali ro'yxatidagi eng past baldan kam
+    bo'lmaganlar. Umumiy tag'ni bo'lishadigan qolgan post'lar (ommabop tag'da
+    deyarli butun korpus) qayta hisoblanmaydi.
+
+    Ball simmetrik, shuning uchun nomzodlarga nisbatan ballar post'ning bitta
+    qatoridan olinadi; ro'yxatlardagi ballar esa saqlangan qiymatdan emas,
+    hozirgi og'irliklar bilan qayta hisoblanadi — solishtirish bir xil
+    o'lchovda bo'lsin. Og'irlik o'zgarishining qolgan juftliklar tartibiga
+    kichik ta'sirini `refresh_related_posts` komandasi tuzatadi.
+    """
+    linked = set(
+        RelatedPost.objects.filter(related_id=post_id).values_list("post_id", flat=True)
+    )
+    scores = {
+        related_id: score
+        for score, related_id in score_related([post_id], limit=math.inf).get(
+            post_id, ()
+        )
+    }
+    members = list(
+        RelatedPost.objects.filter(
+            post_id__in=list(scores.keys() - linked)
+        ).values_list("post_id", "related_id")
+    )
+    lists = defaultdict(list)
+    for (other, _), score in pair_scores(members).items():
+        lists[other].append(score)
+
+    limit = get_related_limit()
+    # Teng ballarda ham (yig'indi tartibidagi float farqi bilan) qayta hisoblanadi
+    could_enter = {
+        other
+        for other, score in scores.items()
+        if len(lists[other]) < limit or score >= min(lists[other]) * (1 - 1e-9)
+    }
+    return {post_id, *linked, *could_enter}
+
+
+def refresh_for_post(post_id):
+    refresh_related(affected_posts(post_id))
+
+
+def tags_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """`m2m_changed` handler: qayta hisoblash fonda, commit'dan keyin."""
+    if reverse and action == "pre_clear":
+        instance._cleared_post_ids = set(instance.posts.values_list("pk", flat=True))
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if reverse:
+        # tag.posts.add(...) — instance Tag, pk_set esa post'lar
+        if action == "post_clear":
+            post_ids = getattr(instance, "_cleared_post_ids", ())
+        else:
+            post_ids = pk_set or ()
+    else:
+        post_ids = (instance.pk,)
+    for post_id in post_ids:
+        run_in_background(refresh_for_post, post_id)
+
+
+def remember_linked(sender, instance, **kwargs):
+    """`pre_delete`: o'chirilayotgan post'ni ro'yxatida tutganlarni eslab qoladi."""
+    instance._related_linked_ids = set(
+        RelatedPost.objects.filter(related=instance).values_list("post_id", flat=True)
+    )
+
+
+def refresh_linked(sender, instance, **kwargs):
+    linked = getattr(instance, "_related_linked_ids", None)
+    if linked:
+        run_in_background(refresh_related, linked)
@@ -0,0 +1,85 @@
+import html
+import math
+import re
+
+import markdown
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+from markdown.extensions import Extension
+from markdown.treeprocessors import Treeprocessor
+
+EXCERPT_LENGTH = 200
+WORDS_PER_MINUTE = 200
+
+SAFE_URL_SCHEMES = {"http", "https", "mailto"}
+# Brauzer URL'dagi boshqaruv belgilari va bo'shliqlarni tashlab yuboradi
+# (`java\tscript:`), shuning uchun sxema ularsiz tekshiriladi
+IGNORED_URL_CHARS = re.compile(r"[\x00-\x20\x7f-\x9f\s]+")
+URL_SCHEME = re.compile(r"^([a-z][a-z0-9+.\-]*):", re.IGNORECASE)
+# Ishlatiladigan kengaytmalar chiqaradigan atributlar; qolgani (masalan
+# `onclick`) tashlab yuboriladi
+SAFE_ATTRIBUTES = {"href", "src", "alt", "title", "id", "class", "rel", "align", "start"}
+URL_ATTRIBUTES = ("href", "src")
+# "extra" ning `attr_list` siz qismi: u `{: onclick=...}` bilan istalgan
+# atributni qo'shishga ruxsat beradi; `md_in_html` xom HTML bilan bog'liq
+MARKDOWN_EXTENSIONS = ["abbr", "def_list", "fenced_code", "footnotes", "tables"]
+
+
+def is_safe_url(value):
+    """
+    Allowlist: `http`, `https`, `mailto` yoki sxemasiz (nisbiy) URL.
+    Markdown serializer `&#106;` kabi entity'larni o'zgartirmay chiqaradi,
+    brauzer esa ularni decode qiladi — shuning uchun avval entity'lar
+    (ichma-ich bo'lsa ham) ochiladi.
+    """
+    previous = None
+    while value != previous:
+        previous, value = value, html.unescape(value)
+    match = URL_SCHEME.match(IGNORED_URL_CHARS.sub("", value))
+    return match is None or match.group(1).lower() in SAFE_URL_SCHEMES
+
+
+class _UnsafeUrlTreeprocessor(Treeprocessor):
+    def run(self, root):
+        for element in root.iter():
+            for attr in list(element.attrib):
+                if attr not in SAFE_ATTRIBUTES or (
+                    attr in URL_ATTRIBUTES and not is_safe_url(element.get(attr))
+                ):
+                    del element.attrib[attr]
+
+
+class SafeMarkdownExtension(Extension):
+    """
+    Post'larni anonim foydalanuvchilar ham yaratadi, shuning uchun xom HTML
+    matn sifatida escape qilinadi, faqat allowlist'dagi atributlar va URL
+    sxemalari qoladi.
+    """
+
+    def extendMarkdown(self, md):
+        md.preprocessors.deregister("html_block")
+        md.inlinePatterns.deregister("html")
+        md.treeprocessors.register(_UnsafeUrlTreeprocessor(md), "unsafe_urls", 0)
+
+
+def render_markdown(text):
+    return markdown.markdown(
+        text or "",
+        extensions=[*MARKDOWN_EXTENSIONS, "sane_lists", SafeMarkdownExtension()],
+        # Jadval tekislash `style` o'rniga `align` bilan
+        extension_configs={"tables": {"use_align_attribute": True}},
+        output_format="html",
+    )
+
+
+def render_content(text):
+    """
+    Post matnini bir marta render qiladi: `(content_html, excerpt, reading_time)`.
+    `reading_time` — daqiqalarda, kamida 1.
+    """
+    content_html = render_markdown(text)
+    plain = html.unescape(strip_tags(content_html))
+    plain = re.sub(r"\s+", " ", plain).strip()
+    excerpt = Truncator(plain).chars(EXCERPT_LENGTH)
+    reading_time = max(1, math.ceil(len(plain.split()) / WORDS_PER_MINUTE))
+    return content_html, excerpt, reading_time
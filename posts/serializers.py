@@ -1,12 +1,21 @@
 from rest_framework import serializers
-from .models import Tag, Post, PostComment, PostLike
 
+from core.serializers import SrcsetField
+from tags.models import Tag
+from tags.serializers import TagSerializer
+from .models import Post, PostComment, PostLike, RelatedPost
+from .related import get_related_limit
+
+
+class TagUsageSerializer(serializers.ModelSerializer):
+    # Tag umumiy, lekin bu ro'yxatda faqat post'lar soni
+    usage_count = serializers.IntegerField(source="post_count", read_only=True)
 
-class TagSerializer(serializers.ModelSerializer):
     class Meta:
         model = Tag
-        fields = ["id", "name"]
-        ref_name = "PostsTagSerializer"
+        fields = ["id", "name", "usage_count"]
+        read_only_fields = fields
+        ref_name = "PostsTagUsageSerializer"
 
 
 class PostCommentSerializer(serializers.ModelSerializer):
@@ -16,26 +25,86 @@ class PostCommentSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at"]
 
 
+class RelatedPostSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Post
+        fields = ["id", "uuid", "title", "excerpt", "image", "created_at"]
+        read_only_fields = fields
+
+
 class PostSerializer(serializers.ModelSerializer):
     tags = TagSerializer(many=True, read_only=True)
-    comments = PostCommentSerializer(many=True, read_only=True)
-    likes_count = serializers.IntegerField(source="likes.count", read_only=True)
-    comments_count = serializers.IntegerField(source="comments.count", read_only=True)
+    image_srcset = SrcsetField(source="image_variants")
+    likes_count = serializers.IntegerField(read_only=True)
+    comments_count = serializers.IntegerField(read_only=True)
+    related = serializers.SerializerMethodField()
 
     class Meta:
         model = Post
         fields = [
             "id",
+            "uuid",
             "title",
             "content",
+            "content_html",
+            "excerpt",
+            "reading_time",
+            "image",
+            "image_srcset",
+            "tags",
+            "likes_count",
+            "comments_count",
+            "related",
+            "created_at",
+            "updated_at",
+        ]
+
+    def get_related(self, obj):
+        # Bitta so'rov: relatedpost_score_idx bo'yicha, JOIN bilan
+        links = (
+            RelatedPost.objects.filter(post=obj)
+            .select_related("related")
+            .only(
+                "related__id",
+                "related__uuid",
+                "related__title",
+                "related__excerpt",
+                "related__image",
+                "related__created_at",
+            )
+            .order_by("-score")[: get_related_limit()]
+        )
+        return RelatedPostSerializer(
+            [link.related for link in links], many=True, context=self.context
+        ).data
+
+
+class PostSummarySerializer(serializers.ModelSerializer):
+    """
+    List va home uchun: comment thread'siz, content o'rniga excerpt.
+    `Post.objects.summaries()` bilan ishlatiladi.
+    """
+
+    tags = TagSerializer(many=True, read_only=True)
+    image_srcset = SrcsetField(source="image_variants")
+
+    class Meta:
+        model = Post
+        fields = [
+            "id",
+            "uuid",
+            "title",
+            "excerpt",
+            "reading_time",
             "image",
+            "image_srcset",
             "tags",
             "likes_count",
             "comments_count",
-            "comments",
             "created_at",
             "updated_at",
         ]
+        read_only_fields = fields
 
 
 class PostCreateUpdateSerializer(serializers.ModelSerializer):
@@ -45,7 +114,8 @@ class PostCreateUpdateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Post
-        fields = ["title", "content", "image", "tags"]
+        fields = ["uuid", "title", "content", "image", "tags"]
+        read_only_fields = ["uuid"]
 
     def create(self, validated_data):
         tags = validated_data.pop("tags", [])
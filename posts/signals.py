@@ -0,0 +1,14 @@
+from django.db.models.signals import m2m_changed, post_delete, pre_delete
+
+from .models import Post
+from .related import refresh_linked, remember_linked, tags_changed
+
+
+def connect_signals():
+    m2m_changed.connect(
+        tags_changed, sender=Post.tags.through, dispatch_uid="related-posts-tags"
+    )
+    pre_delete.connect(
+        remember_linked, sender=Post, dispatch_uid="related-posts-remember"
+    )
+    post_delete.connect(refresh_linked, sender=Post, dispatch_uid="related-posts-refresh")
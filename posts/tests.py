@@ -1,3 +1,373 @@
-from django.test import TestCase
+from html.parser import HTMLParser
+from io import StringIO
 
-# Create your tests here.
+from datetime import datetime, timedelta
+
+import markdown
+from django.contrib.admin.sites import AdminSite
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from .admin import PostCommentAdmin, PostLikeAdmin
+from tags.models import Tag
+from .models import Post, PostComment, PostLike, RelatedPost
+from .related import affected_posts, refresh_all, refresh_for_post
+from .rendering import SAFE_ATTRIBUTES, SafeMarkdownExtension, render_markdown
+
+
+@override_settings(LIKE_BUFFER_SIZE=0)
+class CounterTests(TestCase):
+    def setUp(self):
+        self.post = Post.objects.create(title="Counters", content="Body")
+
+    def counts(self):
+        self.post.refresh_from_db()
+        return self.post.likes_count, self.post.comments_count
+
+    def test_comment_increments_counter(self):
+        url = reverse("posts:post-comment-list-create", args=[self.post.uuid])
+        response = self.client.post(url, {"content": "Hi"}, REMOTE_ADDR="10.0.1.1")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.counts(), (0, 1))
+
+    def test_like_toggle_increments_and_decrements(self):
+        url = reverse("posts:post-like-toggle", args=[self.post.uuid])
+        self.client.post(url, REMOTE_ADDR="10.0.1.2")
+        self.assertEqual(self.counts(), (1, 0))
+        self.client.post(url, REMOTE_ADDR="10.0.1.3")
+        self.assertEqual(self.counts(), (2, 0))
+        self.client.post(url, REMOTE_ADDR="10.0.1.2")
+        self.assertEqual(self.counts(), (1, 0))
+
+    def test_recount_command_repairs_drift(self):
+        PostLike.objects.create(post=self.post, ip_address="10.0.1.4")
+        Post.objects.filter(pk=self.post.pk).update(likes_count=7, comments_count=3)
+        call_command("recount_counters", stdout=StringIO())
+        self.assertEqual(self.counts(), (1, 0))
+
+    def test_admin_delete_paths_recount(self):
+        site = AdminSite()
+        comments = [
+            PostComment.objects.create(post=self.post, content=str(i)) for i in range(3)
+        ]
+        like = PostLike.objects.create(post=self.post, ip_address="10.0.1.5")
+        Post.objects.filter(pk=self.post.pk).recount_counters()
+        self.assertEqual(self.counts(), (1, 3))
+
+        comment_admin = PostCommentAdmin(PostComment, site)
+        # Django'ning o'zidagi `delete_selected` action'i shu metodni chaqiradi
+        comment_admin.delete_queryset(
+            None, PostComment.objects.filter(pk__in=[c.pk for c in comments[:2]])
+        )
+        self.assertEqual(self.counts(), (1, 1))
+        # Change sahifasidagi "Delete"
+        PostLikeAdmin(PostLike, site).delete_model(None, like)
+        self.assertEqual(self.counts(), (0, 1))
+
+
+class KeysetPaginationTests(TestCase):
+    url = reverse("posts:post-list-create")
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        # Ikki juftlikda `created_at` bir xil — tartibni `id` hal qiladi
+        offsets = [0, 1, 1, 2, 3, 3, 4]
+        for i, offset in enumerate(offsets):
+            post = Post.objects.create(title=f"Post {i}", content="Body")
+            Post.objects.filter(pk=post.pk).update(
+                created_at=now - timedelta(minutes=offset)
+            )
+        cls.expected = [
+            str(uuid)
+            for uuid in Post.objects.order_by("-created_at", "-id").values_list(
+                "uuid", flat=True
+            )
+        ]
+
+    def walk(self, url):
+        seen = []
+        while url:
+            data = self.client.get(url).json()
+            seen.extend(item["uuid"] for item in data["results"])
+            url = data["next"]
+        return seen
+
+    def test_pages_follow_created_at_then_id(self):
+        self.assertEqual(self.walk(f"{self.url}?page_size=2"), self.expected)
+
+    def test_cursor_is_stable_under_inserts(self):
+        first = self.client.get(self.url, {"page_size": 3}).json()
+        # Birinchi sahifadan keyin yangi post qo'shilsa ham keyingi
+        # sahifalarda takror yoki tushib qolgan qator bo'lmaydi
+        Post.objects.create(title="Newest", content="Body")
+        rest = self.walk(first["next"])
+        self.assertEqual(
+            [item["uuid"] for item in first["results"]] + rest, self.expected
+        )
+
+    def test_last_page_has_no_next(self):
+        data = self.client.get(self.url, {"page_size": len(self.expected)}).json()
+        self.assertIsNone(data["next"])
+
+    def test_invalid_cursor_is_404(self):
+        response = self.client.get(self.url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 404)
+
+
+class SummaryTests(TestCase):
+    url = reverse("posts:post-list-create")
+
+    @classmethod
+    def setUpTestData(cls):
+        tag = Tag.objects.create(name="django")
+        for i in range(3):
+            post = Post.objects.create(title=f"Post {i}", content="Long body " * 200)
+            post.tags.add(tag)
+
+    def test_list_items_carry_excerpt_not_body(self):
+        item = self.client.get(self.url).json()["results"][0]
+        self.assertNotIn("content", item)
+        self.assertNotIn("comments", item)
+        self.assertTrue(item["excerpt"].startswith("Long body"))
+        self.assertLessEqual(len(item["excerpt"]), 200)
+        self.assertEqual(item["tags"][0]["name"], "django")
+
+    def test_list_query_skips_body_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url)
+        # Sahifa, tag prefetch va facet'lar — post soniga bog'liq emas
+        self.assertEqual(len(queries), 3)
+        self.assertNotIn('"posts_post"."content"', queries[0]["sql"])
+        self.assertNotIn('"posts_post"."content_html"', queries[0]["sql"])
+
+
+class TagYearFilterTests(TestCase):
+    url = reverse("posts:post-list-create")
+
+    @classmethod
+    def setUpTestData(cls):
+        tags = {name: Tag.objects.create(name=name) for name in ("django", "api", "python")}
+        cls.posts = {}
+        for title, year, names in (
+            ("a", 2024, ["django", "api"]),
+            ("b", 2025, ["django"]),
+            ("c", 2025, ["python"]),
+        ):
+            post = Post.objects.create(title=title, content="Body")
+            post.tags.add(*(tags[name] for name in names))
+            Post.objects.filter(pk=post.pk).update(
+                created_at=timezone.make_aware(datetime(year, 6, 1))
+            )
+            cls.posts[title] = post
+
+    def titles(self, **params):
+        data = self.client.get(self.url, params).json()
+        return sorted(item["title"] for item in data["results"])
+
+    def test_tags_match_any_by_default(self):
+        self.assertEqual(self.titles(tag=["django", "python"]), ["a", "b", "c"])
+        self.assertEqual(self.titles(tag=["api", "missing"]), ["a"])
+        self.assertEqual(self.titles(tag=["missing"]), [])
+
+    def test_match_all_requires_every_tag(self):
+        self.assertEqual(self.titles(tag=["django", "api"], match="all"), ["a"])
+        self.assertEqual(self.titles(tag=["django", "missing"], match="all"), [])
+
+    def test_year_filter(self):
+        self.assertEqual(self.titles(year=2025), ["b", "c"])
+        self.assertEqual(self.titles(year=2025, tag="django"), ["b"])
+        self.assertEqual(self.titles(year=2023), [])
+        response = self.client.get(self.url, {"year": "soon"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_facets_count_the_filtered_set(self):
+        facets = self.client.get(self.url).json()["facets"]
+        self.assertEqual(
+            facets,
+            [
+                {"name": "django", "count": 2},
+                {"name": "api", "count": 1},
+                {"name": "python", "count": 1},
+            ],
+        )
+        facets = self.client.get(self.url, {"year": 2025}).json()["facets"]
+        self.assertEqual(
+            facets, [{"name": "django", "count": 1}, {"name": "python", "count": 1}]
+        )
+
+    def test_facets_only_on_first_page(self):
+        data = self.client.get(self.url, {"page_size": 1}).json()
+        self.assertIn("facets", data)
+        self.assertNotIn("facets", self.client.get(data["next"]).json())
+
+
+class DetailValidatorTests(TestCase):
+    def setUp(self):
+        self.post = Post.objects.create(title="Detail", content="Body")
+        self.url = reverse("posts:post-detail", args=[self.post.uuid])
+
+    def test_fresh_copy_is_304_without_serializing(self):
+        response = self.client.get(self.url)
+        self.assertIn("no-cache", response["Cache-Control"])
+        # Faqat validator so'rovi — obyekt va tag'lar o'qilmaydi
+        with self.assertNumQueries(1):
+            cached = self.client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.content, b"")
+        self.assertEqual(cached["ETag"], response["ETag"])
+        not_modified = self.client.get(
+            self.url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_comment_changes_etag(self):
+        # Hisoblagichlar `updated_at` ni o'zgartirmaydi — ETag ularni hisobga oladi
+        etag = self.client.get(self.url)["ETag"]
+        comments = reverse("posts:post-comment-list-create", args=[self.post.uuid])
+        self.client.post(comments, {"content": "Hi"}, REMOTE_ADDR="10.0.2.1")
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["comments_count"], 1)
+
+    def test_browsable_api_has_its_own_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(
+            self.url, HTTP_ACCEPT="text/html", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_unknown_post_is_404(self):
+        url = reverse("posts:post-detail", args=["00000000-0000-0000-0000-000000000000"])
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_tag_rename_changes_etag(self):
+        post = Post.objects.create(title="Tagged", content="Body")
+        tag = Tag.objects.create(name="django")
+        post.tags.add(tag)
+        url = reverse("posts:post-detail", args=[post.uuid])
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304
+        )
+        Tag.objects.filter(pk=tag.pk).update(name="python")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["tags"][0]["name"], "python")
+
+
+class UnsafeUrlTests(SimpleTestCase):
+    unsafe = [
+        "[x](javascript:alert(1))",
+        "[x](JavaScript:alert(1))",
+        "[x]( javascript:alert(1))",
+        "[x](<java\tscript:alert(1)>)",
+        "[x](&#106;avascript:alert(1))",
+        "[x](&#x6A;avascript:alert(1))",
+        "[x](java&#x73;cript:alert(1))",
+        "[x](&#74;AVASCRIPT&colon;alert(1))",
+        "[x](&#x09;javascript:alert(1))",
+        "[x](vbscript:msgbox(1))",
+        "![i](data:image/svg+xml;base64,PHN2Zz4=)",
+        "[x](file:///etc/passwd)",
+    ]
+    safe = {
+        "[x](https://example.com/a)": 'href="https://example.com/a"',
+        "[x](http://example.com)": 'href="http://example.com"',
+        "[x](mailto:me@example.com)": 'href="mailto:me@example.com"',
+        "[x](/posts/1/)": 'href="/posts/1/"',
+        "[x](#intro)": 'href="#intro"',
+        "[x](notes/a:b)": 'href="notes/a:b"',
+        "![i](https://example.com/i.png)": 'src="https://example.com/i.png"',
+    }
+
+    def test_unsafe_schemes_are_dropped(self):
+        for text in self.unsafe:
+            with self.subTest(text=text):
+                html = render_markdown(text)
+                self.assertNotIn("href", html)
+                self.assertNotIn("src", html)
+
+    def test_allowed_urls_are_kept(self):
+        for text, attribute in self.safe.items():
+            with self.subTest(text=text):
+                self.assertIn(attribute, render_markdown(text))
+
+    def attributes(self, html):
+        parser = HTMLParser()
+        found = set()
+        parser.handle_starttag = lambda tag, attrs: found.update(
+            name for name, _ in attrs
+        )
+        parser.feed(html)
+        return found
+
+    def test_attribute_lists_cannot_add_handlers(self):
+        for text in [
+            '[x](http://a){: onclick="alert(1)"}',
+            'Paragraph\n{: onmouseover="alert(1)" }',
+            '```{ .py onclick="alert(1)" }\nx\n```',
+        ]:
+            with self.subTest(text=text):
+                self.assertLessEqual(
+                    self.attributes(render_markdown(text)), SAFE_ATTRIBUTES
+                )
+
+    def test_treeprocessor_drops_unknown_attributes(self):
+        # `attr_list` qayta yoqilsa ham allowlist ishlaydi
+        html = markdown.markdown(
+            '[x](http://a){: onclick="alert(1)" title="t"}',
+            extensions=["attr_list", SafeMarkdownExtension()],
+        )
+        self.assertEqual(self.attributes(html), {"href", "title"})
+
+    def test_extension_markup_is_kept(self):
+        html = render_markdown(
+            "| a |\n|:-|\n| 1 |\n\nNote[^1]\n\n[^1]: Foot\n\n```py\nx\n```"
+        )
+        for fragment in ('align="left"', 'href="#fn:1"', 'class="language-py"'):
+            self.assertIn(fragment, html)
+
+    def test_raw_html_is_escaped(self):
+        html = render_markdown('<a href="javascript:alert(1)">x</a>')
+        self.assertNotIn("<a", html)
+
+
+@override_settings(RELATED_POSTS_LIMIT=2)
+class RelatedPostsTests(TestCase):
+    def setUp(self):
+        python, django = Tag.objects.create(name="python"), Tag.objects.create(
+            name="django"
+        )
+        self.strong = []
+        for i in range(3):
+            post = Post.objects.create(title=f"Strong {i}", content="Body")
+            post.tags.add(python, django)
+            self.strong.append(post)
+        self.weak = Post.objects.create(title="Weak", content="Body")
+        self.weak.tags.add(python)
+        self.new = Post.objects.create(title="New", content="Body")
+        refresh_all()
+        self.new.tags.add(python)
+
+    def table(self):
+        # Ballar emas, ro'yxatlar tarkibi: og'irlik o'zgarishi eski ballarni
+        # batch komandasigacha biroz siljitadi
+        return sorted(RelatedPost.objects.values_list("post_id", "related_id"))
+
+    def test_full_lists_with_higher_scores_are_skipped(self):
+        affected = affected_posts(self.new.pk)
+        self.assertIn(self.new.pk, affected)
+        # Ro'yxati to'la va ballari yuqori — yangi post u yerga kira olmaydi
+        self.assertFalse(affected & {post.pk for post in self.strong})
+
+    def test_incremental_refresh_matches_full_rebuild(self):
+        refresh_for_post(self.new.pk)
+        incremental = self.table()
+        refresh_all()
+        self.assertEqual(incremental, self.table())
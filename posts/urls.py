@@ -1,15 +1,38 @@
 from django.urls import path
-from .views import PostListCreateView, PostDetailView, CommentCreateView, LikeToggleView
+
+from core.views import SimilarContentView
+from .views import (
+    PostListCreateView,
+    PostDetailView,
+    CommentListCreateView,
+    LikeToggleView,
+    TagListView,
+    TrendingPostListView,
+)
 
 app_name = "posts"
 
 urlpatterns = [
     # /api/posts/
     path("", PostListCreateView.as_view(), name="post-list-create"),
+    # /api/posts/tags/
+    path("tags/", TagListView.as_view(), name="post-tag-list"),
+    # /api/posts/trending/
+    path("trending/", TrendingPostListView.as_view(), name="post-trending"),
     # /api/posts/<uuid:pk>/
     path("<uuid:pk>/", PostDetailView.as_view(), name="post-detail"),
     # /api/posts/<uuid:pk>/comments/
-    path("<uuid:pk>/comments/", CommentCreateView.as_view(), name="post-comment-create"),
+    path(
+        "<uuid:pk>/comments/",
+        CommentListCreateView.as_view(),
+        name="post-comment-list-create",
+    ),
+    # /api/posts/<uuid:pk>/similar/
+    path(
+        "<uuid:pk>/similar/",
+        SimilarContentView.as_view(source_kind="post"),
+        name="post-similar",
+    ),
     # /api/posts/<uuid:pk>/like/
     path("<uuid:pk>/like/", LikeToggleView.as_view(), name="post-like-toggle"),
 ]
\ No newline at end of file
@@ -1,58 +1,133 @@
+from django.db import transaction
+from django.db.models import F, Max
 from django.shortcuts import get_object_or_404
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .models import Post, PostLike
+from core.conditional import conditional_get, object_validators, tag_names
+from core.filters import TagFacetsMixin
+from core.likes import toggle_like
+from core.pagination import KeysetPagination, ThreadPagination
+from core.throttling import TokenBucketThrottle
+from core.trending import trending_limit
+from core.utils import get_client_ip
+from tags.models import Tag
+from .models import Post, PostComment
 from .serializers import (
     PostSerializer,
+    PostSummarySerializer,
     PostCreateUpdateSerializer,
     PostCommentSerializer,
+    TagUsageSerializer,
 )
 
 
-class PostListCreateView(generics.ListCreateAPIView):
-    queryset = Post.objects.all().prefetch_related("tags", "comments", "likes")
+class PostListCreateView(TagFacetsMixin, generics.ListCreateAPIView):
+    queryset = Post.objects.summaries()
     permission_classes = [permissions.AllowAny]
+    pagination_class = KeysetPagination
 
     def get_serializer_class(self):
         if self.request.method == "POST":
             return PostCreateUpdateSerializer
-        return PostSerializer
+        return PostSummarySerializer
 
 
 class PostDetailView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Post.objects.all().prefetch_related("tags", "comments", "likes")
+    queryset = Post.objects.all().prefetch_related("tags")
     permission_classes = [permissions.AllowAny]
+    lookup_field = "uuid"
+    lookup_url_kwarg = "pk"
 
     def get_serializer_class(self):
         if self.request.method in ("PUT", "PATCH"):
             return PostCreateUpdateSerializer
         return PostSerializer
 
+    def get_validators(self, request, *args, **kwargs):
+        # Tag nomlari va related post sarlavhalari ham javobda
+        return object_validators(
+            Post.objects.annotate(
+                related_at=Max("related_links__computed_at"),
+                related_updated_at=Max("related_links__related__updated_at"),
+                tag_names=tag_names(),
+            ),
+            "likes_count",
+            "comments_count",
+            "related_at",
+            "related_updated_at",
+            "tag_names",
+            uuid=kwargs["pk"],
+        )
+
+    @conditional_get
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+
+class CommentListCreateView(generics.ListCreateAPIView):
+    """GET: comment thread'ini cursor bo'yicha sahifalab beradi, POST: anonim comment."""
 
-class CommentCreateView(generics.CreateAPIView):
     serializer_class = PostCommentSerializer
     permission_classes = [permissions.AllowAny]
+    pagination_class = ThreadPagination
+    throttle_classes = [TokenBucketThrottle]
+    throttle_scope = "comments"
 
-    def perform_create(self, serializer):
+    def get_post(self):
         post_uuid = self.kwargs.get("pk")
-        post = get_object_or_404(Post, uuid=post_uuid)
-        serializer.save(post=post)
+        return get_object_or_404(Post.objects.only("pk"), uuid=post_uuid)
 
+    def get_queryset(self):
+        return PostComment.objects.filter(post=self.get_post())
+
+    def perform_create(self, serializer):
+        post = self.get_post()
+        with transaction.atomic():
+            serializer.save(post=post)
+            Post.objects.filter(pk=post.pk).update(
+                comments_count=F("comments_count") + 1
+            )
 
 
 class LikeToggleView(APIView):
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [TokenBucketThrottle]
+    throttle_scope = "likes"
 
     def post(self, request, pk):
-        post = get_object_or_404(Post, uuid=pk)
-        ip = self.get_client_ip(request)
+        post = get_object_or_404(Post.objects.only("pk"), uuid=pk)
+        ip = get_client_ip(request)
 
-        like, created = PostLike.objects.get_or_create(post=post, ip_address=ip)
-
-        if not created:
-            like.delete()
+        # Niyat buferga yoziladi, bazaga bir necha bosish birga flush qilinadi
+        if not toggle_like("posts.PostLike", "post", post.pk, ip):
             return Response({"detail": "Like removed"}, status=status.HTTP_200_OK)
-
         return Response({"detail": "Liked"}, status=status.HTTP_200_OK)
+
+
+class TagListView(generics.ListAPIView):
+    """Tag'lar va ularning saqlangan `post_count` i — bitta arzon so'rov."""
+
+    queryset = Tag.objects.filter(post_count__gt=0).order_by("-post_count", "name")
+    serializer_class = TagUsageSerializer
+    permission_classes = [permissions.AllowAny]
+
+
+class TrendingPostListView(generics.ListAPIView):
+    """
+    GET ?limit=10 — `trending_score` bo'yicha eng faol posts.
+    Ball `refresh_trending` komandasi tomonidan davriy yangilanadi, bu yerda
+    faqat index bo'yicha `LIMIT n` o'qiladi.
+    """
+
+    serializer_class = PostSummarySerializer
+    permission_classes = [permissions.AllowAny]
+    pagination_class = None
+
+    def get_queryset(self):
+        return (
+            Post.objects.summaries()
+            .filter(trending_score__gt=0)
+            .order_by("-trending_score", "-id")[: trending_limit(self.request)]
+        )
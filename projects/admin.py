@@ -1,12 +1,8 @@
 from django.contrib import admin
-from .models import Tag, Project, ProjectLike, ProjectComment
 
+from core.counters import RecountOnDeleteAdminMixin
 
-@admin.register(Tag)
-class TagAdmin(admin.ModelAdmin):
-    list_display = ("name",)
-    search_fields = ("name",)
-    ordering = ("name",)
+from .models import Project, ProjectLike, ProjectComment
 
 
 @admin.register(Project)
@@ -43,19 +39,10 @@ class ProjectAdmin(admin.ModelAdmin):
         ("Timestamps", {"fields": ("created_at", "updated_at")}),
     )
 
-    def likes_count(self, obj):
-        return obj.likes.count()
-
-    likes_count.short_description = "Likes"
-
-    def comments_count(self, obj):
-        return obj.comments.count()
-
-    comments_count.short_description = "Comments"
-
 
 @admin.register(ProjectLike)
-class ProjectLikeAdmin(admin.ModelAdmin):
+class ProjectLikeAdmin(RecountOnDeleteAdminMixin, admin.ModelAdmin):
+    parent_field = "project"
     list_display = ("project", "ip_address", "created_at")
     list_filter = ("created_at", "project")
     search_fields = ("ip_address", "project__title")
@@ -66,14 +53,15 @@ class ProjectLikeAdmin(admin.ModelAdmin):
     # Custom bulk delete action
     def delete_selected_likes(self, request, queryset):
         count = queryset.count()
-        queryset.delete()
+        self.delete_queryset(request, queryset)
         self.message_user(request, f"{count} ta like muvaffaqiyatli o‘chirildi.")
 
     delete_selected_likes.short_description = "Tanlangan like’larni o‘chirish"
 
 
 @admin.register(ProjectComment)
-class ProjectCommentAdmin(admin.ModelAdmin):
+class ProjectCommentAdmin(RecountOnDeleteAdminMixin, admin.ModelAdmin):
+    parent_field = "project"
     list_display = ("project", "short_content", "created_at")
     list_filter = ("created_at", "project")
     search_fields = ("content", "project__title")
@@ -87,7 +75,7 @@ class ProjectCommentAdmin(admin.ModelAdmin):
 
     def delete_selected_comments(self, request, queryset):
         count = queryset.count()
-        queryset.delete()
+        self.delete_queryset(request, queryset)
         self.message_user(request, f"{count} ta comment muvaffaqiyatli o‘chirildi.")
 
     delete_selected_comments.short_description = "Tanlangan kommentlarni o‘chirish"
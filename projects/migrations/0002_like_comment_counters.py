@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:45
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    Project = apps.get_model("projects", "Project")
+    ProjectLike = apps.get_model("projects", "ProjectLike")
+    ProjectComment = apps.get_model("projects", "ProjectComment")
+
+    def count_of(model):
+        return Coalesce(
+            Subquery(
+                model.objects.filter(project=OuterRef("pk"))
+                .order_by()
+                .values("project")
+                .annotate(total=Count("pk"))
+                .values("total")
+            ),
+            0,
+        )
+
+    Project.objects.update(
+        likes_count=count_of(ProjectLike),
+        comments_count=count_of(ProjectComment),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="comments_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="likes_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
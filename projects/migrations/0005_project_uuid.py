@@ -0,0 +1,39 @@
+import uuid
+
+from django.db import migrations, models
+
+
+def backfill_uuids(apps, schema_editor):
+    Project = apps.get_model("projects", "Project")
+    batch = []
+    for obj in Project.objects.filter(uuid__isnull=True).only("pk").iterator():
+        obj.uuid = uuid.uuid4()
+        batch.append(obj)
+        if len(batch) >= 500:
+            Project.objects.bulk_update(batch, ["uuid"])
+            batch = []
+    if batch:
+        Project.objects.bulk_update(batch, ["uuid"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0004_comment_thread_index"),
+    ]
+
+    operations = [
+        # 1) null bilan qo'shamiz, 2) mavjud qatorlarni to'ldiramiz,
+        # 3) unique + NOT NULL qilamiz (unique index shu yerda yaratiladi)
+        migrations.AddField(
+            model_name="project",
+            name="uuid",
+            field=models.UUIDField(editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_uuids, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="project",
+            name="uuid",
+            field=models.UUIDField(default=uuid.uuid4, editable=False, unique=True),
+        ),
+    ]
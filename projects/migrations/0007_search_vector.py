@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:53
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+
+# `search_vector` ni ORM emas, Postgres o'zi yangilaydi: har qanday yozuv
+# (admin, bulk_create, import) indeksni dolzarb saqlaydi. 'simple' config —
+# kontent o'zbek/rus/ingliz aralash, stemming qo'llanmaydi.
+CREATE_TRIGGER = """
+CREATE FUNCTION projects_project_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('simple', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(NEW.description, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER projects_project_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description ON projects_project
+    FOR EACH ROW EXECUTE FUNCTION projects_project_search_vector_update();
+
+UPDATE projects_project SET search_vector =
+    setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce(description, '')), 'B');
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER IF EXISTS projects_project_search_vector_trigger ON projects_project;
+DROP FUNCTION IF EXISTS projects_project_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0006_image_variants"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="project_search_idx"
+            ),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER, DROP_TRIGGER),
+    ]
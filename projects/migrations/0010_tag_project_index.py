@@ -0,0 +1,18 @@
+from django.db import migrations
+
+
+# Auto-created through jadvalida faqat `(project_id, tag_id)` bor; tag bo'yicha
+# filtr va teskari yo'nalish uchun index-only scan'ga `(tag_id, project_id)` kerak.
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0009_trending"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "CREATE INDEX projects_project_tags_tag_project_idx "
+            "ON projects_project_tags (tag_id, project_id);",
+            "DROP INDEX IF EXISTS projects_project_tags_tag_project_idx;",
+        ),
+    ]
@@ -0,0 +1,114 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+# projects.Tag -> umumiy tags.Tag. Bir xil nomli (bo'shliqlari olib tashlangan)
+# tag'lar bitta qatorga birlashadi; through qatorlari nom bo'yicha yangi
+# tag'larga ko'chiriladi, so'ng vaqtinchalik `shared_tags` -> `tags`.
+def merge_tags(apps, schema_editor):
+    OldTag = apps.get_model("projects", "Tag")
+    Tag = apps.get_model("tags", "Tag")
+    Project = apps.get_model("projects", "Project")
+    old_through = Project.tags.through
+    new_through = Project.shared_tags.through
+
+    names = {
+        pk: name.strip() or name
+        for pk, name in OldTag.objects.values_list("pk", "name")
+    }
+    Tag.objects.bulk_create(
+        [Tag(name=name) for name in set(names.values())], ignore_conflicts=True
+    )
+    tag_ids = dict(
+        Tag.objects.filter(name__in=set(names.values())).values_list("name", "pk")
+    )
+    # Unique index migratsiya oxirida (deferred) yaratiladi — juftliklar shu yerda birlashadi
+    pairs = {
+        (project_id, tag_ids[names[tag_id]])
+        for project_id, tag_id in old_through.objects.values_list(
+            "project_id", "tag_id"
+        )
+    }
+    new_through.objects.bulk_create(
+        [
+            new_through(project_id=project_id, tag_id=tag_id)
+            for project_id, tag_id in pairs
+        ],
+        batch_size=1000,
+    )
+    usage = (
+        new_through.objects.filter(tag=OuterRef("pk"))
+        .order_by()
+        .values("tag")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    Tag.objects.update(project_count=Coalesce(Subquery(usage), 0))
+
+
+def split_tags(apps, schema_editor):
+    OldTag = apps.get_model("projects", "Tag")
+    Tag = apps.get_model("tags", "Tag")
+    Project = apps.get_model("projects", "Project")
+    old_through = Project.tags.through
+    new_through = Project.shared_tags.through
+
+    names = dict(
+        Tag.objects.filter(projects__isnull=False).distinct().values_list("pk", "name")
+    )
+    OldTag.objects.bulk_create([OldTag(name=name) for name in names.values()])
+    old_ids = dict(OldTag.objects.values_list("name", "pk"))
+    old_through.objects.bulk_create(
+        [
+            old_through(project_id=project_id, tag_id=old_ids[names[tag_id]])
+            for project_id, tag_id in new_through.objects.values_list(
+                "project_id", "tag_id"
+            )
+        ],
+        batch_size=1000,
+    )
+    usage = (
+        old_through.objects.filter(tag=OuterRef("pk"))
+        .order_by()
+        .values("tag")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    OldTag.objects.update(usage_count=Coalesce(Subquery(usage), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0010_tag_project_index"),
+        ("tags", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="shared_tags",
+            field=models.ManyToManyField(
+                blank=True, related_name="projects", to="tags.tag"
+            ),
+        ),
+        migrations.RunPython(merge_tags, split_tags),
+        migrations.RemoveField(
+            model_name="project",
+            name="tags",
+        ),
+        migrations.DeleteModel(
+            name="Tag",
+        ),
+        migrations.RenameField(
+            model_name="project",
+            old_name="shared_tags",
+            new_name="tags",
+        ),
+        # Eski through jadvali bilan birga o'chgan `(tag_id, project_id)` index'i
+        migrations.RunSQL(
+            "CREATE INDEX projects_project_tags_tag_project_idx ON projects_project_tags (tag_id, project_id);",
+            "DROP INDEX IF EXISTS projects_project_tags_tag_project_idx;",
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0011_shared_tags"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="projectcomment",
+            index=models.Index(
+                fields=["created_at", "project"], name="projectcomment_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="projectlike",
+            index=models.Index(
+                fields=["created_at", "project"], name="projectlike_created_idx"
+            ),
+        ),
+    ]
@@ -1,19 +1,66 @@
+import uuid
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.conf import settings
-
-
-class Tag(models.Model):
-    name = models.CharField(max_length=50, unique=True)
-
-    def __str__(self):
-        return self.name
+from django.db.models.functions import Left
+
+from core.cache import notify_content_updated
+from core.counters import count_subquery
+from core.users import OWNER_SUMMARY_FIELDS
+
+EXCERPT_LENGTH = 150
+
+
+class ProjectQuerySet(models.QuerySet):
+    def with_owner(self):
+        """
+        Owner va uning ixtiyoriy profili JOIN bilan, faqat summary ustunlari:
+        `auth_user` dan ism maydonlari, `core_userprofile` dan avatar.
+        """
+        fields = [
+            field.name
+            for field in self.model._meta.concrete_fields
+            if field.name != "search_vector"
+        ]
+        owner_fields = [f"owner__{field}" for field in OWNER_SUMMARY_FIELDS]
+        return self.select_related("owner__profile").only(
+            *fields, *owner_fields, "owner__profile__avatar"
+        )
+
+    def summaries(self):
+        """
+        List/home uchun yengil queryset: `description` ning faqat bosh qismi,
+        comment/like prefetch yo'q.
+        """
+        return (
+            self.with_owner()
+            .defer("description")
+            .annotate(excerpt_source=Left("description", EXCERPT_LENGTH + 1))
+            .prefetch_related("tags")
+        )
+
+    def recount_counters(self):
+        """Stored like/comment hisoblagichlarini ProjectLike/ProjectComment dan qayta hisoblaydi."""
+        updated = self.update(
+            likes_count=count_subquery(ProjectLike, "project"),
+            comments_count=count_subquery(ProjectComment, "project"),
+        )
+        # update() signal chaqirmaydi — keshlangan payload'lar eskirmasin
+        notify_content_updated(self.model)
+        return updated
 
 
 class Project(models.Model):
 
+    # Tashqi (URL) identifikator: ichki `id` ni oshkor qilmaydi, unique index bilan
+    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
     title = models.CharField(max_length=255)
     description = models.TextField()
     image = models.ImageField(upload_to="projects/images/", blank=True, null=True)
+    # Fon pipeline yaratgan WebP/AVIF nusxalar (qarang: core.images)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     github_link = models.URLField(blank=True, null=True)
     live_demo_link = models.URLField(blank=True, null=True)
     owner = models.ForeignKey(
@@ -21,24 +68,32 @@ class Project(models.Model):
         on_delete=models.CASCADE,
         related_name="projects",
     )
-    tags = models.ManyToManyField(Tag, related_name="projects", blank=True)
+    tags = models.ManyToManyField("tags.Tag", related_name="projects", blank=True)
+    # title (A) + description (B) — Postgres trigger yangilaydi (qarang: migratsiya)
+    search_vector = SearchVectorField(null=True, editable=False)
+    # Denormalized hisoblagichlar (qarang: `recount_counters` komandasi)
+    likes_count = models.PositiveIntegerField(default=0, editable=False)
+    comments_count = models.PositiveIntegerField(default=0, editable=False)
+    # Vaqt bo'yicha so'nuvchi like/comment bali (qarang: core.trending)
+    trending_score = models.FloatField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ProjectQuerySet.as_manager()
+
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # KeysetPagination: ORDER BY created_at DESC, id DESC
+            models.Index(fields=["-created_at", "-id"], name="project_created_id_idx"),
+            GinIndex(fields=["search_vector"], name="project_search_idx"),
+            # Trending: ORDER BY trending_score DESC, id DESC LIMIT n
+            models.Index(fields=["-trending_score", "-id"], name="project_trending_idx"),
+        ]
 
     def __str__(self):
         return self.title
 
-    @property
-    def likes_count(self):
-        return self.likes.count()
-
-    @property
-    def comments_count(self):
-        return self.comments.count()
-
 
 class ProjectLike(models.Model):
 
@@ -49,6 +104,12 @@ class ProjectLike(models.Model):
     class Meta:
         unique_together = ("project", "ip_address")  # bir IP faqat 1 marta like
         ordering = ["-created_at"]
+        indexes = [
+            # core.trending: WHERE created_at > ? — project_id index'dan o'qiladi
+            models.Index(
+                fields=["created_at", "project"], name="projectlike_created_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"Like from {self.ip_address} on {self.project}"
@@ -64,6 +125,14 @@ class ProjectComment(models.Model):
 
     class Meta:
         ordering = ["created_at"]
+        indexes = [
+            # ThreadPagination: WHERE project_id = ? ORDER BY created_at, id
+            models.Index(fields=["project", "created_at", "id"], name="projectcomment_thread_idx"),
+            # core.trending: WHERE created_at > ?
+            models.Index(
+                fields=["created_at", "project"], name="projectcomment_created_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"Comment on {self.project}"
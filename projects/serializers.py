@@ -1,13 +1,22 @@
+from django.utils.text import Truncator
 from rest_framework import serializers
 
-from .models import Tag, Project, ProjectComment
+from core.serializers import OwnerSummaryField, SrcsetField
+from tags.models import Tag
+from tags.serializers import TagSerializer
 
+from .models import EXCERPT_LENGTH, Project, ProjectComment
+
+
+class TagUsageSerializer(serializers.ModelSerializer):
+    # Tag umumiy, lekin bu ro'yxatda faqat project'lar soni
+    usage_count = serializers.IntegerField(source="project_count", read_only=True)
 
-class TagSerializer(serializers.ModelSerializer):
     class Meta:
         model = Tag
-        fields = ["id", "name"]
-        ref_name = "ProjectsTagSerializer"
+        fields = ["id", "name", "usage_count"]
+        read_only_fields = fields
+        ref_name = "ProjectsTagUsageSerializer"
 
 
 class ProjectCommentSerializer(serializers.ModelSerializer):
@@ -19,34 +28,70 @@ class ProjectCommentSerializer(serializers.ModelSerializer):
 
 class ProjectSerializer(serializers.ModelSerializer):
     tags = TagSerializer(many=True, read_only=True)
+    image_srcset = SrcsetField(source="image_variants")
+    owner = OwnerSummaryField()
     likes_count = serializers.IntegerField(read_only=True)
     comments_count = serializers.IntegerField(read_only=True)
-    comments = ProjectCommentSerializer(many=True, read_only=True)
 
     class Meta:
         model = Project
         fields = [
             "id",
+            "uuid",
             "title",
             "description",
             "image",
+            "image_srcset",
             "github_link",
             "live_demo_link",
             "owner",
             "tags",
             "likes_count",
             "comments_count",
-            "comments",
             "created_at",
             "updated_at",
         ]
         read_only_fields = [
+            "likes_count",
+            "comments_count",
+            "created_at",
+            "updated_at",
+        ]
+
+
+class ProjectSummarySerializer(serializers.ModelSerializer):
+    """
+    List va home uchun: comment thread'siz, description o'rniga excerpt.
+    `Project.objects.summaries()` bilan ishlatiladi.
+    """
+
+    tags = TagSerializer(many=True, read_only=True)
+    image_srcset = SrcsetField(source="image_variants")
+    owner = OwnerSummaryField()
+    excerpt = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Project
+        fields = [
+            "id",
+            "uuid",
+            "title",
+            "excerpt",
+            "image",
+            "image_srcset",
+            "github_link",
+            "live_demo_link",
             "owner",
+            "tags",
             "likes_count",
             "comments_count",
             "created_at",
             "updated_at",
         ]
+        read_only_fields = fields
+
+    def get_excerpt(self, obj):
+        return Truncator(obj.excerpt_source).chars(EXCERPT_LENGTH)
 
 
 class ProjectCreateUpdateSerializer(serializers.ModelSerializer):
@@ -57,6 +102,7 @@ class ProjectCreateUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Project
         fields = [
+            "uuid",
             "title",
             "description",
             "image",
@@ -64,6 +110,7 @@ class ProjectCreateUpdateSerializer(serializers.ModelSerializer):
             "live_demo_link",
             "tags",
         ]
+        read_only_fields = ["uuid"]
 
     def create(self, validated_data):
         tags = validated_data.pop("tags", [])
@@ -1,3 +1,137 @@
+import uuid
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.urls import reverse
+
+from core.models import UserProfile
+from tags.models import Tag
+from .models import EXCERPT_LENGTH, Project, ProjectComment
+
+
+def create_project(**kwargs):
+    owner = kwargs.pop("owner", None) or get_user_model().objects.create_user(
+        username=f"owner-{uuid.uuid4().hex[:8]}", password="x"
+    )
+    kwargs.setdefault("title", "Project")
+    kwargs.setdefault("description", "Description")
+    return Project.objects.create(owner=owner, **kwargs)
+
+
+class CommentThreadTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = create_project()
+        cls.comments = [
+            ProjectComment.objects.create(project=cls.project, content=f"#{i}")
+            for i in range(5)
+        ]
+        other = create_project()
+        ProjectComment.objects.create(project=other, content="elsewhere")
+
+    def url(self, project=None):
+        project = project or self.project
+        return reverse("projects:project-comment-list-create", args=[project.uuid])
+
+    def test_thread_pages_oldest_first(self):
+        seen, url = [], f"{self.url()}?page_size=2"
+        while url:
+            data = self.client.get(url).json()
+            self.assertLessEqual(len(data["results"]), 2)
+            seen.extend(item["id"] for item in data["results"])
+            url = data["next"]
+        self.assertEqual(seen, [comment.pk for comment in self.comments])
+
+    def test_unknown_project_is_404(self):
+        url = reverse("projects:project-comment-list-create", args=[uuid.uuid4()])
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+
+class OwnerSummaryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(
+            username="jasur", email="jasur@example.com", first_name="Jasur"
+        )
+        cls.project = create_project(owner=cls.owner)
+
+    def summary(self):
+        url = reverse("projects:project-detail", args=[self.project.uuid])
+        return self.client.get(url).json()["owner"]
+
+    def test_summary_does_not_leak_email(self):
+        owner = self.summary()
+        self.assertEqual(owner, {"id": self.owner.pk, "name": "Jasur", "avatar": None})
+        self.assertNotIn("example.com", str(owner))
+
+    def test_avatar_comes_from_opt_in_profile(self):
+        UserProfile.objects.create(user=self.owner, avatar="avatars/jasur.png")
+        self.assertEqual(
+            self.summary()["avatar"], "http://testserver/media/avatars/jasur.png"
+        )
+
+    def test_list_reads_owner_and_profile_in_one_join(self):
+        for _ in range(3):
+            create_project()
+        UserProfile.objects.create(user=self.owner, avatar="avatars/jasur.png")
+        # Sahifa, tag prefetch va facet'lar — owner/profil alohida so'rov qilmaydi
+        with self.assertNumQueries(3):
+            self.client.get(reverse("projects:project-list-create"))
+
+
+class SummaryTests(TestCase):
+    def test_list_items_carry_truncated_excerpt(self):
+        create_project(description="word " * 100)
+        item = self.client.get(reverse("projects:project-list-create")).json()[
+            "results"
+        ][0]
+        self.assertNotIn("description", item)
+        self.assertNotIn("comments", item)
+        self.assertEqual(len(item["excerpt"]), EXCERPT_LENGTH)
+        self.assertTrue(item["excerpt"].endswith("…"))
+
+    def test_short_description_is_kept_whole(self):
+        create_project(description="Short")
+        item = self.client.get(reverse("projects:project-list-create")).json()[
+            "results"
+        ][0]
+        self.assertEqual(item["excerpt"], "Short")
+
+
+class DetailValidatorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(username="owner")
+        cls.project = create_project(owner=cls.owner)
+        cls.tag = Tag.objects.create(name="django")
+        cls.project.tags.add(cls.tag)
+        cls.url = reverse("projects:project-detail", args=[cls.project.uuid])
+
+    def assertEtagChanges(self, change):
+        etag = self.client.get(self.url)["ETag"]
+        change()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_unchanged_detail_is_304(self):
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_owner_rename_changes_etag(self):
+        self.assertEtagChanges(
+            lambda: get_user_model().objects.filter(pk=self.owner.pk).update(
+                first_name="Renamed"
+            )
+        )
+
+    def test_avatar_change_changes_etag(self):
+        self.assertEtagChanges(
+            lambda: UserProfile.objects.create(user=self.owner, avatar="avatars/a.png")
+        )
 
-# Create your tests here.
+    def test_tag_rename_changes_etag(self):
+        self.assertEtagChanges(
+            lambda: Tag.objects.filter(pk=self.tag.pk).update(name="python")
+        )
@@ -1,20 +1,33 @@
 from django.urls import path
+
+from core.views import SimilarContentView
 from .views import (
     ProjectListCreateView,
     ProjectDetailView,
-    ProjectCommentCreateView,
+    ProjectCommentListCreateView,
     ProjectLikeToggleView,
+    ProjectTagListView,
+    TrendingProjectListView,
 )
 
 app_name = "projects"
 
 urlpatterns = [
     path("", ProjectListCreateView.as_view(), name="project-list-create"),
+    path("tags/", ProjectTagListView.as_view(), name="project-tag-list"),
+    path(
+        "trending/", TrendingProjectListView.as_view(), name="project-trending"
+    ),
     path("<uuid:pk>/", ProjectDetailView.as_view(), name="project-detail"),
     path(
         "<uuid:pk>/comments/",
-        ProjectCommentCreateView.as_view(),
-        name="project-comment-create",
+        ProjectCommentListCreateView.as_view(),
+        name="project-comment-list-create",
+    ),
+    path(
+        "<uuid:pk>/similar/",
+        SimilarContentView.as_view(source_kind="project"),
+        name="project-similar",
     ),
     path(
         "<uuid:pk>/like/", ProjectLikeToggleView.as_view(), name="project-like-toggle"
@@ -1,75 +1,132 @@
+from django.db import transaction
+from django.db.models import F
 from django.shortcuts import get_object_or_404
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .models import Project, ProjectLike
+from core.conditional import conditional_get, object_validators, tag_names
+from core.filters import TagFacetsMixin
+from core.likes import toggle_like
+from core.pagination import KeysetPagination, ThreadPagination
+from core.throttling import TokenBucketThrottle
+from core.trending import trending_limit
+from core.users import OWNER_VALIDATOR_FIELDS
+from core.utils import get_client_ip
+from tags.models import Tag
+from .models import Project, ProjectComment
 from .serializers import (
     ProjectSerializer,
+    ProjectSummarySerializer,
     ProjectCreateUpdateSerializer,
     ProjectCommentSerializer,
+    TagUsageSerializer,
 )
 
 
-class ProjectListCreateView(generics.ListCreateAPIView):
-    queryset = (
-        Project.objects.all()
-        .select_related("owner")
-        .prefetch_related("tags", "comments", "likes")
-    )
+class ProjectListCreateView(TagFacetsMixin, generics.ListCreateAPIView):
+    queryset = Project.objects.summaries()
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    pagination_class = KeysetPagination
 
     def get_serializer_class(self):
         if self.request.method == "POST":
             return ProjectCreateUpdateSerializer
-        return ProjectSerializer
+        return ProjectSummarySerializer
 
     def perform_create(self, serializer):
         serializer.save(owner=self.request.user)
 
 
 class ProjectDetailView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = (
-        Project.objects.all()
-        .select_related("owner")
-        .prefetch_related("tags", "comments", "likes")
-    )
+    queryset = Project.objects.with_owner().prefetch_related("tags")
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    lookup_field = "uuid"
+    lookup_url_kwarg = "pk"
 
     def get_serializer_class(self):
         if self.request.method in ("PUT", "PATCH"):
             return ProjectCreateUpdateSerializer
         return ProjectSerializer
 
+    def get_validators(self, request, *args, **kwargs):
+        # Owner ismi/avatari va tag nomlari ham javobda — ular ham ETag'ga kiradi
+        return object_validators(
+            Project.objects.annotate(tag_names=tag_names()),
+            "likes_count",
+            "comments_count",
+            "tag_names",
+            *OWNER_VALIDATOR_FIELDS,
+            uuid=kwargs["pk"],
+        )
+
+    @conditional_get
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+
+class ProjectCommentListCreateView(generics.ListCreateAPIView):
+    """GET: comment thread'ini cursor bo'yicha sahifalab beradi, POST: anonim comment."""
 
-class ProjectCommentCreateView(generics.CreateAPIView):
     serializer_class = ProjectCommentSerializer
     permission_classes = [permissions.AllowAny]  # anonim comment
+    pagination_class = ThreadPagination
+    throttle_classes = [TokenBucketThrottle]
+    throttle_scope = "comments"
+
+    def get_project(self):
+        project_uuid = self.kwargs.get("pk")
+        return get_object_or_404(Project.objects.only("pk"), uuid=project_uuid)
+
+    def get_queryset(self):
+        return ProjectComment.objects.filter(project=self.get_project())
 
     def perform_create(self, serializer):
-        project_id = self.kwargs.get("pk")
-        project = get_object_or_404(Project, pk=project_id)
-        serializer.save(project=project)
+        project = self.get_project()
+        with transaction.atomic():
+            serializer.save(project=project)
+            Project.objects.filter(pk=project.pk).update(
+                comments_count=F("comments_count") + 1
+            )
 
 
 class ProjectLikeToggleView(APIView):
     permission_classes = [permissions.AllowAny]  # anonim like
+    throttle_classes = [TokenBucketThrottle]
+    throttle_scope = "likes"
 
     def post(self, request, pk):
-        project = get_object_or_404(Project, pk=pk)
-        ip_address = self.get_client_ip(request)
+        project = get_object_or_404(Project.objects.only("pk"), uuid=pk)
+        ip_address = get_client_ip(request)
 
-        like, created = ProjectLike.objects.get_or_create(
-            project=project, ip_address=ip_address
-        )
-        if not created:
-            like.delete()
+        # Niyat buferga yoziladi, bazaga bir necha bosish birga flush qilinadi
+        if not toggle_like("projects.ProjectLike", "project", project.pk, ip_address):
             return Response({"detail": "Like removed"}, status=status.HTTP_200_OK)
         return Response({"detail": "Liked"}, status=status.HTTP_200_OK)
 
-    @staticmethod
-    def get_client_ip(request):
-        x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
-        if x_forwarded_for:
-            return x_forwarded_for.split(",")[0]
-        return request.META.get("REMOTE_ADDR")
+
+class ProjectTagListView(generics.ListAPIView):
+    """Tag'lar va ularning saqlangan `project_count` i — bitta arzon so'rov."""
+
+    queryset = Tag.objects.filter(project_count__gt=0).order_by("-project_count", "name")
+    serializer_class = TagUsageSerializer
+    permission_classes = [permissions.AllowAny]
+
+
+class TrendingProjectListView(generics.ListAPIView):
+    """
+    GET ?limit=10 — `trending_score` bo'yicha eng faol projects.
+    Ball `refresh_trending` komandasi tomonidan davriy yangilanadi, bu yerda
+    faqat index bo'yicha `LIMIT n` o'qiladi.
+    """
+
+    serializer_class = ProjectSummarySerializer
+    permission_classes = [permissions.AllowAny]
+    pagination_class = None
+
+    def get_queryset(self):
+        return (
+            Project.objects.summaries()
+            .filter(trending_score__gt=0)
+            .order_by("-trending_score", "-id")[: trending_limit(self.request)]
+        )
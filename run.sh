@@ -19,8 +19,19 @@ User = get_user_model(); \
 User.objects.filter(is_superuser=True).exists() or User.objects.create_superuser('admin@admin.com', 'admin')"
 
 # 4. Start backend server
+# SERVER_MODE=asgi — uvicorn worker'lar (config.asgi): bosh sahifa async view
+# bilan, connection'lar psycopg pool'idan (settings). Default — sync
+# worker'lar (config.wsgi) va persistent connection'lar (CONN_MAX_AGE).
 if [ "$ENVIRONMENT" = "local" ]; then
     python manage.py runserver 0.0.0.0:8080
+elif [ "$SERVER_MODE" = "asgi" ]; then
+    exec gunicorn config.asgi:application \
+        --worker-class uvicorn_worker.UvicornWorker \
+        --bind 0.0.0.0:8080 \
+        --workers 3 \
+        --log-level info \
+        --access-logfile /app/logs/gunicorn_access.log \
+        --error-logfile /app/logs/gunicorn_error.log
 else
     exec gunicorn config.wsgi:application \
         --bind 0.0.0.0:8080 \
@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from .models import Tag
+
+
+@admin.register(Tag)
+class TagAdmin(admin.ModelAdmin):
+    list_display = ("name", "post_count", "project_count")
+    search_fields = ("name",)
+    ordering = ("name",)
@@ -0,0 +1,26 @@
+from django.db import models
+
+from core.counters import count_subquery
+
+
+class TagQuerySet(models.QuerySet):
+    def recount_usage(self):
+        """`post_count` / `project_count` ni ikkala through jadvalidan qayta hisoblaydi."""
+        return self.update(
+            post_count=count_subquery(self.model.posts.through, "tag"),
+            project_count=count_subquery(self.model.projects.through, "tag"),
+        )
+
+
+class Tag(models.Model):
+    """Post va project'lar uchun umumiy tag — bitta nom, bitta qator."""
+
+    name = models.CharField(max_length=50, unique=True)
+    # Nechta post/projectda ishlatilgani — core.tags signal'lari yangilab boradi
+    post_count = models.PositiveIntegerField(default=0, editable=False)
+    project_count = models.PositiveIntegerField(default=0, editable=False)
+
+    objects = TagQuerySet.as_manager()
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,9 @@
+from rest_framework import serializers
+
+from .models import Tag
+
+
+class TagSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Tag
+        fields = ["id", "name"]
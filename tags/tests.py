@@ -0,0 +1,66 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from posts.models import Post
+from projects.tests import create_project
+from .models import Tag
+
+
+class TagCounterTests(TestCase):
+    def setUp(self):
+        self.python = Tag.objects.create(name="python")
+        self.django = Tag.objects.create(name="django")
+        self.post = Post.objects.create(title="Post", content="Body")
+        self.project = create_project()
+
+    def counts(self, tag):
+        tag.refresh_from_db()
+        return tag.post_count, tag.project_count
+
+    def test_add_remove_and_clear_recount(self):
+        self.post.tags.add(self.python, self.django)
+        self.project.tags.add(self.python)
+        self.assertEqual(self.counts(self.python), (1, 1))
+        self.assertEqual(self.counts(self.django), (1, 0))
+
+        self.post.tags.remove(self.django)
+        self.assertEqual(self.counts(self.django), (0, 0))
+        self.project.tags.clear()
+        self.assertEqual(self.counts(self.python), (1, 0))
+
+    def test_reverse_side_recounts(self):
+        self.python.posts.add(self.post)
+        self.assertEqual(self.counts(self.python), (1, 0))
+        self.python.posts.clear()
+        self.assertEqual(self.counts(self.python), (0, 0))
+
+    def test_delete_recounts(self):
+        self.post.tags.add(self.python)
+        self.project.tags.add(self.python)
+        self.post.delete()
+        self.project.delete()
+        self.assertEqual(self.counts(self.python), (0, 0))
+
+
+class TagDetailTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.tag = Tag.objects.create(name="django")
+        cls.post = Post.objects.create(title="Tagged", content="Body")
+        cls.post.tags.add(cls.tag)
+        Post.objects.create(title="Untagged", content="Body")
+        cls.project = create_project(title="Tagged project")
+        cls.project.tags.add(cls.tag)
+
+    def test_detail_lists_both_kinds(self):
+        url = reverse("tags:tag-detail", args=["django"])
+        data = self.client.get(url).json()
+        self.assertEqual((data["post_count"], data["project_count"]), (1, 1))
+        self.assertEqual([post["uuid"] for post in data["posts"]], [str(self.post.uuid)])
+        self.assertEqual(
+            [project["uuid"] for project in data["projects"]], [str(self.project.uuid)]
+        )
+
+    def test_unknown_tag_is_404(self):
+        url = reverse("tags:tag-detail", args=["missing"])
+        self.assertEqual(self.client.get(url).status_code, 404)
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from .views import TagDetailView
+
+app_name = "tags"
+
+urlpatterns = [
+    path("<str:name>/", TagDetailView.as_view(), name="tag-detail"),
+]
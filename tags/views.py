@@ -0,0 +1,47 @@
+from django.shortcuts import get_object_or_404
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.filters import tagged_with
+from posts.models import Post
+from posts.serializers import PostSummarySerializer
+from projects.models import Project
+from projects.serializers import ProjectSummarySerializer
+from .models import Tag
+
+# Har bir tur uchun nechta eng yangi obyekt; to'liq ro'yxat —
+# `/api/posts/?tag=<name>` / `/api/projects/?tag=<name>` (sahifalangan)
+CONTENT_LIMIT = 12
+
+
+class TagDetailView(APIView):
+    """
+    GET /api/tags/<name>/ — shu tag'li post va project'lar birga. Har bir tur
+    uchun bitta so'rov: through jadvaliga `EXISTS` semi-join
+    (`(tag_id, obj_id)` index'i), tartib `(created_at, id)` index'i bo'yicha.
+    """
+
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request, name):
+        tag = get_object_or_404(Tag, name=name)
+        context = {"request": request}
+        posts = tagged_with(Post.objects.summaries(), [tag.pk]).order_by(
+            "-created_at", "-id"
+        )[:CONTENT_LIMIT]
+        projects = tagged_with(Project.objects.summaries(), [tag.pk]).order_by(
+            "-created_at", "-id"
+        )[:CONTENT_LIMIT]
+        return Response(
+            {
+                "id": tag.pk,
+                "name": tag.name,
+                "post_count": tag.post_count,
+                "project_count": tag.project_count,
+                "posts": PostSummarySerializer(posts, many=True, context=context).data,
+                "projects": ProjectSummarySerializer(
+                    projects, many=True, context=context
+                ).data,
+            }
+        )